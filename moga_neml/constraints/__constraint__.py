@@ -86,6 +86,19 @@ class __Constraint__:
         """
         raise NotImplementedError
 
+    def get_violation(self, prd_data_list:list) -> float:
+        """
+        Grades how far a constraint has been violated, so that the optimiser can prefer
+        solutions that are closer to satisfying the constraint (can be overridden);
+        a violation of zero means that the constraint has been passed
+
+        Parameters:
+        * `prd_data_list`: List of predicted data dictionaries
+
+        Returns the violation
+        """
+        return 0.0 if self.check(prd_data_list) else 1.0
+
 # Creates and return a constraint
 def create_constraint(constraint_name:str, x_label:str, y_label:str,
                       model:__Model__, **kwargs) -> __Constraint__:
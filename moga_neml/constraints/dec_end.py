@@ -8,6 +8,9 @@
 # Libraries
 from moga_neml.constraints.__constraint__ import __Constraint__
 
+# Constants
+MIN_SCALE = 1e-12
+
 # The decreasing end constraint class
 class Constraint(__Constraint__):
     
@@ -20,6 +23,18 @@ class Constraint(__Constraint__):
         
         Returns the results of the check
         """
+        return self.get_violation(prd_data_list) == 0
+
+    def get_violation(self, prd_data_list:list) -> float:
+        """
+        Grades how far the end points increase as stress increases, relative
+        to the largest end point
+
+        Parameters:
+        * `prd_data_list`: List of predicted data dictionaries
+
+        Returns the violation
+        """
 
         # Initialisation
         curve_list = self.get_curve_list()
@@ -33,16 +48,13 @@ class Constraint(__Constraint__):
 
         # Sort the map in ascending order
         sorted_items = sorted(prd_dict.items(), key=lambda x: x[0])
-        prd_dict = dict(sorted_items)
-
-        # Enforce that end points decrease as stress increases
-        check_passed = True
-        min_value = 1.0e50
-        for key in prd_dict.keys():
-            if prd_dict[key] > min_value:
-                check_passed = False
-            min_value = prd_dict[key]
+        end_list = [item[1] for item in sorted_items]
+
+        # Add up how much the end points increase as stress increases
+        violation = 0
+        for i in range(1, len(end_list)):
+            violation += max(0, end_list[i] - end_list[i-1])
         
-        # Return outcome
-        # print("dec", prd_dict, check_passed)
-        return check_passed
+        # Return the relative violation
+        scale = max([abs(end) for end in end_list] + [MIN_SCALE])
+        return violation / scale
@@ -6,7 +6,10 @@
 """
 
 # Libraries
+import math, os, traceback, numpy as np
 from neml import drivers
+from neml.nemlerror import NEMLError, LinalgError, NonlinearSolverError
+from neml.nlsolvers import MaximumIterations, MaximumSubdivisions
 from moga_neml.helper.experiment import NEML_FIELD_CONVERSION
 from moga_neml.helper.general import BlockPrint
 from moga_neml.helper.data import find_tensile_strain_to_failure, remove_data_after
@@ -24,36 +27,113 @@ DAMAGE_TOL   = 0.95
 STRESS_RATE  = 0.0001
 CYCLIC_RATIO = -1
 
+# Streaming Driver Constants
+STREAM_INTERVAL = 50
+CREEP_MAX_ITER  = 25
+CREEP_MAX_STRAIN = 1.0
+
+# Exceptions raised by NEML when the solver does not converge
+SOLVER_ERRORS = (NEMLError, LinalgError, NonlinearSolverError, MaximumIterations, MaximumSubdivisions)
+
 # Driver class
 class Driver:
     
-    def __init__(self, curve:Curve, calibrated_model) -> None:
+    def __init__(self, curve:Curve, calibrated_model, horizon_factor:float=None, fidelity:dict=None) -> None:
         """
         Initialises the driver class
         
         Parameters:
-        * `curve`:      The curve the driver is being used on
-        * `model`:      The calibrated model to be run
+        * `curve`:          The curve the driver is being used on
+        * `model`:          The calibrated model to be run
+        * `horizon_factor`: The factor of the end of the experimental data to stop
+                            the simulation at; simulates to the full extent if undefined
+        * `fidelity`:       A dictionary of the numerical settings (i.e., 'num_steps',
+                            'rel_tol', and 'abs_tol') that replace the full fidelity settings
         """
         self.curve     = curve
         self.exp_data  = curve.get_exp_data()
         self.type      = self.exp_data["type"]
         self.conv_dict = NEML_FIELD_CONVERSION[self.type]
         self.calibrated_model = calibrated_model
+        self.horizon_factor   = horizon_factor
+        self.abandoned        = False
+        
+        # Define the numerical settings
+        fidelity = {} if fidelity == None else fidelity
+        self.num_steps = fidelity.get("num_steps", NUM_STEPS)
+        self.rel_tol   = fidelity.get("rel_tol", REL_TOL)
+        self.abs_tol   = fidelity.get("abs_tol", ABS_TOL)
     
-    def run(self) -> dict:
+    def get_settings(self) -> dict:
+        """
+        Returns the settings that affect the results of the driver
+        """
+        custom_driver, custom_driver_kwargs = self.curve.get_custom_driver()
+        if custom_driver != None and not isinstance(custom_driver, str):
+            custom_driver = f"{custom_driver.__module__}.{custom_driver.__name__}"
+        return {
+            "type":          self.type,
+            "custom_driver": custom_driver,
+            "custom_kwargs": None if custom_driver_kwargs == None else sorted(custom_driver_kwargs.items()),
+            "time_hold":     TIME_HOLD,
+            "num_steps":     self.num_steps,
+            "rel_tol":       self.rel_tol,
+            "abs_tol":       self.abs_tol,
+            "max_strain":    MAX_STRAIN,
+            "num_steps_up":  NUM_STEPS_UP,
+            "damage_tol":    DAMAGE_TOL,
+            "stress_rate":   STRESS_RATE,
+            "cyclic_ratio":  CYCLIC_RATIO,
+            "horizon":       self.horizon_factor,
+        }
+
+    def get_horizon(self, field:str, max_value:float) -> tuple:
+        """
+        Gets the extent and number of increments of the simulation, such that the simulation
+        stops once it passes the end of the experimental data (scaled by the horizon factor)
+        and the extents read by the errors of the curve; the increments are the same size
+        as those of the full simulation, so the simulated points are unchanged, two more
+        increments are simulated since the creep driver drops its last points, and the
+        full simulation is run if any error reads the whole predicted data
+
+        Parameters:
+        * `field`:     The field of the experimental data that the simulation is driven along
+        * `max_value`: The extent of the full simulation
+
+        Returns the extent of the simulation and the number of increments
+        """
+        if self.horizon_factor == None:
+            return max_value, self.num_steps
+        increment = max_value / self.num_steps
+        horizon = self.exp_data[field][-1] * self.horizon_factor
+        for error in self.curve.get_error_list():
+            extent = error.get_extent(field)
+            if extent == None:
+                return max_value, self.num_steps
+            horizon = max(horizon, extent)
+        num_steps = min(math.ceil(horizon / increment) + 2, self.num_steps)
+        return num_steps * increment, num_steps
+
+    def run(self, monitor=None) -> dict:
         """
         Runs the driver based on the experimental curve type;
-        returns the results
+        returns the results, or none if the simulation failed or was abandoned
+
+        Parameters:
+        * `monitor`: A function that is periodically given the partial results of the
+                     simulation and returns true if the simulation should be abandoned;
+                     only the creep and tensile simulations are streamed to the monitor
         """
 
-        # Get the results
-        results = self.run_selected()
-        # try:
-        #     with BlockPrint():
-        #         results = self.run_selected()
-        # except:
-        #     return
+        # Get the results; the simulation fails if the solver does not converge
+        try:
+            results = self.run_selected(monitor)
+        except Exception as error:
+            if not is_solver_error(error):
+                raise
+            return
+        if results == None:
+            return
         
         # Convert results and return
         converted_results = {}
@@ -66,11 +146,20 @@ class Driver:
                 end_strain = converted_results["strain"][end_index]
                 converted_results = remove_data_after(converted_results, end_strain, "strain")
         return converted_results
+
+    def is_abandoned(self) -> bool:
+        """
+        Returns whether the last simulation was abandoned by the monitor
+        """
+        return self.abandoned
     
-    def run_selected(self) -> dict:
+    def run_selected(self, monitor=None) -> dict:
         """
         Runs the driver depending on the data type;
         returns the results
+
+        Parameters:
+        * `monitor`: A function that is periodically given the partial results of the simulation
         """
 
         # Runs custom driver if it is defined
@@ -81,11 +170,12 @@ class Driver:
             results = custom_driver(self.calibrated_model, **custom_driver_kwargs)
             return results
 
-        # Runs driver based on data type
+        # Runs driver based on data type (the creep driver does not take tolerances)
         if self.type == "creep":
-            return self.run_creep()
+            is_default_tol = self.rel_tol == REL_TOL and self.abs_tol == ABS_TOL
+            return self.run_creep() if monitor == None and is_default_tol else self.stream_creep(monitor)
         elif self.type == "tensile":
-            return self.run_tensile()
+            return self.run_tensile() if monitor == None else self.stream_tensile(monitor)
         elif self.type == "cyclic":
             return self.run_cyclic()
         raise ValueError(f"The data type '{self.type}' is not supported; use the 'custom_driver' function to define a custom driver")
@@ -95,9 +185,10 @@ class Driver:
         Runs the creep driver;
         returns the results
         """
-        results = drivers.creep(self.calibrated_model, self.exp_data["stress"], STRESS_RATE, TIME_HOLD,
+        time_hold, num_steps = self.get_horizon("time", TIME_HOLD)
+        results = drivers.creep(self.calibrated_model, self.exp_data["stress"], STRESS_RATE, time_hold,
                                 T=self.exp_data["temperature"], verbose=VERBOSE, check_dmg=True,
-                                dtol=DAMAGE_TOL, nsteps_up=NUM_STEPS_UP, nsteps=NUM_STEPS, logspace=False)
+                                dtol=DAMAGE_TOL, nsteps_up=NUM_STEPS_UP, nsteps=num_steps, logspace=False)
         return results
 
     def run_tensile(self) -> dict:
@@ -105,9 +196,10 @@ class Driver:
         Runs the tensile driver;
         returns the results
         """
+        max_strain, num_steps = self.get_horizon("strain", MAX_STRAIN)
         results = drivers.uniaxial_test(self.calibrated_model, erate=self.exp_data["strain_rate"], T=self.exp_data["temperature"],
-                                        emax=MAX_STRAIN, check_dmg=True, dtol=DAMAGE_TOL, nsteps=NUM_STEPS,
-                                        verbose=VERBOSE, rtol=REL_TOL, atol=ABS_TOL)
+                                        emax=max_strain, check_dmg=True, dtol=DAMAGE_TOL, nsteps=num_steps,
+                                        verbose=VERBOSE, rtol=self.rel_tol, atol=self.abs_tol)
         return results
     
     def run_cyclic(self) -> dict:
@@ -118,5 +210,124 @@ class Driver:
         num_cycles = int(self.exp_data["num_cycles"])
         results = drivers.strain_cyclic(self.calibrated_model, T=self.exp_data["temperature"], emax=self.exp_data["max_strain"],
                                         erate=self.exp_data["strain_rate"], verbose=VERBOSE, R=CYCLIC_RATIO,
-                                        ncycles=num_cycles, nsteps=NUM_STEPS)
+                                        ncycles=num_cycles, nsteps=self.num_steps)
         return results
+
+    def stream_creep(self, monitor=None) -> dict:
+        """
+        Runs the creep simulation one step at a time, in the same way as the creep driver,
+        and periodically gives the partial results to a monitor;
+        returns the results, or none if the simulation failed or was abandoned
+
+        Parameters:
+        * `monitor`: A function that is given the partial results and returns true
+                     if the simulation should be abandoned; not checked if undefined
+        """
+
+        # Initialise
+        time_hold, num_steps = self.get_horizon("time", TIME_HOLD)
+        temperature = self.exp_data["temperature"]
+        direction = np.array([1,0,0,0,0,0])
+        driver = drivers.Driver_sd(self.calibrated_model, verbose=VERBOSE, T_init=temperature, rtol=self.rel_tol,
+                                   atol=self.abs_tol, miter=CREEP_MAX_ITER)
+        time, strain, stress = [0], [0], [0]
+
+        # Ramp up to the creep stress
+        stress_increment = float(self.exp_data["stress"]) / NUM_STEPS_UP
+        for _ in range(NUM_STEPS_UP):
+            driver.srate_sinc_step(direction, STRESS_RATE, stress_increment, temperature)
+            time.append(driver.t[-1])
+            strain.append(np.dot(driver.strain_int[-1], direction))
+            stress.append(np.dot(driver.stress_int[-1], direction))
+        ramp_index = len(driver.strain_int)
+
+        # Hold the creep stress, stopping early if the simulation fails or is abandoned
+        time_list = np.linspace(0, time_hold, num=num_steps+1)[1:] + time[-1]
+        for i in range(len(time_list)):
+            try:
+                driver.stress_step(driver.stress_int[-1], time_list[i], temperature)
+            except Exception as error:
+                if not is_solver_error(error):
+                    raise
+                break
+            curr_strain = np.dot(driver.strain_int[-1], direction)
+            if np.any(np.isnan(driver.strain_int[-1])) or np.any(np.abs(driver.strain_int[-1]) > CREEP_MAX_STRAIN) \
+                or curr_strain < strain[-1] or self.calibrated_model.get_damage(driver.stored_int[-1]) > DAMAGE_TOL:
+                break
+            time.append(time_list[i])
+            strain.append(curr_strain)
+            stress.append(np.dot(driver.stress_int[-1], direction))
+            if monitor != None and (i+1) % STREAM_INTERVAL == 0 and len(strain) > ramp_index + 1:
+                partial_data = {"time": list(np.array(time[ramp_index:-1]) - time[ramp_index]),
+                                "strain": list(np.array(strain[ramp_index:-1]) - strain[ramp_index])}
+                if monitor(partial_data):
+                    self.abandoned = True
+                    return
+
+        # Return the results in the same format as the creep driver
+        time, strain = np.array(time), np.array(strain)
+        has_hold = len(strain) > ramp_index + 1
+        return {"rtime":   time[ramp_index:-1] - time[ramp_index] if has_hold else [],
+                "rstrain": strain[ramp_index:-1] - strain[ramp_index] if has_hold else [],
+                "history": np.array(driver.stored_int)}
+
+    def stream_tensile(self, monitor) -> dict:
+        """
+        Runs the tensile simulation one step at a time, in the same way as the tensile
+        driver, and periodically gives the partial results to a monitor;
+        returns the results, or none if the simulation failed or was abandoned
+
+        Parameters:
+        * `monitor`: A function that is given the partial results and returns true
+                     if the simulation should be abandoned
+        """
+
+        # Initialise
+        max_strain, num_steps = self.get_horizon("strain", MAX_STRAIN)
+        temperature = self.exp_data["temperature"]
+        direction = np.array([1,0,0,0,0,0])
+        driver = drivers.Driver_sd(self.calibrated_model, verbose=VERBOSE, T_init=temperature, rtol=self.rel_tol, atol=self.abs_tol)
+        strain, stress = [0.0], [0.0]
+
+        # Strain the specimen, stopping early if the simulation fails or is abandoned
+        strain_increment = max_strain / num_steps
+        for i in range(num_steps):
+            try:
+                if i == 0:
+                    einc, ainc = driver.erate_einc_step(direction, self.exp_data["strain_rate"], strain_increment, temperature)
+                else:
+                    einc, ainc = driver.erate_einc_step(direction, self.exp_data["strain_rate"], strain_increment, temperature,
+                                                        einc_guess=einc, ainc_guess=ainc)
+            except Exception as error:
+                if not is_solver_error(error):
+                    raise
+                break
+            if self.calibrated_model.get_damage(driver.stored_int[-1]) > DAMAGE_TOL:
+                return # fails like the damage check of the tensile driver
+            strain.append(np.dot(driver.strain_int[-1], direction))
+            stress.append(np.dot(driver.stress_int[-1], direction))
+            if (i+1) % STREAM_INTERVAL == 0 and monitor({"strain": list(strain), "stress": list(stress)}):
+                self.abandoned = True
+                return
+        
+        # Return the results in the same format as the tensile driver
+        return {"strain": np.array(strain), "stress": np.array(stress), "history": driver.stored_int[-1]}
+
+def is_solver_error(error:Exception) -> bool:
+    """
+    Checks whether an exception was raised because a NEML simulation failed; besides the
+    solver exceptions, the NEML drivers raise generic exceptions when the simulation fails
+    (e.g., when the damage check is exceeded, or an index error when the simulation fails
+    on its first step), but not for invalid arguments
+
+    Parameters:
+    * `error`: The exception
+
+    Returns whether the exception was raised by a failed simulation
+    """
+    if isinstance(error, SOLVER_ERRORS):
+        return True
+    if isinstance(error, (ValueError, TypeError)) or error.__traceback__ == None:
+        return False
+    file_path = traceback.extract_tb(error.__traceback__)[-1].filename
+    return os.path.abspath(file_path) == os.path.abspath(drivers.__file__)
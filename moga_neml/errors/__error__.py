@@ -151,6 +151,43 @@ class __Error__:
         """
         raise NotImplementedError
 
+    def evaluate(self, prd_data:dict, calibrated_model) -> float:
+        """
+        Calculates the error of a prediction, given the calibrated model that made the
+        prediction; errors that need the calibrated model override this function instead
+        of `get_value`
+
+        Parameters:
+        * `prd_data`:         The predicted data
+        * `calibrated_model`: The calibrated model that made the prediction
+
+        Returns the error
+        """
+        return self.get_value(prd_data)
+
+    def get_extent(self, field:str) -> float:
+        """
+        Returns the extent of the predicted data along a field (i.e., the time or strain
+        that the simulation is driven along) that the error reads, so that the simulation
+        can stop once it passes the extent without changing the error; returns none if
+        the error reads the whole predicted data (e.g., its end, or an interpolation of
+        all its points), which is the default
+
+        Parameters:
+        * `field`: The field that the simulation is driven along
+        """
+        return None
+
+    def get_lower_bound(self, prd_data:dict) -> float:
+        """
+        Returns a lower bound on the error given the partial predicted data of a
+        simulation that is still running (optional placeholder)
+
+        Parameters:
+        * `prd_data`: The partial predicted data
+        """
+        return 0
+
 # Creates and return a error
 def create_error(error_name:str, x_label:str, y_label:str, weight:float,
               exp_data:dict, model:__Model__, **kwargs) -> __Error__:
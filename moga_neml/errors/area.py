@@ -11,6 +11,10 @@ from moga_neml.errors.__error__ import __Error__
 from moga_neml.helper.interpolator import Interpolator
 import math, numpy as np
 
+# Constants
+MIN_POINTS   = 4
+BOUND_FACTOR = 0.9 # heuristic safety factor of the approximate lower bound (not guaranteed)
+
 # The Area class
 class Error(__Error__):
     
@@ -40,13 +44,73 @@ class Error(__Error__):
         """
 
         # Get predicted data
-        x_label          = self.get_x_label()
-        y_label          = self.get_y_label()
-        prd_x_list       = np.linspace(prd_data[x_label][0], min(self.exp_x_end, prd_data[x_label][-1]), self.num_points)
-        prd_interpolator = Interpolator(prd_data[x_label], prd_data[y_label], self.num_points)
+        x_label, y_label = self.get_x_label(), self.get_y_label()
+        end_index        = self.get_end_index(prd_data[x_label])
+        prd_x_data       = prd_data[x_label][:end_index+1]
+        prd_y_data       = prd_data[y_label][:end_index+1]
+        prd_x_list       = np.linspace(prd_x_data[0], min(self.exp_x_end, prd_x_data[-1]), self.num_points)
+        prd_interpolator = Interpolator(prd_x_data, prd_y_data, self.num_points)
         prd_y_list       = prd_interpolator.evaluate(prd_x_list)
 
         # Get experimental data and calculate error
         exp_y_list = self.interpolator.evaluate(prd_x_list)
         area = [math.pow(prd_y_list[i] - exp_y_list[i], 2) for i in range(self.num_points) if prd_x_list[i] <= self.exp_x_end]
         return math.sqrt(np.average(area)) / self.avg_abs_y
+
+    def get_end_index(self, prd_x_list:list) -> int:
+        """
+        Gets the index of the first predicted point at or past the end of the experimental
+        data, so that the prediction is only interpolated up to the end of the experimental
+        data and the error does not depend on the prediction beyond it
+
+        Parameters:
+        * `prd_x_list`: The predicted x values
+
+        Returns the index, or the last index if the prediction does not reach the end
+        """
+        for i in range(MIN_POINTS - 1, len(prd_x_list)):
+            if prd_x_list[i] >= self.exp_x_end:
+                return i
+        return len(prd_x_list) - 1
+
+    def get_extent(self, field:str) -> float:
+        """
+        Returns the end of the experimental data if the field is the x label, since the
+        prediction is only interpolated up to there; returns none otherwise
+
+        Parameters:
+        * `field`: The field that the simulation is driven along
+        """
+        return self.exp_x_end if field == self.get_x_label() else None
+
+    def get_lower_bound(self, prd_data:dict) -> float:
+        """
+        Estimates an approximate lower bound on the NRMSE from a partial prediction,
+        assuming the prediction reaches the end of the experimental data; the points
+        that have not been simulated yet are taken to have no error, and the estimate
+        is reduced by a heuristic safety factor; the estimate is not guaranteed to be
+        below the final error, since the error of the full prediction is calculated from
+        a spline through the (thinned) full prediction, which can differ from the spline
+        through the partial prediction
+
+        Parameters:
+        * `prd_data`: The partial predicted data
+
+        Returns the approximate lower bound
+        """
+
+        # Check that the partial prediction can be interpolated
+        x_label    = self.get_x_label()
+        y_label    = self.get_y_label()
+        prd_x_list = prd_data[x_label]
+        if len(set(prd_x_list)) < MIN_POINTS:
+            return 0
+
+        # Only calculate the error for the points that have been simulated
+        full_x_list      = np.linspace(prd_x_list[0], self.exp_x_end, self.num_points)
+        partial_x_list   = [x for x in full_x_list if x <= prd_x_list[-1]]
+        prd_interpolator = Interpolator(prd_x_list, prd_data[y_label], self.num_points)
+        prd_y_list       = prd_interpolator.evaluate(partial_x_list)
+        exp_y_list       = self.interpolator.evaluate(partial_x_list)
+        area = [math.pow(prd_y_list[i] - exp_y_list[i], 2) for i in range(len(partial_x_list))]
+        return BOUND_FACTOR * math.sqrt(sum(area) / self.num_points) / self.avg_abs_y
@@ -11,21 +11,26 @@ from moga_neml.errors.__error__ import __Error__
 # The Error class
 class Error(__Error__):
     
-    def initialise(self):
+    def get_value(self, prd_data:dict) -> float:
         """
-        Runs at the start, once
+        Not supported, since the damage can only be calculated with the calibrated model
+        that made the prediction; use `evaluate` instead
+
+        Parameters:
+        * `prd_data`: The predicted data
         """
-        self.model = self.get_model()
+        raise NotImplementedError("The 'damage' error needs the calibrated model that made the prediction; use 'evaluate(prd_data, calibrated_model)' instead")
 
-    def get_value(self, prd_data:dict) -> float:
+    def evaluate(self, prd_data:dict, calibrated_model) -> float:
         """
         Computing the NRMSE
 
         Parameters:
-        * `prd_data`: The predicted data
+        * `prd_data`:         The predicted data
+        * `calibrated_model`: The calibrated model that made the prediction
 
         Returns the error
         """
         damage_history = prd_data["history"][-1]
-        damage = self.model.get_last_calibrated_model().get_damage(damage_history)
+        damage = calibrated_model.get_damage(damage_history)
         return abs(1 - damage)
@@ -27,3 +27,13 @@ class Error(__Error__):
         Returns 0, always
         """
         return 0
+
+    def get_extent(self, field:str) -> float:
+        """
+        Returns the extent of the predicted data that the error reads, which
+        is none of it
+
+        Parameters:
+        * `field`: The field that the simulation is driven along
+        """
+        return 0
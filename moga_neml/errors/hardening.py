@@ -39,6 +39,16 @@ class Error(__Error__):
         prd_hardening = self.get_hardening(prd_data["strain"], prd_data["stress"])
         return abs((self.exp_hardening - prd_hardening) / self.exp_hardening)
 
+    def get_extent(self, field:str) -> float:
+        """
+        Returns the extent of the predicted data that the error reads, which is up to
+        the second strain value; returns none if the simulation is not driven by strain
+
+        Parameters:
+        * `field`: The field that the simulation is driven along
+        """
+        return self.strain_1 if field == "strain" else None
+
     def get_hardening(self, strain_list:list, stress_list:list):
         """
         Calculates the elastic modulus
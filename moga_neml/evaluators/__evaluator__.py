@@ -0,0 +1,175 @@
+"""
+ Title:         Evaluator Template
+ Description:   Contains the basic structure for an evaluator class
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import importlib, os, pathlib, sys
+from moga_neml.optimise.controller import Controller
+
+# The Evaluator Template Class
+class __Evaluator__:
+
+    def __init__(self, name:str, controller:Controller):
+        """
+        Class for defining how a population of parameters is evaluated
+
+        Parameters:
+        * `name`:       The name of the evaluator
+        * `controller`: The controller used to calculate the objectives
+        """
+        self.name       = name
+        self.controller = controller
+        self.submitted_list = []
+
+    def get_name(self) -> str:
+        """
+        Returns the name of the evaluator
+        """
+        return self.name
+
+    def get_controller(self) -> Controller:
+        """
+        Returns the controller
+        """
+        return self.controller
+
+    def initialise(self) -> None:
+        """
+        Runs at the start, once (optional placeholder)
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Runs at the end, once, to release any resources (optional placeholder)
+        """
+        pass
+
+    def terminate(self) -> None:
+        """
+        Runs instead of `close` if the optimisation fails or is interrupted, to release
+        any resources without waiting for the running evaluations; closes by default
+        """
+        self.close()
+
+    def __enter__(self):
+        """
+        Returns the evaluator when entering a `with` block
+        """
+        return self
+
+    def __exit__(self, error_type, error, error_traceback) -> None:
+        """
+        Closes the evaluator when leaving a `with` block, or terminates it if the block failed
+        """
+        if error_type == None:
+            self.close()
+        else:
+            self.terminate()
+
+    def get_num_slots(self) -> int:
+        """
+        Returns the number of evaluations that can run at the same time
+        """
+        return 1
+
+    def submit(self, params:tuple) -> None:
+        """
+        Submits a parameter set to be evaluated asynchronously; by default, the
+        parameter set is evaluated when its result is collected
+
+        Parameters:
+        * `params`: The parameter set
+        """
+        self.submitted_list.append(params)
+
+    def collect(self) -> tuple:
+        """
+        Waits for a submitted parameter set to finish evaluating
+
+        Returns a tuple containing the parameter set and its objective dictionary
+        """
+        params = self.submitted_list.pop(0)
+        return params, self.evaluate([params])[0]
+
+    def evaluate_cached(self, params_list:list, evaluate_function) -> list:
+        """
+        Looks up the cache of the controller and only evaluates the parameter sets
+        that have not been evaluated before; for evaluators that run the
+        evaluations outside of the controller
+
+        Parameters:
+        * `params_list`:       The list of parameter sets
+        * `evaluate_function`: The function that evaluates a list of parameter sets
+
+        Returns a list of objective dictionaries in the same order as the parameter sets
+        """
+
+        # Evaluate all parameter sets if there is no cache
+        cache = self.controller.get_cache()
+        if cache == None:
+            return evaluate_function(params_list)
+
+        # Get the cached evaluations
+        error_value_dict_list = []
+        for params in params_list:
+            entry = cache.get(params)
+            error_value_dict_list.append(None if entry == None else dict(entry["objectives"]))
+
+        # Evaluate the remaining parameter sets and add them to the cache
+        uncached_index_list = [i for i in range(len(params_list)) if error_value_dict_list[i] == None]
+        uncached_params_list = [params_list[i] for i in uncached_index_list]
+        if uncached_params_list != []:
+            for i, error_value_dict in zip(uncached_index_list, evaluate_function(uncached_params_list)):
+                cache.add(params_list[i], error_value_dict)
+                error_value_dict_list[i] = error_value_dict
+        return error_value_dict_list
+
+    def evaluate(self, params_list:list) -> list:
+        """
+        Calculates the objectives for a list of parameter sets (must be overridden)
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns a list of objective dictionaries in the same order as the parameter sets
+        """
+        raise NotImplementedError
+
+# Creates and return an evaluator
+def create_evaluator(evaluator_name:str, controller:Controller, **kwargs) -> __Evaluator__:
+    """
+    Gets an evaluator
+
+    Parameters:
+    * `evaluator_name`: The name of the evaluator
+    * `controller`:     The controller used to calculate the objectives
+
+    Returns the evaluator object
+    """
+
+    # Get available evaluators in current folder
+    evaluators_dir = pathlib.Path(__file__).parent.resolve()
+    files = os.listdir(evaluators_dir)
+    files = [file.replace(".py", "") for file in files]
+    files = [file for file in files if not file in ["__evaluator__", "__pycache__"]]
+    
+    # Raise error if evaluator name not in available evaluators
+    if not evaluator_name in files:
+        raise NotImplementedError(f"The evaluator '{evaluator_name}' has not been implemented")
+
+    # Prepare dynamic import
+    module_path = f"{evaluators_dir}/{evaluator_name}.py"
+    spec = importlib.util.spec_from_file_location("evaluator_file", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    
+    # Import, initialise, and return evaluator
+    from evaluator_file import Evaluator
+    evaluator = Evaluator(evaluator_name, controller)
+    evaluator.initialise(**kwargs)
+    return evaluator
@@ -0,0 +1,180 @@
+"""
+ Title:         The broker evaluator
+ Description:   Evaluates the parameter sets on remote workers by sending them through a transport;
+                workers can join or leave during the optimisation
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import threading, time
+from moga_neml.evaluators.__evaluator__ import __Evaluator__
+from moga_neml.transports.__transport__ import create_transport
+from moga_neml.helper.parallel import serve_transport
+
+# Constants
+POLL_TIME = 0.5
+
+# The Broker Evaluator class
+class Evaluator(__Evaluator__):
+
+    def initialise(self, transport:str="manager", lease:float=600.0, local_workers:int=0, slots:int=None, **kwargs):
+        """
+        Runs at the start, once
+
+        Parameters:
+        * `transport`:     The name of the transport used to reach the workers
+        * `lease`:         The number of seconds a worker has to return a result before
+                           the task is sent again (e.g., because the worker has left)
+        * `local_workers`: The number of worker threads to run in the current process;
+                           each thread evaluates with its own copy of the controller
+        * `slots`:         The number of evaluations to send out at the same time when
+                           evaluating asynchronously; uses the number of local workers
+                           (or one) if undefined
+        * `kwargs`:        Any additional keyword arguments to pass to the transport
+        """
+        if transport == "manager":
+            kwargs["serve"] = True
+        self.transport    = create_transport(transport, **kwargs)
+        self.lease        = lease
+        self.task_id      = 0
+        self.num_slots    = max(local_workers, 1) if slots == None else slots
+        self.pending_dict = {}
+        self.ready_list   = []
+        
+        # Start the local workers, if any
+        self.thread_list = []
+        for _ in range(local_workers):
+            thread = threading.Thread(target=serve_transport, args=(self.controller.copy_for_worker(), self.transport), daemon=True)
+            thread.start()
+            self.thread_list.append(thread)
+
+    def evaluate(self, params_list:list) -> list:
+        """
+        Calculates the objectives for a list of parameter sets
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns a list of objective dictionaries in the same order as the parameter sets
+        """
+        return self.evaluate_cached(params_list, self.evaluate_remotely)
+
+    def evaluate_remotely(self, params_list:list) -> list:
+        """
+        Sends the parameter sets to the workers and collects their objectives
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns a list of objective dictionaries in the same order as the parameter sets
+        """
+        task_id_list = [self.send_task(params) for params in params_list]
+        error_value_dict_dict = {}
+        while len(error_value_dict_dict) < len(task_id_list):
+            result = self.receive_result()
+            if result != None and result[0] in task_id_list:
+                error_value_dict_dict[result[0]] = result[2]
+        return [error_value_dict_dict[task_id] for task_id in task_id_list]
+
+    def send_task(self, params:tuple) -> int:
+        """
+        Sends a parameter set to the workers
+
+        Parameters:
+        * `params`: The parameter set
+
+        Returns the identifier of the task
+        """
+        self.task_id += 1
+        params = tuple([float(param) for param in params])
+        self.transport.put_task(self.get_task(self.task_id, params))
+        self.pending_dict[self.task_id] = {"params": params, "time": time.time()}
+        return self.task_id
+
+    def get_task(self, task_id:int, params:tuple) -> dict:
+        """
+        Gets the task sent to the workers
+
+        Parameters:
+        * `task_id`: The identifier of the task
+        * `params`:  The parameter set
+
+        Returns the task as a dictionary
+        """
+        threshold = self.controller.get_threshold()
+        return {"id": task_id, "params": params, "threshold": None if threshold == None else float(threshold),
+                "fidelity_list": self.controller.get_fidelity_list()}
+
+    def receive_result(self) -> tuple:
+        """
+        Waits for a result from the workers, ignoring duplicated or outdated results,
+        and sends out the tasks again if their lease has expired
+
+        Returns a tuple containing the identifier of the task, the parameter set, and
+        the objective dictionary; returns none if no result was received
+        """
+
+        # Get the result, if any
+        received = None
+        result = self.transport.get_result(POLL_TIME)
+        if result != None and result["id"] in self.pending_dict.keys():
+            params = self.pending_dict.pop(result["id"])["params"]
+            info_list = self.controller.get_objective_info_list() + self.controller.get_violation_info_list()
+            error_value_dict = {key: result["objectives"][key] for key in info_list if key in result["objectives"]}
+            self.controller.add_counter_dict(result.get("counters", {}))
+            received = (result["id"], params, error_value_dict)
+        
+        # Send out the tasks again if their lease has expired
+        current_time = time.time()
+        for task_id, pending in self.pending_dict.items():
+            if current_time - pending["time"] > self.lease:
+                self.transport.put_task(self.get_task(task_id, pending["params"]))
+                pending["time"] = current_time
+        return received
+
+    def get_num_slots(self) -> int:
+        """
+        Returns the number of evaluations that can run at the same time
+        """
+        return self.num_slots
+
+    def submit(self, params:tuple) -> None:
+        """
+        Submits a parameter set to be evaluated by the workers
+
+        Parameters:
+        * `params`: The parameter set
+        """
+        cache = self.controller.get_cache()
+        entry = None if cache == None else cache.get(params)
+        if entry != None:
+            self.ready_list.append((params, dict(entry["objectives"])))
+        else:
+            self.send_task(params)
+
+    def collect(self) -> tuple:
+        """
+        Waits for a submitted parameter set to finish evaluating, in the order that
+        the evaluations finish
+
+        Returns a tuple containing the parameter set and its objective dictionary
+        """
+        if self.ready_list != []:
+            return self.ready_list.pop(0)
+        result = None
+        while result == None:
+            result = self.receive_result()
+        _, params, error_value_dict = result
+        cache = self.controller.get_cache()
+        if cache != None:
+            cache.add(params, error_value_dict)
+        return params, error_value_dict
+
+    def close(self) -> None:
+        """
+        Tells the workers to leave and stops the transport
+        """
+        self.transport.close()
+        for thread in self.thread_list:
+            thread.join()
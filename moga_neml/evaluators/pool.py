@@ -0,0 +1,108 @@
+"""
+ Title:         The pool evaluator
+ Description:   Evaluates the parameter sets on a pool of local worker processes
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import queue
+from moga_neml.evaluators.__evaluator__ import __Evaluator__
+from moga_neml.helper.parallel import create_pool, evaluate_params
+
+# The Pool Evaluator class
+class Evaluator(__Evaluator__):
+
+    def initialise(self, num_workers:int=2):
+        """
+        Runs at the start, once
+
+        Parameters:
+        * `num_workers`: The number of worker processes
+        """
+        if num_workers < 1:
+            raise ValueError("The pool evaluator requires at least one worker!")
+        self.num_workers  = num_workers
+        self.pool         = create_pool(self.controller, num_workers)
+        self.result_queue = queue.Queue()
+
+    def evaluate(self, params_list:list) -> list:
+        """
+        Calculates the objectives for a list of parameter sets
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns a list of objective dictionaries in the same order as the parameter sets
+        """
+        return self.evaluate_cached(params_list, self.evaluate_on_pool)
+
+    def evaluate_on_pool(self, params_list:list) -> list:
+        """
+        Calculates the objectives for a list of parameter sets on the worker processes,
+        and adds the counters of the workers to the controller
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns a list of objective dictionaries in the same order as the parameter sets
+        """
+        threshold = self.controller.get_threshold()
+        params_args_list = [(params, threshold) for params in params_list]
+        result_list = self.pool.map(evaluate_params, params_args_list, chunksize=1)
+        for _, counter_dict in result_list:
+            self.controller.add_counter_dict(counter_dict)
+        return [objective_dict for objective_dict, _ in result_list]
+
+    def get_num_slots(self) -> int:
+        """
+        Returns the number of evaluations that can run at the same time
+        """
+        return self.num_workers
+
+    def submit(self, params:tuple) -> None:
+        """
+        Submits a parameter set to be evaluated on the next free worker process
+
+        Parameters:
+        * `params`: The parameter set
+        """
+        cache = self.controller.get_cache()
+        entry = None if cache == None else cache.get(params)
+        if entry != None:
+            self.result_queue.put((params, True, (dict(entry["objectives"]), {})))
+            return
+        self.pool.apply_async(evaluate_params, ((params, self.controller.get_threshold()),),
+                              callback=lambda result: self.result_queue.put((params, False, result)),
+                              error_callback=lambda error: self.result_queue.put((params, False, error)))
+
+    def collect(self) -> tuple:
+        """
+        Waits for a submitted parameter set to finish evaluating, in the order that
+        the evaluations finish
+
+        Returns a tuple containing the parameter set and its objective dictionary
+        """
+        params, is_cached, result = self.result_queue.get()
+        if isinstance(result, Exception):
+            raise result
+        objective_dict, counter_dict = result
+        self.controller.add_counter_dict(counter_dict)
+        cache = self.controller.get_cache()
+        if cache != None and not is_cached:
+            cache.add(params, objective_dict)
+        return params, objective_dict
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes
+        """
+        self.pool.close()
+        self.pool.join()
+
+    def terminate(self) -> None:
+        """
+        Stops the worker processes without waiting for the running evaluations
+        """
+        self.pool.terminate()
+        self.pool.join()
@@ -0,0 +1,23 @@
+"""
+ Title:         The serial evaluator
+ Description:   Evaluates the parameter sets one after another in the current process
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+from moga_neml.evaluators.__evaluator__ import __Evaluator__
+
+# The Serial Evaluator class
+class Evaluator(__Evaluator__):
+
+    def evaluate(self, params_list:list) -> list:
+        """
+        Calculates the objectives for a list of parameter sets
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns a list of objective dictionaries in the same order as the parameter sets
+        """
+        return [self.controller.calculate_objectives(*params) for params in params_list]
@@ -0,0 +1,188 @@
+"""
+ Title:         Parallel
+ Description:   Helper functions for running evaluations on worker processes
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import multiprocessing, multiprocessing.pool, os, pickle, select, signal, time, warnings
+
+# The controller owned by the current worker process
+worker_controller = None
+
+def create_pool(controller, num_workers:int) -> multiprocessing.pool.Pool:
+    """
+    Creates a pool of worker processes; the workers are forked so that they
+    inherit the defined model, curves, and errors without having to pickle them
+
+    Parameters:
+    * `controller`:  The controller to be used by the workers
+    * `num_workers`: The number of worker processes
+
+    Returns the pool
+    """
+    context = multiprocessing.get_context("fork")
+    return context.Pool(num_workers, initialise_worker, (controller,))
+
+def initialise_worker(controller) -> None:
+    """
+    Stores the controller for the current worker process; the cache is
+    removed because the evaluations are cached by the parent process
+
+    Parameters:
+    * `controller`: The controller to be used by the worker
+    """
+    global worker_controller
+    worker_controller = controller
+    worker_controller.remove_cache()
+
+def evaluate_params(params_args:tuple) -> tuple:
+    """
+    Calculates the objectives of a set of parameters on a worker process
+
+    Parameters:
+    * `params_args`: A tuple containing the parameter values and the threshold
+                     for abandoning simulations
+
+    Returns a tuple containing the dictionary of objectives and the dictionary
+    of counters incremented during the evaluation
+    """
+    params, threshold = params_args
+    worker_controller.set_threshold(threshold)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        objective_dict = worker_controller.calculate_objectives(*params)
+    return objective_dict, worker_controller.pop_counter_dict()
+
+def refine_params(params:tuple) -> tuple:
+    """
+    Runs the local optimiser of the refiner of the worker process
+
+    Parameters:
+    * `params`: The parameter values to start from
+
+    Returns a tuple containing the best parameter values, their objective dictionary,
+    the number of evaluations, and the dictionary of counters incremented during
+    the refinement
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = worker_controller.get_refiner().refine(params)
+    return (*result, worker_controller.pop_counter_dict())
+
+def evaluate_curve(curve_args:tuple) -> tuple:
+    """
+    Simulates a group of curves with the same simulation inputs and calculates
+    their errors on a worker process
+
+    Parameters:
+    * `curve_args`: A tuple containing the indexes of the curves, the parameter values,
+                    the threshold for abandoning simulations, the numerical settings
+                    of the fidelity level, and the list of the indexes and error values
+                    of the curves that have already been simulated
+
+    Returns a tuple containing the shared predicted data, the list of error values of
+    each curve, and the dictionary of counters incremented during the simulation; the
+    predicted data is none if the simulation failed
+    """
+    curve_index_list, params, threshold, fidelity, simulated_index_list = curve_args
+    curve_group = [worker_controller.get_curve_list()[curve_index] for curve_index in curve_index_list]
+    simulated_list = [(worker_controller.get_curve_list()[curve_index], error_value_list)
+                      for curve_index, error_value_list in simulated_index_list]
+    worker_controller.set_threshold(threshold)
+    worker_controller.set_fidelity(fidelity)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        monitor = worker_controller.get_monitor(curve_group[0], simulated_list)
+        prd_data, calibrated_model = worker_controller.predict(curve_group[0], *params, monitor=monitor)
+        if prd_data == None:
+            return None, [[] for _ in curve_group], worker_controller.pop_counter_dict()
+        error_value_lists = [worker_controller.get_error_values(curve, prd_data, calibrated_model) for curve in curve_group]
+        return prd_data, error_value_lists, worker_controller.pop_counter_dict()
+
+def run_isolated(function, timeout:float) -> tuple:
+    """
+    Runs a function in a forked child process and kills the child if the function does
+    not finish in time; the child is created with a fork (rather than with the
+    multiprocessing module) so that it can also be created by the daemonic worker
+    processes of a pool
+
+    Parameters:
+    * `function`: The function to run, which takes no arguments and returns a picklable value
+    * `timeout`:  The number of seconds to wait for the function to finish
+
+    Returns a tuple containing whether the function finished in time and its returned value;
+    the returned value is none if the function did not finish or raised an exception
+    """
+
+    # Run the function on the child process and send back the pickled value
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                content = pickle.dumps(function())
+        except BaseException:
+            content = pickle.dumps(None)
+        with os.fdopen(write_fd, "wb") as file:
+            file.write(content)
+        os._exit(0)
+
+    # Read the pickled value on the parent process until the child finishes or runs out of time
+    os.close(write_fd)
+    chunk_list = []
+    end_time = time.time() + timeout
+    is_finished = False
+    with os.fdopen(read_fd, "rb") as file:
+        while True:
+            remaining_time = end_time - time.time()
+            if remaining_time <= 0 or select.select([file], [], [], remaining_time)[0] == []:
+                break
+            chunk = os.read(file.fileno(), 1 << 16)
+            if chunk == b"":
+                is_finished = True
+                break
+            chunk_list.append(chunk)
+
+    # Kill the child if it did not finish, and return the value
+    if not is_finished:
+        os.kill(pid, signal.SIGKILL)
+    os.waitpid(pid, 0)
+    if not is_finished:
+        return False, None
+    return True, pickle.loads(b"".join(chunk_list))
+
+def serve_transport(controller, transport, poll_time:float=1.0) -> int:
+    """
+    Repeatedly receives parameters from a transport, calculates their
+    objectives, and sends them back, until the transport is closed
+    or the connection to the broker is lost
+
+    Parameters:
+    * `controller`: The controller used to calculate the objectives
+    * `transport`:  The transport connected to the broker
+    * `poll_time`:  The number of seconds to wait for each task
+
+    Returns the number of tasks completed
+    """
+    num_tasks = 0
+    while True:
+        try:
+            if transport.is_closed():
+                return num_tasks
+            task = transport.get_task(poll_time)
+            if task == None:
+                continue
+            controller.set_threshold(task.get("threshold"))
+            controller.set_fidelity_list(task.get("fidelity_list", []))
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                error_value_dict = controller.calculate_objectives(*task["params"])
+            transport.put_result({"id": task["id"], "objectives": error_value_dict,
+                                  "counters": controller.pop_counter_dict()})
+            num_tasks += 1
+        except (EOFError, ConnectionError, BrokenPipeError):
+            return num_tasks
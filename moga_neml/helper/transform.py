@@ -0,0 +1,98 @@
+"""
+ Title:         Transform
+ Description:   For encoding the parameters into the space searched by the optimiser
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import numpy as np
+
+# Constants
+TRANSFORM_LIST = ["linear", "log10"]
+LOG_FLOOR      = 1e-6 # lowest log-space value relative to the upper bound, for zero lower bounds
+
+def get_transform_functions(transform, l_bound:float, u_bound:float) -> tuple:
+    """
+    Gets the functions that map a parameter value into the transformed space and back
+
+    Parameters:
+    * `transform`: The name of the transform (i.e., linear, log10), or a tuple of a
+                   forward and an inverse function that operate on NumPy arrays
+    * `l_bound`:   The lower bound of the parameter
+    * `u_bound`:   The upper bound of the parameter
+
+    Returns a tuple of the forward and inverse functions
+    """
+    if transform == "linear":
+        return lambda value: value, lambda value: value
+    if transform == "log10":
+        if u_bound <= 0:
+            raise ValueError("Parameters with a 'log10' transform must have positive upper bounds!")
+        floor = max(l_bound, u_bound * LOG_FLOOR)
+        return lambda value: np.log10(np.maximum(value, floor)), lambda value: np.power(10.0, value)
+    if isinstance(transform, (tuple, list)) and len(transform) == 2 and all([callable(f) for f in transform]):
+        return tuple(transform)
+    raise ValueError(f"The transform must be one of {TRANSFORM_LIST} or a tuple of a forward and an inverse function!")
+
+def get_transform_name(transform) -> str:
+    """
+    Gets the name of a transform
+
+    Parameters:
+    * `transform`: The name of the transform, or a tuple of a forward and an inverse function
+
+    Returns the name of the transform
+    """
+    if isinstance(transform, str):
+        return transform
+    return "/".join([getattr(function, "__name__", "custom") for function in transform])
+
+# The Encoder class
+class Encoder:
+
+    def __init__(self, l_bound_list:list, u_bound_list:list, transform_list:list):
+        """
+        Class for encoding the parameter values into the unit hypercube searched by the
+        optimiser, through the transform of each parameter, and decoding them back
+
+        Parameters:
+        * `l_bound_list`:   The lower bounds of the parameters
+        * `u_bound_list`:   The upper bounds of the parameters
+        * `transform_list`: The transform of each parameter
+        """
+        self.l_bound_array = np.array(l_bound_list, dtype=float)
+        self.u_bound_array = np.array(u_bound_list, dtype=float)
+        self.function_list = [get_transform_functions(transform, l_bound, u_bound)
+                              for transform, l_bound, u_bound in zip(transform_list, l_bound_list, u_bound_list)]
+        self.l_space_array = np.array([forward(l_bound) for (forward, _), l_bound in zip(self.function_list, l_bound_list)], dtype=float)
+        self.u_space_array = np.array([forward(u_bound) for (forward, _), u_bound in zip(self.function_list, u_bound_list)], dtype=float)
+        self.range_array   = self.u_space_array - self.l_space_array
+        self.range_array[self.range_array == 0] = 1
+
+    def encode(self, params) -> np.ndarray:
+        """
+        Encodes parameter values into the unit hypercube
+
+        Parameters:
+        * `params`: The parameter values, as a list or as a matrix with one row for each solution
+
+        Returns the encoded parameter values in the same shape
+        """
+        value_array = np.array(params, dtype=float)
+        space_array = np.stack([forward(value_array[..., i]) for i, (forward, _) in enumerate(self.function_list)], axis=-1)
+        return np.clip((space_array - self.l_space_array) / self.range_array, 0, 1)
+
+    def decode(self, unit_params) -> np.ndarray:
+        """
+        Decodes parameter values from the unit hypercube
+
+        Parameters:
+        * `unit_params`: The encoded parameter values, as a list or as a matrix with one
+                         row for each solution
+
+        Returns the parameter values in the same shape
+        """
+        space_array = self.l_space_array + np.clip(np.array(unit_params, dtype=float), 0, 1) * self.range_array
+        value_array = np.stack([inverse(space_array[..., i]) for i, (_, inverse) in enumerate(self.function_list)], axis=-1)
+        return np.clip(value_array, self.l_bound_array, self.u_bound_array)
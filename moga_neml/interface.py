@@ -6,16 +6,21 @@
 """
 
 # Libraries
-import re, time
+import pickle, re, time
 from moga_neml.io.reader import read_exp_data, check_exp_data
 from moga_neml.optimise.recorder import Recorder
 from moga_neml.optimise.controller import Controller
 from moga_neml.optimise.problem import Problem
+from moga_neml.optimise.async_moga import AsyncMOGA
+from moga_neml.optimise.islands import Islands
 from moga_neml.optimise.moga import MOGA
+from moga_neml.evaluators.__evaluator__ import create_evaluator
+from moga_neml.transports.__transport__ import create_transport
 from moga_neml.helper.data import remove_data_after
 from moga_neml.helper.derivative import remove_after_sp
 from moga_neml.helper.experiment import get_units
 from moga_neml.helper.general import safe_mkdir
+from moga_neml.helper.parallel import serve_transport
 
 # Interface Class
 class Interface:
@@ -36,6 +41,13 @@ class Interface:
         # Initialise internal variables
         self.__controller__  = Controller()
         self.__recorder__    = None
+        self.__broker_kwargs__ = None
+        self.__cache_kwargs__  = None
+        self.__surrogate_kwargs__ = None
+        self.__island_kwargs__    = None
+        self.__termination_kwargs__ = None
+        self.__sampler_kwargs__     = {}
+        self.__refinement_kwargs__  = None
         self.__print_index__ = 0
         self.__print_subindex__ = 0
         self.__verbose__     = verbose
@@ -186,8 +198,7 @@ class Interface:
         self.__print__(f"Adding '{error_name}' error {label_str}{weight_str}", sub_index=True)
         
         # Add error to curve
-        curve = self.__controller__.get_last_curve()
-        curve.add_error(error_name, x_label, y_label, weight, **kwargs)
+        self.__controller__.add_error(error_name, x_label, y_label, weight, **kwargs)
 
     def group_errors(self, name:bool=True, type:bool=True, labels:bool=True):
         """
@@ -303,8 +314,7 @@ class Interface:
         * `driver_type`: The driver type
         """
         self.__print__(f"Setting a custom '{driver_type}' driver", sub_index=True)
-        curve = self.__controller__.get_last_curve()
-        curve.set_custom_driver(driver_type, kwargs)
+        self.__controller__.set_custom_driver(driver_type, kwargs)
 
     def plot_experimental(self, x_log:bool=False, y_log:bool=False) -> None:
         """
@@ -470,8 +480,238 @@ class Interface:
         self.__recorder__ = Recorder(self.__controller__, interval, self.__output_path__,
                                      plot_opt, plot_loss, save_model)
     
+    def set_cache(self, tolerance:float=1e-6, max_memory:float=1024) -> None:
+        """
+        Caches the evaluations of the optimisation, so that solutions that have
+        already been evaluated (e.g., survivors) are not simulated again
+
+        Parameters:
+        * `tolerance`:  The relative tolerance under which parameter values are considered identical
+        * `max_memory`: The maximum memory of the cache in megabytes; the least recently
+                        used evaluations are removed once the memory is exceeded
+        """
+        self.__print__(f"Caching the evaluations with a tolerance of {tolerance}")
+        self.__cache_kwargs__ = {"tolerance": tolerance, "max_memory": max_memory}
+
+    def set_store(self, file_path:str="simulations.db") -> None:
+        """
+        Stores the simulated curves in a database on disk, so that later runs with the
+        same model, data, and parameters (e.g., with different errors or reduction
+        methods) only have to calculate the errors
+
+        Parameters:
+        * `file_path`: The path to the database file; created if it does not exist
+        """
+        self.__print__(f"Storing the simulations in '{file_path}'")
+        self.__check_model__()
+        self.__controller__.define_store(file_path)
+
+    def set_horizon(self, factor:float=1.5) -> None:
+        """
+        Stops the creep and tensile simulations once they pass the end of the experimental
+        data (i.e., the time to failure or the strain to failure) multiplied by a factor,
+        rather than simulating to the maximum time or strain
+
+        Parameters:
+        * `factor`: The factor to multiply the end of the experimental data by; should be
+                    at least 1.0
+        """
+        self.__print__(f"Limiting the simulations to {factor} times the experimental data")
+        self.__controller__.set_horizon_factor(factor)
+
+    def set_abandonment(self, margin:float=1.0) -> None:
+        """
+        Abandons the creep and tensile simulations of a solution once an approximate
+        lower bound on its reduced objective exceeds that of the worst optimal solution
+        multiplied by a margin; the simulations are run one step at a time so that the
+        partial results can be checked as the simulation runs; simulations are not
+        abandoned unless this function is called, since the approximate bounds can
+        occasionally abandon a solution that would have been optimal
+
+        Parameters:
+        * `margin`: The margin to multiply the reduced objective of the worst optimal
+                    solution by; larger margins abandon fewer simulations
+        """
+        self.__print__(f"Abandoning hopeless simulations with a margin of {margin}")
+        self.__controller__.set_abandon_margin(margin)
+
+    def set_racing(self, fraction:float=0.25, margin:float=1.0) -> None:
+        """
+        Evaluates each solution on a representative subset of the curves first, and only
+        simulates the remaining curves if the objectives estimated from the subset could
+        still make the solution one of the optimal solutions; the discarded solutions are
+        treated as failed solutions
+
+        Parameters:
+        * `fraction`: The fraction of the curves (with distinct simulation inputs) in the subset
+        * `margin`:   The margin to multiply the reduced objective of the worst optimal
+                      solution by; must be at least 1, and larger margins discard fewer solutions
+        """
+        self.__print__(f"Racing the evaluations over {round(100 * fraction)}% of the curves")
+        self.__controller__.set_racing(fraction, margin)
+
+    def set_scheduling(self, memory:int=100) -> None:
+        """
+        Records the runtime and failure rate of the simulation of each curve, and simulates
+        the curves that are cheap and likely to fail first, so that failing solutions are
+        rejected before the expensive curves are simulated; only applies when the curves
+        of each solution are simulated one after another
+
+        Parameters:
+        * `memory`: The number of recent simulations of each curve that the runtime
+                    and failure rate are averaged over
+        """
+        self.__print__(f"Scheduling the simulations with a memory of {memory}")
+        self.__controller__.define_scheduler(memory)
+
+    def set_timeout(self, seconds:float) -> None:
+        """
+        Runs each simulation on a separate process and kills it if it does not finish
+        in time; the solution is then treated as a failed solution
+
+        Parameters:
+        * `seconds`: The number of seconds that each simulation can run for
+        """
+        self.__print__(f"Limiting the simulations to {seconds} seconds")
+        self.__controller__.set_timeout(seconds)
+
+    def set_surrogate(self, budget:int, explore:float=0.2, min_size:int=None) -> None:
+        """
+        Pre-screens the offspring of each generation with a surrogate (i.e., a radial basis
+        function regression of the solutions evaluated so far), so that only the most
+        promising or most uncertain offspring are evaluated
+
+        Parameters:
+        * `budget`:   The number of offspring to evaluate in each generation
+        * `explore`:  The fraction of the budget used to evaluate the offspring furthest
+                      from the evaluated solutions
+        * `min_size`: The number of evaluated solutions required before pre-screening;
+                      uses the population size if undefined
+        """
+        self.__print__(f"Pre-screening the offspring with a budget of {budget} evaluations")
+        if budget < 1:
+            raise ValueError("The surrogate requires a budget of at least one evaluation!")
+        if explore < 0 or explore > 1:
+            raise ValueError("The fraction of the budget used for exploring must be between 0.0 and 1.0!")
+        self.__surrogate_kwargs__ = {"budget": budget, "explore": explore, "min_size": min_size}
+
+    def set_sampler(self, sampler_name:str="normal", log_params:list=None, seeded:float=0.5, **kwargs) -> None:
+        """
+        Changes how the initial population is sampled
+
+        Parameters:
+        * `sampler_name`: The name of the sampler (e.g., normal, uniform, lhs, sobol, halton)
+        * `log_params`:   The names of the parameters to sample in log-space; all the parameters
+                          are sampled in linear space if undefined, including those with a
+                          log10 transform
+        * `seeded`:       The fraction of the samples in which the parameters with initial
+                          values are sampled around the initial values; the rest are
+                          sampled from the design of the sampler
+        * `kwargs`:       Any additional keyword arguments to pass to the sampler
+        """
+        if seeded < 0 or seeded > 1:
+            raise ValueError("The seeded fraction must be between 0.0 and 1.0!")
+        self.__print__(f"Sampling the initial population with the '{sampler_name}' sampler")
+        self.__sampler_kwargs__ = {"sampler_name": sampler_name, "log_param_names": log_params, "seeded": seeded, **kwargs}
+
+    def set_refinement(self, starts:int=4, method:str="nelder-mead", max_evals:int=200) -> None:
+        """
+        Refines the best solutions with local optimisers once the genetic optimisation
+        has finished; the refined solutions are added to the results
+
+        Parameters:
+        * `starts`:    The number of best solutions to start the local optimisers from
+        * `method`:    The local optimiser (i.e., nelder-mead, powell, least-squares)
+        * `max_evals`: The number of evaluations each local optimiser can use
+        """
+        if starts < 1 or max_evals < 1:
+            raise ValueError("The refinement requires at least one start and one evaluation!")
+        self.__print__(f"Refining the {starts} best solutions with the '{method}' method")
+        self.__refinement_kwargs__ = {"num_starts": starts, "method": method, "max_evals": max_evals}
+
+    def set_termination(self, tolerance:float=None, hypervolume:float=None, patience:int=50,
+                        time_limit:float=None, max_evals:int=None) -> None:
+        """
+        Stops the optimisation before the number of generations have been completed,
+        once any of the defined criteria are met
+
+        Parameters:
+        * `tolerance`:   The relative improvement of the lowest reduced objective over
+                         the patience window below which the optimisation stops
+        * `hypervolume`: The relative improvement of the hypervolume of the objectives of the
+                         optimal solutions over the patience window below which the optimisation stops
+        * `patience`:    The number of generations in the patience window
+        * `time_limit`:  The number of seconds the optimisation can run for
+        * `max_evals`:   The number of evaluations the optimisation can run for
+        """
+        if patience < 1:
+            raise ValueError("The patience window must be at least one generation!")
+        self.__print__("Defining the termination criteria")
+        self.__termination_kwargs__ = {"tolerance": tolerance, "hypervolume": hypervolume, "patience": patience,
+                                       "time_limit": time_limit, "max_evals": max_evals}
+
+    def set_islands(self, islands:int, interval:int=10, migrants:int=5) -> None:
+        """
+        Runs several independent populations (i.e., islands), each on its own process
+        and with its own seed, which send their best non-dominated solutions to the
+        next island after every few generations; the recorder merges the results
+
+        Parameters:
+        * `islands`:  The number of islands
+        * `interval`: The number of generations between each migration
+        * `migrants`: The number of solutions sent to the next island in each migration
+        """
+        if islands < 2:
+            raise ValueError("The island model requires at least two islands!")
+        if interval < 1 or migrants < 1:
+            raise ValueError("The islands must migrate at least one solution every few generations!")
+        self.__print__(f"Running {islands} islands with {migrants} migrants every {interval} generations")
+        self.__island_kwargs__ = {"num_islands": islands, "interval": interval, "num_migrants": migrants}
+
+    def distribute(self, transport:str="manager", lease:float=600.0, local_workers:int=0, slots:int=None,
+                   **kwargs) -> None:
+        """
+        Evaluates the solutions of the optimisation on workers that connect to this
+        process through a transport; the workers run the same script but call `work`
+        instead of `optimise`, and can join or leave during the optimisation
+
+        Parameters:
+        * `transport`:     The name of the transport (e.g., manager, local)
+        * `lease`:         The number of seconds a worker has to return a result before
+                           the solution is sent to another worker
+        * `local_workers`: The number of worker threads to run in this process
+        * `slots`:         The number of evaluations to send out at the same time when the
+                           optimisation is asynchronous; uses the number of local workers
+                           (or one) if undefined
+        * `kwargs`:        Any additional keyword arguments to pass to the transport
+                           (e.g., host, port, authkey)
+        """
+        self.__print__(f"Distributing the evaluations through the '{transport}' transport")
+        self.__broker_kwargs__ = {"transport": transport, "lease": lease, "local_workers": local_workers,
+                                  "slots": slots, **kwargs}
+
+    def work(self, transport:str="manager", **kwargs) -> None:
+        """
+        Evaluates solutions sent by an optimisation that has called `distribute`, until
+        the optimisation finishes; the model, data, errors, and fixed parameters must be
+        defined in the same way as the distributing script
+
+        Parameters:
+        * `transport`: The name of the transport (e.g., manager)
+        * `kwargs`:    Any additional keyword arguments to pass to the transport
+                       (e.g., host, port, authkey)
+        """
+        self.__print__(f"Working on evaluations received through the '{transport}' transport")
+        self.__check_model__()
+        self.__check_curves__("Evaluations cannot run without experimental curves!")
+        self.__check_errors__("Evaluations cannot run without any objective functions!")
+        transport = create_transport(transport, **kwargs)
+        num_tasks = serve_transport(self.__controller__, transport)
+        self.__print__(f"Completed {num_tasks} evaluations", sub_index=True)
+
     def optimise(self, num_gens:int=10000, population:int=100, offspring:int=50,
-                 crossover:float=0.80, mutation:float=0.01) -> dict:
+                 crossover:float=0.80, mutation:float=0.01, workers:int=1, curve_workers:int=1,
+                 checkpoint:int=0, fidelity:list=None, asynchronous:bool=False) -> dict:
         """
         Prepares and conducts the optimisation
         
@@ -481,10 +721,96 @@ class Interface:
         * `offspring`:  The number of solutions introduced after each generation
         * `crossover`:  The crossover probability; should be between 0.0 and 1.0
         * `mutation`:   The mutation probability; should be between 0.0 and 1.0
+        * `workers`:       The number of worker processes used to evaluate each population;
+                           evaluates the solutions one after another if set to 1
+        * `curve_workers`: The number of worker processes used to simulate the curves of
+                           each solution; simulates the curves one after another if set to 1
+        * `checkpoint`:    The number of generations between saving the state of the
+                           optimisation, so that it can be resumed; does not save if set to 0
+        * `fidelity`:      A list of lower fidelity levels, from the lowest to the highest, that
+                           the solutions are evaluated at before being evaluated at full fidelity;
+                           each level is a dictionary of the numerical settings of the drivers
+                           ('num_steps', 'rel_tol', 'abs_tol') and the 'margin' for promoting a
+                           solution to the next level (at least 1, and 1 if undefined);
+                           evaluates at full fidelity if undefined
+        * `asynchronous`:  Whether to create a new offspring as soon as any evaluation finishes,
+                           instead of waiting for the whole generation to be evaluated; the same
+                           number of solutions (i.e., population + (num_gens - 1) * offspring) are evaluated
         """
-        
-        # Display and conduct checks
         self.__print__(f"Conducting the optimisation ({num_gens}, {population}, {offspring}, {crossover}, {mutation})")
+        return self.__optimise__(num_gens, population, offspring, crossover, mutation, workers, curve_workers,
+                                 checkpoint, fidelity, asynchronous=asynchronous)
+
+    def resume(self, file_path:str, num_gens:int=None, workers:int=1, curve_workers:int=1,
+               checkpoint:int=0, fidelity:list=None) -> dict:
+        """
+        Resumes an optimisation from a saved state; the model, data, errors, and
+        fixed parameters must be defined in the same way as the saved optimisation
+
+        Parameters:
+        * `file_path`:     The path to the saved state (i.e., the 'checkpoint.pkl' file)
+        * `num_gens`:      The total number of generations to optimise; uses the number
+                           of generations of the saved optimisation if undefined
+        * `workers`:       The number of worker processes used to evaluate each population
+        * `curve_workers`: The number of worker processes used to simulate the curves of each solution
+        * `checkpoint`:    The number of generations between saving the state of the
+                           optimisation; does not save if set to 0
+        * `fidelity`:      A list of lower fidelity levels that the solutions are evaluated at
+                           before being evaluated at full fidelity
+        """
+
+        # Read the saved state
+        self.__print__(f"Resuming the optimisation from '{file_path}'")
+        self.__check_model__()
+        with open(file_path, "rb") as file:
+            state = pickle.load(file)
+        if state["signature"] != self.__controller__.get_signature():
+            raise ValueError("The saved optimisation was run with a different model, data, or objectives!")
+
+        # Resume the optimisation
+        hyperparameters = state["hyperparameters"]
+        num_gens = hyperparameters["num_gens"] if num_gens == None else num_gens
+        num_gens_completed = state["n_iter"] - 1
+        self.__print__(f"Continuing from generation {num_gens_completed} of {num_gens}", sub_index=True)
+        return self.__optimise__(num_gens, hyperparameters["population"], hyperparameters["offspring"],
+                                 hyperparameters["crossover"], hyperparameters["mutation"], workers,
+                                 curve_workers, checkpoint, fidelity, state)
+
+    def __optimise__(self, num_gens:int, population:int, offspring:int, crossover:float, mutation:float,
+                     workers:int, curve_workers:int, checkpoint:int, fidelity:list=None, state:dict=None,
+                     asynchronous:bool=False) -> dict:
+        """
+        Conducts the optimisation (for internal use only)
+        
+        Parameters:
+        * `num_gens`:      The number of generations to optimise
+        * `population`:    The number of solutions in the initial population
+        * `offspring`:     The number of solutions introduced after each generation
+        * `crossover`:     The crossover probability
+        * `mutation`:      The mutation probability
+        * `workers`:       The number of worker processes used to evaluate each population
+        * `curve_workers`: The number of worker processes used to simulate the curves of each solution
+        * `checkpoint`:    The number of generations between saving the state of the optimisation
+        * `fidelity`:      A list of lower fidelity levels that the solutions are evaluated at
+        * `state`:         The state of a previous optimisation to resume from
+        * `asynchronous`:  Whether to create a new offspring as soon as any evaluation finishes
+        """
+        
+        # Conduct checks
+        if workers < 1:
+            raise ValueError("The optimisation requires at least one worker!")
+        if workers > 1 and curve_workers > 1:
+            raise ValueError("The solutions and curves cannot both be evaluated on worker processes!")
+        if workers > 1 and self.__broker_kwargs__ != None:
+            raise ValueError("The solutions cannot be evaluated on local workers when the evaluations are distributed!")
+        if asynchronous and checkpoint > 0:
+            raise ValueError("The asynchronous optimisation cannot be checkpointed!")
+        if asynchronous and self.__surrogate_kwargs__ != None:
+            raise ValueError("The asynchronous optimisation cannot pre-screen the offspring with a surrogate!")
+        if self.__island_kwargs__ != None and (asynchronous or checkpoint > 0 or state != None):
+            raise ValueError("The islands cannot be run asynchronously, checkpointed, or resumed!")
+        if self.__island_kwargs__ != None and (workers > 1 or self.__broker_kwargs__ != None or self.__surrogate_kwargs__ != None):
+            raise ValueError("The islands already run on their own processes and cannot share a surrogate!")
         self.__check_model__()
         self.__check_curves__("Optimisation cannot run without experimental curves!")
         self.__check_errors__("Optimisation cannot run without any objective functions!")
@@ -494,11 +820,55 @@ class Interface:
             self.__recorder__ = Recorder(self.__controller__, 10, self.__output_path__)
         self.__check_variable__(self.__recorder__, "Optimisation cannot run without initialising a recorder!")
         
-        # Initialise and run the optimisation
-        problem = Problem(self.__controller__, self.__recorder__)
-        self.__recorder__.define_hyperparameters(num_gens, population, offspring, crossover, mutation)
-        moga = MOGA(problem, num_gens, population, offspring, crossover, mutation)
-        moga.optimise()
+        # Define how the populations and curves will be evaluated
+        self.__controller__.compile_objectives()
+        self.__controller__.set_curve_workers(curve_workers)
+        self.__controller__.set_fidelity_list([] if fidelity == None else fidelity)
+        if self.__cache_kwargs__ != None:
+            self.__controller__.define_cache(**self.__cache_kwargs__)
+        if self.__surrogate_kwargs__ != None:
+            min_size = self.__surrogate_kwargs__["min_size"]
+            self.__controller__.define_surrogate(self.__surrogate_kwargs__["budget"], self.__surrogate_kwargs__["explore"],
+                                                 population if min_size == None else min_size)
+        self.__controller__.define_sampler(**self.__sampler_kwargs__)
+        if self.__termination_kwargs__ != None:
+            self.__controller__.define_terminator(**self.__termination_kwargs__)
+        if self.__broker_kwargs__ != None:
+            evaluator = create_evaluator("broker", self.__controller__, **self.__broker_kwargs__)
+        elif workers > 1:
+            evaluator = create_evaluator("pool", self.__controller__, num_workers=workers)
+        else:
+            evaluator = create_evaluator("serial", self.__controller__)
+
+        # Initialise and run the optimisation; the workers are shut down even if the
+        # optimisation fails or is interrupted
+        try:
+            with evaluator:
+                problem = Problem(self.__controller__, self.__recorder__, evaluator)
+                num_islands = 1 if self.__island_kwargs__ == None else self.__island_kwargs__["num_islands"]
+                self.__recorder__.define_hyperparameters(num_gens, population, offspring, crossover, mutation, num_islands)
+                if self.__island_kwargs__ != None:
+                    moga = Islands(problem, num_gens, population, offspring, crossover, mutation, **self.__island_kwargs__)
+                else:
+                    moga_class = AsyncMOGA if asynchronous else MOGA
+                    moga = moga_class(problem, num_gens, population, offspring, crossover, mutation)
+                if checkpoint > 0:
+                    moga.set_checkpoint(self.__get_output__("checkpoint.pkl"), checkpoint)
+                moga.optimise(state)
+            terminator = self.__controller__.get_terminator()
+            if terminator != None and terminator.get_stop_reason() != None:
+                self.__print__(f"Stopped early ({terminator.get_stop_reason()})", sub_index=True)
+                self.__recorder__.record_results()
+            if self.__refinement_kwargs__ != None:
+                self.__controller__.define_refiner(**self.__refinement_kwargs__)
+                self.__controller__.get_refiner().run(self.__recorder__, workers)
+                self.__recorder__.record_results()
+        except BaseException:
+            self.__controller__.close_curve_pool(terminate=True)
+            raise
+        finally:
+            self.__controller__.close_curve_pool()
+            self.__controller__.set_threshold(None)
 
         # Get the results, print, and return the parameters
         opt_params = self.__recorder__.get_opt_params()
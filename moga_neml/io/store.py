@@ -0,0 +1,102 @@
+"""
+ Title:         Store
+ Description:   For storing simulated curves on disk, so that they can be reused across runs
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import hashlib, os, pickle, sqlite3, threading
+
+# Constants
+TIMEOUT = 60
+
+# The Store class
+class Store:
+
+    def __init__(self, file_path:str):
+        """
+        Class for storing the predicted data of simulations in an SQLite database;
+        the database can be shared by multiple processes and runs
+
+        Parameters:
+        * `file_path`: The path to the database file
+        """
+        self.file_path  = file_path
+        self.connection = None
+        self.pid        = None
+        self.lock       = threading.Lock()
+        self.get_connection()
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Gets the connection to the database; the connection is reopened in forked processes
+        """
+        if self.connection == None or self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.connection = sqlite3.connect(self.file_path, timeout=TIMEOUT, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS simulations (key TEXT PRIMARY KEY, prd_data BLOB)")
+            self.connection.commit()
+        return self.connection
+
+    def get_key(self, model_name:str, params:tuple, exp_data:dict, driver_settings:dict) -> str:
+        """
+        Gets the key of a simulation
+
+        Parameters:
+        * `model_name`:      The name of the model
+        * `params`:          All the parameter values, including the fixed ones
+        * `exp_data`:        The experimental data of the curve
+        * `driver_settings`: The settings of the driver
+
+        Returns the key
+        """
+        exp_data_hash = hashlib.sha256(str(sorted(exp_data.items())).encode()).hexdigest()
+        key_list = [model_name, [float(param) for param in params], exp_data_hash, sorted(driver_settings.items())]
+        return hashlib.sha256(str(key_list).encode()).hexdigest()
+
+    def get(self, key:str) -> tuple:
+        """
+        Gets a stored simulation
+
+        Parameters:
+        * `key`: The key of the simulation
+
+        Returns whether the simulation has been stored, and the predicted
+        data of the simulation (none if the simulation failed)
+        """
+        with self.lock:
+            row = self.get_connection().execute("SELECT prd_data FROM simulations WHERE key = ?", (key,)).fetchone()
+        if row == None:
+            return False, None
+        prd_data = None if row[0] == None else pickle.loads(row[0])
+        return True, prd_data
+
+    def add(self, key:str, prd_data:dict) -> None:
+        """
+        Stores a simulation
+
+        Parameters:
+        * `key`:      The key of the simulation
+        * `prd_data`: The predicted data of the simulation (none if the simulation failed)
+        """
+        blob = None if prd_data == None else pickle.dumps(prd_data, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            connection = self.get_connection()
+            connection.execute("INSERT OR REPLACE INTO simulations (key, prd_data) VALUES (?, ?)", (key, blob))
+            connection.commit()
+
+    def get_summary(self, counter_dict:dict) -> list:
+        """
+        Returns a summary of the store usage
+
+        Parameters:
+        * `counter_dict`: The counters of the controller, which include the hits and misses
+                          of the lookups in every process
+        """
+        return [
+            f"file ({self.file_path})",
+            f"hits ({counter_dict.get('store hits', 0)})",
+            f"misses ({counter_dict.get('store misses', 0)})",
+        ]
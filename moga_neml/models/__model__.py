@@ -6,7 +6,9 @@
 """
 
 # Libraries
-import importlib, os, pathlib, sys
+import copy, importlib, os, pathlib, sys
+import numpy as np
+from moga_neml.helper.transform import get_transform_functions
 
 # The Model Template Class
 class __Model__:
@@ -17,20 +19,76 @@ class __Model__:
         """
         self.name = name
         self.param_dict = {}
+        self.param_constraint_list = []
         self.exp_data = {}
+        self.calibrated_model = None
+        self.component_dict = {}
 
-    def add_param(self, name:str, l_bound:float=0.0e0, u_bound:float=1.0e0) -> None:
+    def add_param(self, name:str, l_bound:float=0.0e0, u_bound:float=1.0e0, transform="linear") -> None:
         """
         Adds a parameter and bounds
 
         Parameters:
-        * `name`:    The name of the parameter
-        * `l_bound`: The lower bound of the optimisation
-        * `u_bound`: The upper bound of the optimisation
+        * `name`:      The name of the parameter
+        * `l_bound`:   The lower bound of the optimisation
+        * `u_bound`:   The upper bound of the optimisation
+        * `transform`: The transform of the space that the optimiser searches (i.e., linear,
+                       log10), or a tuple of a forward and an inverse function that operate
+                       on NumPy arrays; useful for bounds that span several orders of magnitude
         """
         if name in self.param_dict.keys():
             raise ValueError("The parameter has already been defined!")
-        self.param_dict[name] = {"l_bound": l_bound, "u_bound": u_bound}
+        get_transform_functions(transform, l_bound, u_bound)
+        self.param_dict[name] = {"l_bound": l_bound, "u_bound": u_bound, "transform": transform}
+
+    def add_param_constraint(self, constraint, bound:float=0.0) -> None:
+        """
+        Adds a constraint on the parameter values, which is checked for the whole
+        population before any simulations are run
+
+        Parameters:
+        * `constraint`: A dictionary of parameter names and coefficients, for a linear constraint
+                        on the weighted sum of the parameters; or a function that is given a
+                        dictionary of parameter names and NumPy arrays of their values (with
+                        one value for each solution), and returns an array of values
+        * `bound`:      The value that the weighted sum (or the returned values) must not exceed
+        """
+        if isinstance(constraint, dict):
+            for name in constraint.keys():
+                if not name in self.param_dict.keys():
+                    raise ValueError(f"The parameter '{name}' of the constraint has not been defined!")
+        elif not callable(constraint):
+            raise ValueError("The constraint must be a dictionary of coefficients or a function!")
+        self.param_constraint_list.append((constraint, bound))
+
+    def get_param_constraint_list(self) -> list:
+        """
+        Returns the list of constraints on the parameter values and their bounds
+        """
+        return self.param_constraint_list
+
+    def get_param_violations(self, param_matrix) -> np.ndarray:
+        """
+        Grades how far sets of parameter values violate the constraints on the parameters;
+        the violations of the linear constraints are relative to the ranges of their parameters
+
+        Parameters:
+        * `param_matrix`: The values of all the parameters, with one row for each solution
+
+        Returns the total violation of each solution
+        """
+        value_array = np.atleast_2d(np.array(param_matrix, dtype=float))
+        value_dict = {name: value_array[:,i] for i, name in enumerate(self.param_dict.keys())}
+        violation_array = np.zeros(len(value_array))
+        for constraint, bound in self.param_constraint_list:
+            if isinstance(constraint, dict):
+                sum_array = sum([coefficient * value_dict[name] for name, coefficient in constraint.items()])
+                scale = sum([abs(coefficient) * (self.param_dict[name]["u_bound"] - self.param_dict[name]["l_bound"])
+                             for name, coefficient in constraint.items()])
+                violation_array += np.maximum(sum_array - bound, 0) / (scale if scale > 0 else 1)
+            else:
+                violation_array += np.maximum(np.array(constraint(value_dict), dtype=float) - bound, 0)
+        return violation_array
 
     def set_exp_data(self, exp_data:dict) -> None:
         """
@@ -66,22 +124,53 @@ class __Model__:
             raise ValueError(f"The experimental data does not contain the {field} field")
         return self.exp_data[field]
 
+    def get_components(self) -> dict:
+        """
+        Gets the components of the model that only depend on the experimental data that
+        has been set (e.g., the elastic model); the components are defined once for each
+        curve and reused by every calibration for that curve
+
+        Returns the dictionary of components
+        """
+        exp_key = tuple(sorted([(field, value) for field, value in self.exp_data.items()
+                                if isinstance(value, (bool, int, float, str))]))
+        if not exp_key in self.component_dict.keys():
+            self.component_dict[exp_key] = self.define_components()
+        return self.component_dict[exp_key]
+
     def get_param_dict(self) -> dict:
         """
         Returns the parameter info
         """
         return self.param_dict
 
+    def calibrate(self, exp_data:dict, *params): # -> NEML Model
+        """
+        Calibrates a model for some experimental data and returns it, without changing the
+        state of this model; the calibration is done on a shallow copy of the model with
+        the experimental data set, so that models can be calibrated concurrently
+
+        Parameters:
+        * `exp_data`: The experimental data
+        * `params`:   The parameter values to calibrate the model
+
+        Returns the calibrated model
+        """
+        model = copy.copy(self)
+        model.exp_data = exp_data
+        return model.calibrate_model(*params)
+
     def get_calibrated_model(self, *params): # -> NEML Model
         """
-        Calibrates a model and returns it
+        Calibrates a model for the experimental data that was last set and returns it;
+        the calibrated model is remembered until the next calibration
 
         Parameters:
         * `params`: The parameter values to calibrate the model
 
         Returns the calibrated model
         """
-        self.calibrated_model = self.calibrate_model(*params)
+        self.calibrated_model = self.calibrate(self.exp_data, *params)
         return self.calibrated_model
 
     def get_last_calibrated_model(self):
@@ -107,6 +196,15 @@ class __Model__:
         """
         raise NotImplementedError
         
+    def define_components(self) -> dict:
+        """
+        Defines the components of the model that only depend on the experimental data,
+        which are accessed through `get_components` (optional placeholder)
+
+        Returns the dictionary of components
+        """
+        return {}
+
     def calibrate_model(self, *params): # -> NEML Model
         """
         Gets the model (must be overridden); returns none if the parameters / model is invalid
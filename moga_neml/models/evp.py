@@ -23,8 +23,20 @@ class Model(__Model__):
         # self.add_param("evp_d",   0.0e0, 1.0e2) # 2
         self.add_param("evp_d",   0.0e0, 1.0e1) # 2
         self.add_param("evp_n",   1.0e0, 1.0e2) # 2
-        self.add_param("evp_eta", 0.0e0, 1.0e4) # 5
+        self.add_param("evp_eta", 0.0e0, 1.0e4, "log10") # 5
         
+    def define_components(self) -> dict:
+        """
+        Defines the components that only depend on the experimental data
+
+        Returns the dictionary of components
+        """
+        return {
+            "elastic_model": elasticity.IsotropicLinearElasticModel(self.get_data("youngs"), "youngs",
+                                                                    self.get_data("poissons"), "poissons"),
+            "yield_surface": surfaces.IsoJ2(),
+        }
+
     def calibrate_model(self, evp_s0:float, evp_R:float, evp_d:float, evp_n:float, evp_eta:float):
         """
         Gets the predicted curves
@@ -38,9 +50,9 @@ class Model(__Model__):
 
         Returns the calibrated model
         """
-        elastic_model = elasticity.IsotropicLinearElasticModel(self.get_data("youngs"), "youngs",
-                                                               self.get_data("poissons"), "poissons")
-        yield_surface = surfaces.IsoJ2()
+        components    = self.get_components()
+        elastic_model = components["elastic_model"]
+        yield_surface = components["yield_surface"]
         iso_hardening = hardening.VoceIsotropicHardeningRule(evp_s0, evp_R, evp_d)
         g_power       = visco_flow.GPowerLaw(evp_n, evp_eta)
         visco_model   = visco_flow.PerzynaFlowRule(yield_surface, iso_hardening, g_power)
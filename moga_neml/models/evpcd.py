@@ -20,11 +20,24 @@ class Model(__Model__):
         self.add_param("evp_R",   0.0e0, 1.0e3) # 4
         self.add_param("evp_d",   0.0e0, 1.0e2) # 2
         self.add_param("evp_n",   1.0e0, 1.0e2) # 2
-        self.add_param("evp_eta", 0.0e0, 1.0e4) # 5
-        self.add_param("cd_A",    0.0e1, 1.0e4)
+        self.add_param("evp_eta", 0.0e0, 1.0e4, "log10") # 5
+        self.add_param("cd_A",    0.0e1, 1.0e4, "log10")
         self.add_param("cd_xi",   0.0e1, 1.0e2)
         self.add_param("cd_phi",  0.0e1, 1.0e2)
     
+    def define_components(self) -> dict:
+        """
+        Defines the components that only depend on the experimental data
+
+        Returns the dictionary of components
+        """
+        return {
+            "elastic_model": elasticity.IsotropicLinearElasticModel(self.get_data("youngs"), "youngs",
+                                                                    self.get_data("poissons"), "poissons"),
+            "yield_surface": surfaces.IsoJ2(),
+            "eff_stress":    damage.VonMisesEffectiveStress(),
+        }
+
     def calibrate_model(self, evp_s0:float, evp_R:float, evp_d:float, evp_n:float, evp_eta:float,
                         cd_A:float, cd_xi:float, cd_phi:float):
         """
@@ -42,15 +55,15 @@ class Model(__Model__):
 
         Returns the calibrated model
         """
-        elastic_model = elasticity.IsotropicLinearElasticModel(self.get_data("youngs"), "youngs",
-                                                               self.get_data("poissons"), "poissons")
-        yield_surface = surfaces.IsoJ2()
+        components    = self.get_components()
+        elastic_model = components["elastic_model"]
+        yield_surface = components["yield_surface"]
         iso_hardening = hardening.VoceIsotropicHardeningRule(evp_s0, evp_R, evp_d)
         g_power       = visco_flow.GPowerLaw(evp_n, evp_eta)
         visco_model   = visco_flow.PerzynaFlowRule(yield_surface, iso_hardening, g_power)
         integrator    = general_flow.TVPFlowRule(elastic_model, visco_model)
         evp_model     = models.GeneralIntegrator(elastic_model, integrator)
-        eff_stress    = damage.VonMisesEffectiveStress()
+        eff_stress    = components["eff_stress"]
         cd_model      = damage.ModularCreepDamage(elastic_model, cd_A, cd_xi, cd_phi, eff_stress)
         evpcd_model   = damage.NEMLScalarDamagedModel_sd(elastic_model, evp_model, cd_model)
         return evpcd_model
\ No newline at end of file
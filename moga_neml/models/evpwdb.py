@@ -29,7 +29,7 @@ class Model(__Model__):
         self.add_param("evp_R",   0.0e0, 1.0e3) # 4
         self.add_param("evp_d",   0.0e0, 1.0e2) # 2
         self.add_param("evp_n",   0.0e0, 1.0e2) # 2
-        self.add_param("evp_eta", 0.0e0, 1.0e4) # 5
+        self.add_param("evp_eta", 0.0e0, 1.0e4, "log10") # 5
         
         # Critical work parameters
         self.add_param("c_0", 0e0, 1.0e3)
@@ -41,6 +41,22 @@ class Model(__Model__):
         self.add_param("c_n", 0.0e0, 1.0e2)
         self.add_param("t_n", 0.0e0, 1.0e2)
 
+        # Tensile shelf must be higher than creep shelf
+        self.add_param_constraint({"c_0": 1, "t_0": -1})
+        self.add_param_constraint({"c_1": 1, "t_1": -1})
+
+    def define_components(self) -> dict:
+        """
+        Defines the components that only depend on the experimental data
+
+        Returns the dictionary of components
+        """
+        return {
+            "elastic_model": elasticity.IsotropicLinearElasticModel(self.get_data("youngs"), "youngs",
+                                                                    self.get_data("poissons"), "poissons"),
+            "yield_surface": surfaces.IsoJ2(),
+        }
+
     def calibrate_model(self, evp_s0:float, evp_R:float, evp_d:float, evp_n:float, evp_eta:float,
                         c_0:float, c_1:float, t_0:float, t_1:float, c_n:float, t_n:float):
         """
@@ -67,9 +83,9 @@ class Model(__Model__):
             return
 
         # Define EVP model
-        elastic_model = elasticity.IsotropicLinearElasticModel(self.get_data("youngs"), "youngs",
-                                                               self.get_data("poissons"), "poissons")
-        yield_surface = surfaces.IsoJ2()
+        components    = self.get_components()
+        elastic_model = components["elastic_model"]
+        yield_surface = components["yield_surface"]
         iso_hardening = hardening.VoceIsotropicHardeningRule(evp_s0, evp_R, evp_d)
         g_power       = visco_flow.GPowerLaw(evp_n, evp_eta)
         visco_model   = visco_flow.PerzynaFlowRule(yield_surface, iso_hardening, g_power)
@@ -0,0 +1,98 @@
+"""
+ Title:         Asynchronous Multi-Objective Genetic Algorithm
+ Description:   For parameter optimisation without waiting for whole generations
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import numpy as np
+import warnings
+from pymoo.core.population import Population
+from moga_neml.optimise.moga import MOGA
+
+# Constants
+MAX_MATING_ATTEMPTS = 10
+
+# The Asynchronous Multi-Objective Genetic Algorithm class
+class AsyncMOGA(MOGA):
+
+    def get_offspring(self) -> tuple:
+        """
+        Creates a single offspring from the current population; creates a random
+        offspring if the mating only produces duplicates
+
+        Returns the (decoded) parameter values of the offspring
+        """
+        for _ in range(MAX_MATING_ATTEMPTS):
+            offspring = self.algo.mating.do(self.problem, self.algo.pop, 1, algorithm=self.algo,
+                                            random_state=self.algo.random_state)
+            if len(offspring) > 0:
+                return self.problem.decode(offspring.get("X")[0])
+        offspring = Population.new(X=np.array([self.algo.random_state.uniform(self.problem.xl, self.problem.xu)]))
+        offspring = self.algo.repair(self.problem, offspring, random_state=self.algo.random_state, algorithm=self.algo)
+        return self.problem.decode(offspring.get("X")[0])
+
+    def merge(self, params:tuple, error_value_dict:dict) -> None:
+        """
+        Adds an evaluated offspring to the population, and removes the worst solution
+        so that the size of the population stays the same
+
+        Parameters:
+        * `params`:           The parameter values of the offspring
+        * `error_value_dict`: The dictionary of objectives of the offspring
+        """
+        offspring = Population.new(X=np.array([self.problem.encode(params)]),
+                                   F=np.array([self.controller.get_objective_values(error_value_dict)]),
+                                   G=np.array([self.controller.get_violation_values(error_value_dict)]))
+        population = Population.merge(self.algo.pop, offspring)
+        self.algo.pop = self.algo.survival.do(self.problem, population, n_survive=self.init_pop,
+                                              algorithm=self.algo, random_state=self.algo.random_state)
+
+    def optimise(self, state:dict=None) -> None:
+        """
+        Runs the genetic optimisation in a steady-state manner; the initial population is
+        evaluated together, and then a new offspring is created and submitted as soon as
+        any evaluation finishes, so that the workers never wait for a whole generation;
+        the same number of evaluations are performed as the generational optimisation,
+        unless the termination criteria of the controller (if defined) are met first
+
+        Parameters:
+        * `state`: Not supported; the asynchronous optimisation cannot be resumed
+        """
+        if state != None:
+            raise ValueError("The asynchronous optimisation cannot be resumed!")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            # Evaluate the initial population
+            if self.controller.get_terminator() != None:
+                self.controller.get_terminator().start()
+            self.algo.setup(self.problem, termination=("n_gen", self.num_gens), verbose=False, seed=None)
+            self.algo.next()
+
+            # Keep the evaluator busy until all the offspring have been evaluated
+            evaluator     = self.problem.get_evaluator()
+            recorder      = self.problem.get_recorder()
+            num_remaining = (self.num_gens - 1) * self.offspring
+            num_pending   = 0
+            num_collected = 0
+            while num_remaining > 0 or num_pending > 0:
+
+                # Submit new offspring to the free slots
+                self.controller.set_threshold(recorder.get_threshold())
+                while num_remaining > 0 and num_pending < evaluator.get_num_slots():
+                    evaluator.submit(self.get_offspring())
+                    num_remaining -= 1
+                    num_pending   += 1
+
+                # Collect the next finished evaluation
+                params, error_value_dict = evaluator.collect()
+                num_pending -= 1
+                self.problem.record(params, error_value_dict)
+                self.merge(params, error_value_dict)
+
+                # Stop submitting offspring once the termination criteria are met
+                num_collected += 1
+                if num_collected % self.offspring == 0 and recorder.is_terminated():
+                    num_remaining = 0
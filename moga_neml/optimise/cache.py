@@ -0,0 +1,137 @@
+"""
+ Title:         Cache
+ Description:   For memoising the objectives and predictions of evaluated parameters
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import math, sys
+import numpy as np
+from collections import OrderedDict
+
+# The Cache class
+class Cache:
+
+    def __init__(self, prefix:str, tolerance:float=1e-6, max_memory:float=1024):
+        """
+        Class for caching the evaluations, using least-recently-used eviction
+
+        Parameters:
+        * `prefix`:     The identifier of the model and curves being evaluated
+        * `tolerance`:  The relative tolerance under which parameter values are considered identical
+        * `max_memory`: The maximum memory of the cached evaluations, in megabytes
+        """
+        self.prefix     = prefix
+        self.tolerance  = tolerance
+        self.max_memory = max_memory * 1024 * 1024
+        self.entry_dict = OrderedDict()
+        self.memory     = 0
+        self.num_hits   = 0
+        self.num_misses = 0
+
+    def get_key(self, params:tuple, include_validation:bool=False) -> tuple:
+        """
+        Gets the key of a set of parameters, by quantising them to the tolerance
+
+        Parameters:
+        * `params`:             The parameter values
+        * `include_validation`: Whether the validation data was included
+
+        Returns the key
+        """
+        return (self.prefix, include_validation, tuple([quantise(float(param), self.tolerance) for param in params]))
+
+    def get(self, params:tuple, include_validation:bool=False) -> dict:
+        """
+        Gets a cached evaluation
+
+        Parameters:
+        * `params`:             The parameter values
+        * `include_validation`: Whether the validation data was included
+
+        Returns a dictionary containing the objectives and predicted data, or none
+        if the parameters have not been evaluated
+        """
+        key = self.get_key(params, include_validation)
+        if not key in self.entry_dict.keys():
+            self.num_misses += 1
+            return None
+        self.num_hits += 1
+        self.entry_dict.move_to_end(key)
+        return self.entry_dict[key]
+
+    def add(self, params:tuple, objective_dict:dict, prd_data_list:list=None,
+            include_validation:bool=False) -> None:
+        """
+        Adds an evaluation to the cache, and evicts the least recently used
+        evaluations if the memory limit is exceeded; evaluations discarded by
+        the racing or stopped at a lower fidelity level are not cached, since
+        they depend on the threshold at the time of the evaluation
+
+        Parameters:
+        * `params`:             The parameter values
+        * `objective_dict`:     The dictionary of objectives
+        * `prd_data_list`:      The list of predicted data for each curve, if available
+        * `include_validation`: Whether the validation data was included
+        """
+
+        # Add the entry
+        if objective_dict.get("violation_racing", 0) > 0 or "fidelity" in objective_dict.keys():
+            return
+        key = self.get_key(params, include_validation)
+        if key in self.entry_dict.keys():
+            self.memory -= self.entry_dict.pop(key)["memory"]
+        entry = {"objectives": dict(objective_dict), "prd_data_list": prd_data_list}
+        entry["memory"] = get_size(entry)
+        self.entry_dict[key] = entry
+        self.memory += entry["memory"]
+
+        # Evict the least recently used entries
+        while self.memory > self.max_memory and len(self.entry_dict) > 0:
+            _, evicted_entry = self.entry_dict.popitem(last=False)
+            self.memory -= evicted_entry["memory"]
+
+    def get_summary(self) -> list:
+        """
+        Returns a summary of the cache usage
+        """
+        return [
+            f"hits ({self.num_hits})",
+            f"misses ({self.num_misses})",
+            f"entries ({len(self.entry_dict)})",
+            "memory ({:0.4} MB)".format(self.memory / 1024 / 1024),
+        ]
+
+def quantise(value:float, tolerance:float):
+    """
+    Quantises a value on a logarithmic scale, so that values within
+    a relative tolerance of each other share the same bin
+
+    Parameters:
+    * `value`:     The value to be quantised
+    * `tolerance`: The relative tolerance
+
+    Returns the bin of the value
+    """
+    if value == 0 or tolerance <= 0 or not math.isfinite(value):
+        return value
+    sign = 1 if value > 0 else -1
+    return sign * round(math.log(abs(value)) / math.log1p(tolerance))
+
+def get_size(value) -> int:
+    """
+    Estimates the memory used by a (nested) value
+
+    Parameters:
+    * `value`: The value
+
+    Returns the size in bytes
+    """
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum([get_size(item) for item in value.values()])
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum([get_size(item) for item in value])
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return sys.getsizeof(value)
@@ -6,20 +6,32 @@
 """
 
 # Libraries
+import copy, hashlib, time
+import numpy as np
 from moga_neml.constraints.__constraint__ import __Constraint__, create_constraint
 from moga_neml.models.__model__ import __Model__, create_model
 from moga_neml.errors.__error__ import __Error__
 from moga_neml.io.plotter import Plotter, EXP_COLOUR, CAL_COLOUR, VAL_COLOUR
 from moga_neml.io.boxplotter import plot_boxplots
+from moga_neml.io.store import Store
 from moga_neml.drivers.driver import Driver
 from moga_neml.optimise.curve import Curve
+from moga_neml.optimise.cache import Cache
+from moga_neml.optimise.surrogate import Surrogate
+from moga_neml.optimise.terminator import Terminator
+from moga_neml.optimise.refiner import Refiner
+from moga_neml.optimise.scheduler import Scheduler
+from moga_neml.samplers.__sampler__ import __Sampler__, create_sampler
 from moga_neml.helper.experiment import get_labels_list
 from moga_neml.helper.general import reduce_list, transpose
+from moga_neml.helper.parallel import create_pool, evaluate_curve, run_isolated
+from moga_neml.helper.transform import Encoder, get_transform_name
 
 # Constants
 MIN_DATA    = 5
 BIG_VALUE   = 10000
 ALL_COLOURS = ["red", "purple", "green", "orange", "blue", "magenta", "cyan", "olive", "pink", "brown"] * 10
+LABEL_FIELDS = ["title", "file_name"] # fields of the experimental data that do not affect the simulations
 
 # The Controller class
 class Controller():
@@ -41,10 +53,57 @@ class Controller():
         self.group_type   = True
         self.group_labels = True
         
+        # Initialise the compiled mapping from the errors to the objectives
+        self.objective_plan = None
+        
         # Initialise variables for reducing errors
         self.error_reduction_method     = "average"
         self.objective_reduction_method = "average"
         
+        # Initialise variables for simulating the curves in parallel
+        self.curve_workers = 1
+        self.curve_pool    = None
+        
+        # Initialise variables for caching the evaluations and simulations
+        self.cache = None
+        self.store = None
+        
+        # Initialise the surrogate for pre-screening the offspring
+        self.surrogate = None
+        
+        # Initialise the termination criteria
+        self.terminator = None
+        
+        # Initialise the sampler of the initial population
+        self.sampler = None
+        
+        # Initialise the local refinement of the optimal solutions
+        self.refiner = None
+        
+        # Initialise the horizon of the simulations relative to the experimental data
+        self.horizon_factor = None
+        
+        # Initialise variables for abandoning hopeless simulations
+        self.abandon_margin = None
+        self.threshold      = None
+        
+        # Initialise variables for racing the evaluations over subsets of the curves
+        self.racing_fraction = None
+        self.racing_margin   = None
+        
+        # Initialise the counters of events during the evaluations
+        self.counter_dict = {}
+        
+        # Initialise the lower fidelity levels of the evaluations
+        self.fidelity_list = []
+        self.fidelity      = None
+        
+        # Initialise the time budget of each simulation
+        self.timeout = None
+        
+        # Initialise the adaptive order of the simulations
+        self.scheduler = None
+        
     def define_model(self, model_name:str, **kwargs) -> None:
         """
         Defines the model
@@ -63,7 +122,32 @@ class Controller():
         """
         curve = Curve(exp_data, self.model)
         self.curve_list.append(curve)
+        self.objective_plan = None
+
+    def add_error(self, error_name:str, x_label:str="", y_label:str="", weight:float=1, **kwargs) -> None:
+        """
+        Adds an error to the most recently added curve
+
+        Parameters:
+        * `error_name`: The name of the error
+        * `x_label`:    The measurement on the x-axis
+        * `y_label`:    The measurement on the y-axis
+        * `weight`:     The factor multipled with the error when the errors are reduced
+        """
+        self.get_last_curve().add_error(error_name, x_label, y_label, weight, **kwargs)
+        self.objective_plan = None
     
+    def set_custom_driver(self, driver_type:str, driver_kwargs:dict) -> None:
+        """
+        Sets a custom driver for the most recently added curve
+
+        Parameters:
+        * `driver_type`:   The driver type
+        * `driver_kwargs`: The arguments of the driver
+        """
+        self.get_last_curve().set_custom_driver(driver_type, driver_kwargs)
+        self.objective_plan = None
+
     def get_curve_list(self) -> list:
         """
         Gets the list of curves
@@ -204,6 +288,17 @@ class Controller():
                 unfix_param_dict[param_name] = param_dict[param_name]
         return unfix_param_dict
 
+    def get_encoder(self) -> Encoder:
+        """
+        Gets the encoder that maps the values of the unfixed parameters into the
+        unit hypercube searched by the optimiser, through their transforms
+        """
+        unfix_param_dict = self.get_unfix_param_dict()
+        l_bound_list   = [unfix_param_dict[param_name]["l_bound"] for param_name in unfix_param_dict.keys()]
+        u_bound_list   = [unfix_param_dict[param_name]["u_bound"] for param_name in unfix_param_dict.keys()]
+        transform_list = [unfix_param_dict[param_name].get("transform", "linear") for param_name in unfix_param_dict.keys()]
+        return Encoder(l_bound_list, u_bound_list, transform_list)
+
     def get_unfix_param_names(self) -> list:
         """
         Returns a list of the unfixed parameters' named
@@ -254,6 +349,7 @@ class Controller():
         self.group_name = group_name
         self.group_type = group_type
         self.group_labels = group_labels
+        self.objective_plan = None
 
     def get_error_grouping(self) -> str:
         """
@@ -267,69 +363,841 @@ class Controller():
         group_str_list = [group_str for group_str in group_str_list if group_str != ""]
         return ', '.join(group_str_list)
 
-    def get_objective_info_list(self) -> list:
+    def set_curve_workers(self, curve_workers:int) -> None:
         """
-        Returns information about the errors
+        Changes the number of worker processes used to simulate the curves of each evaluation
+
+        Parameters:
+        * `curve_workers`: The number of worker processes; simulates the curves one after
+                           another if set to 1
+        """
+        if curve_workers < 1:
+            raise ValueError("The curves cannot be simulated with less than one worker!")
+        self.close_curve_pool()
+        self.curve_workers = curve_workers
+
+    def get_curve_workers(self) -> int:
+        """
+        Gets the number of worker processes used to simulate the curves of each evaluation
+        """
+        return self.curve_workers
+
+    def close_curve_pool(self, terminate:bool=False) -> None:
+        """
+        Shuts down the worker processes used to simulate the curves, if they have been started
+
+        Parameters:
+        * `terminate`: Whether to stop the worker processes without waiting for the
+                       running simulations (e.g., if the optimisation failed)
+        """
+        if self.curve_pool != None:
+            self.curve_pool.terminate() if terminate else self.curve_pool.close()
+            self.curve_pool.join()
+            self.curve_pool = None
+
+    def set_horizon_factor(self, horizon_factor:float) -> None:
+        """
+        Sets the horizon factor, such that the creep and tensile simulations stop once they
+        pass the end of the experimental data multiplied by the factor
+
+        Parameters:
+        * `horizon_factor`: The horizon factor; simulates to the full extent if undefined
+        """
+        if horizon_factor != None and horizon_factor < 1:
+            raise ValueError("The horizon factor must be at least 1!")
+        self.horizon_factor = horizon_factor
+        self.objective_plan = None
+
+    def get_horizon_factor(self) -> float:
+        """
+        Gets the horizon factor
+        """
+        return self.horizon_factor
+
+    def set_abandon_margin(self, abandon_margin:float) -> None:
+        """
+        Sets the margin for abandoning simulations, such that the creep and tensile simulations
+        are abandoned once an approximate lower bound on the reduced objective exceeds the
+        threshold multiplied by the margin
+
+        Parameters:
+        * `abandon_margin`: The margin; the simulations are not abandoned if undefined (default)
+        """
+        if abandon_margin != None and abandon_margin <= 0:
+            raise ValueError("The margin for abandoning simulations must be positive!")
+        self.abandon_margin = abandon_margin
+
+    def get_abandon_margin(self) -> float:
+        """
+        Gets the margin for abandoning simulations
+        """
+        return self.abandon_margin
+
+    def set_racing(self, fraction:float, margin:float=1.0) -> None:
+        """
+        Sets the racing of the evaluations, such that the parameters are first evaluated on
+        a subset of the curves, and the remaining curves are only simulated if the estimated
+        reduced objective could reach the threshold (e.g., the worst optimal solution)
+
+        Parameters:
+        * `fraction`: The fraction of the groups of curves in the subset; the parameters are
+                      evaluated on all the curves at once if undefined
+        * `margin`:   The factor to multiply the threshold by before comparing it with the
+                      estimated reduced objective; must be at least 1, so that the discarded
+                      parameters could not have become optimal solutions
+        """
+        if fraction != None and not 0 < fraction < 1:
+            raise ValueError("The racing fraction must be between 0 and 1!")
+        if margin < 1:
+            raise ValueError("The racing margin must be at least 1!")
+        self.racing_fraction = fraction
+        self.racing_margin   = margin
+        self.objective_plan  = None
+
+    def get_racing_summary(self) -> list:
+        """
+        Gets a summary of the racing of the evaluations; returns none if the
+        evaluations are not raced
+        """
+        if self.racing_fraction == None:
+            return None
+        racing_curves = self.get_objective_plan()["racing_curves"]
+        num_groups = len(self.get_curve_groups([curve for curve in self.curve_list if len(curve.get_error_list()) > 0]))
+        num_run = self.counter_dict.get("racing simulations run", 0)
+        num_saved = self.counter_dict.get("racing simulations saved", 0)
+        saved_fraction = num_saved / max(num_run + num_saved, 1)
+        return [
+            f"subset ({len(self.get_curve_groups(racing_curves))}/{num_groups})",
+            f"margin ({self.racing_margin})",
+            f"promoted ({self.counter_dict.get('racing promoted', 0)})",
+            f"discarded ({self.counter_dict.get('racing discarded', 0)})",
+            f"saved ({round(100 * saved_fraction, 2)}%)",
+        ]
+
+    def set_timeout(self, timeout:float) -> None:
+        """
+        Sets the time budget of each simulation, such that the simulations are run on a
+        separate process and killed if they do not finish in time
+
+        Parameters:
+        * `timeout`: The number of seconds; the simulations are run without a time budget
+                     if undefined
+        """
+        if timeout != None and timeout <= 0:
+            raise ValueError("The time budget of the simulations must be positive!")
+        self.timeout = timeout
+
+    def get_timeout(self) -> float:
+        """
+        Gets the time budget of each simulation
+        """
+        return self.timeout
+
+    def set_threshold(self, threshold:float) -> None:
+        """
+        Sets the threshold of the reduced objective (e.g., the worst of the optimal solutions)
+        above which the simulations are abandoned and the evaluations are not promoted
+        to higher fidelity levels
+
+        Parameters:
+        * `threshold`: The threshold; the simulations are not abandoned and the evaluations
+                       are always promoted if undefined
+        """
+        self.threshold = threshold
+
+    def get_threshold(self) -> float:
+        """
+        Gets the threshold of the reduced objective
+        """
+        return self.threshold
+
+    def set_fidelity_list(self, fidelity_list:list) -> None:
+        """
+        Sets the lower fidelity levels that the evaluations go through before being
+        evaluated at full fidelity
+
+        Parameters:
+        * `fidelity_list`: A list of dictionaries, from the lowest to the highest
+                           fidelity, containing the numerical settings of the drivers
+                           (i.e., 'num_steps', 'rel_tol', and 'abs_tol') and the 'margin'
+                           for promoting the solution to the next fidelity level; the margin
+                           must be at least 1, so that the solutions that are not promoted
+                           could not have become optimal solutions, and defaults to 1
+        """
+        for fidelity in fidelity_list:
+            unknown_list = [key for key in fidelity.keys() if not key in ["num_steps", "rel_tol", "abs_tol", "margin"]]
+            if unknown_list != []:
+                raise ValueError(f"The fidelity settings {unknown_list} are not supported!")
+            if fidelity.get("margin", 1.0) < 1:
+                raise ValueError("The margin of each fidelity level must be at least 1!")
+        self.fidelity_list = [{"margin": 1.0, **fidelity} for fidelity in fidelity_list]
+
+    def get_fidelity_list(self) -> list:
+        """
+        Gets the lower fidelity levels of the evaluations
+        """
+        return self.fidelity_list
+
+    def set_fidelity(self, fidelity:dict) -> None:
+        """
+        Sets the numerical settings of the drivers for the current fidelity level
+
+        Parameters:
+        * `fidelity`: The numerical settings; uses the full fidelity settings if undefined
+        """
+        self.fidelity = fidelity
+
+    def increment_counter(self, name:str, amount:int=1) -> None:
+        """
+        Increments a counter of events during the evaluations
+
+        Parameters:
+        * `name`:   The name of the counter
+        * `amount`: The amount to increment the counter by
+        """
+        self.counter_dict[name] = self.counter_dict.get(name, 0) + amount
+
+    def add_counter_dict(self, counter_dict:dict) -> None:
+        """
+        Adds counters to the counters of this controller (e.g., those from a worker)
+
+        Parameters:
+        * `counter_dict`: The dictionary of counters
+        """
+        for name, amount in counter_dict.items():
+            self.increment_counter(name, amount)
+
+    def get_counter_dict(self) -> dict:
+        """
+        Gets the counters of events during the evaluations
+        """
+        return self.counter_dict
+
+    def pop_counter_dict(self) -> dict:
+        """
+        Gets the counters of events during the evaluations and resets them;
+        used by the workers to send their counters back
+        """
+        counter_dict, self.counter_dict = self.counter_dict, {}
+        return counter_dict
+
+    def get_signature(self) -> str:
+        """
+        Gets a hash identifying the model, curves, errors, fixed parameters, and reduction
+        methods, such that evaluations with the same signature give the same objectives
+        """
+        signature_list = [self.model.get_name(), sorted(self.fix_param_dict.items()), self.get_error_grouping(),
+                          self.error_reduction_method, self.objective_reduction_method, self.horizon_factor]
+        unfix_param_dict = self.get_unfix_param_dict()
+        signature_list += [(param_name, unfix_param_dict[param_name]["l_bound"], unfix_param_dict[param_name]["u_bound"],
+                            get_transform_name(unfix_param_dict[param_name].get("transform", "linear")))
+                           for param_name in unfix_param_dict.keys()]
+        for curve in self.curve_list:
+            custom_driver, custom_driver_kwargs = curve.get_custom_driver()
+            custom_driver = custom_driver if custom_driver == None or isinstance(custom_driver, str) else custom_driver.__name__
+            signature_list += [sorted(curve.get_exp_data().items()), custom_driver, custom_driver_kwargs]
+            for error in curve.get_error_list():
+                signature_list.append(sorted([(key, value) for key, value in vars(error).items()
+                                              if isinstance(value, (bool, int, float, str))]))
+        for constraint in self.constraint_list:
+            signature_list.append(sorted([(key, value) for key, value in vars(constraint).items()
+                                          if isinstance(value, (bool, int, float, str))]))
+        return hashlib.sha256(str(signature_list).encode()).hexdigest()
+
+    def define_cache(self, tolerance:float=1e-6, max_memory:float=1024) -> None:
+        """
+        Caches the evaluations so that previously evaluated parameters are not simulated again
+
+        Parameters:
+        * `tolerance`:  The relative tolerance under which parameter values are considered identical
+        * `max_memory`: The maximum memory of the cached evaluations, in megabytes
+        """
+        prefix = f"{self.model.get_name()}_{self.get_signature()}"
+        self.cache = Cache(prefix, tolerance, max_memory)
+
+    def copy_for_worker(self):
+        """
+        Copies the controller for a worker thread, so that concurrent evaluations do not
+        share the predicted data, fidelity level, threshold, or counters; the cache and
+        the pool of curve workers are not copied (the evaluations are cached by the
+        evaluator), the counters start from zero (since they are returned with each
+        result), the NEML objects of the model are rebuilt by the copy when needed (since
+        they cannot be copied), and the store is shared since it can be used by several
+        threads
+
+        Returns the copied controller
+        """
+        memo = {id(self.cache): None, id(self.curve_pool): None, id(self.store): self.store,
+                id(self.counter_dict): {},
+                id(self.model.component_dict): {}, id(self.model.calibrated_model): None}
+        return copy.deepcopy(self, memo)
+
+    def remove_cache(self) -> None:
+        """
+        Stops caching the evaluations
+        """
+        self.cache = None
+
+    def get_cache(self) -> Cache:
+        """
+        Gets the cache of the evaluations; returns none if the evaluations are not cached
+        """
+        return self.cache
+
+    def define_store(self, file_path:str) -> None:
+        """
+        Stores the simulations on disk so that they can be reused by later runs
+
+        Parameters:
+        * `file_path`: The path to the database file
+        """
+        self.store = Store(file_path)
+
+    def get_store(self) -> Store:
+        """
+        Gets the store of the simulations; returns none if the simulations are not stored
+        """
+        return self.store
+
+    def define_surrogate(self, budget:int, explore:float=0.2, min_size:int=10) -> None:
+        """
+        Defines the surrogate for pre-screening the offspring of each generation
+
+        Parameters:
+        * `budget`:   The number of offspring to evaluate in each generation
+        * `explore`:  The fraction of the budget used to evaluate the most uncertain offspring
+        * `min_size`: The number of evaluated solutions required before pre-screening
+        """
+        self.surrogate = Surrogate(self.get_encoder(), budget, explore, min_size, self.reduce_objectives)
+
+    def get_surrogate(self) -> Surrogate:
+        """
+        Gets the surrogate for pre-screening the offspring
+        """
+        return self.surrogate
+
+    def define_terminator(self, tolerance:float=None, hypervolume:float=None, patience:int=50,
+                          time_limit:float=None, max_evals:int=None) -> None:
+        """
+        Defines the criteria for stopping the optimisation early
+
+        Parameters:
+        * `tolerance`:   The relative improvement of the lowest reduced objective over
+                         the patience window below which the optimisation stops
+        * `hypervolume`: The relative improvement of the hypervolume of the optimal
+                         solutions over the patience window below which the optimisation stops
+        * `patience`:    The number of generations in the patience window
+        * `time_limit`:  The number of seconds the optimisation can run for
+        * `max_evals`:   The number of evaluations the optimisation can run for
+        """
+        self.terminator = Terminator(tolerance, hypervolume, patience, time_limit, max_evals, BIG_VALUE)
+
+    def get_terminator(self) -> Terminator:
+        """
+        Gets the termination criteria; returns none if the criteria have not been defined
+        """
+        return self.terminator
+
+    def define_scheduler(self, memory:int=100) -> None:
+        """
+        Defines the adaptive order of the simulations, so that the curves that are
+        cheap and likely to fail are simulated first
+
+        Parameters:
+        * `memory`: The number of recent simulations of each curve that the runtime
+                    and failure rate are averaged over
+        """
+        self.scheduler = Scheduler(memory)
+
+    def get_scheduler(self) -> Scheduler:
+        """
+        Gets the adaptive order of the simulations; returns none if undefined
+        """
+        return self.scheduler
+
+    def define_sampler(self, sampler_name:str="normal", log_param_names:list=None, seeded:float=0.5,
+                       **kwargs) -> None:
+        """
+        Defines the sampler of the initial population
+
+        Parameters:
+        * `sampler_name`:    The name of the sampler
+        * `log_param_names`: The names of the parameters to sample in log-space; samples all
+                             the parameters in linear space if undefined
+        * `seeded`:          The fraction of the samples seeded around the initial values
+        """
+        unfix_param_dict = self.get_unfix_param_dict()
+        log_param_names = [] if log_param_names == None else log_param_names
+        for param_name in log_param_names:
+            if not param_name in unfix_param_dict.keys():
+                raise ValueError(f"The parameter '{param_name}' is not an unfixed parameter of the model!")
+        l_bound_list = [unfix_param_dict[param_name]["l_bound"] for param_name in unfix_param_dict.keys()]
+        u_bound_list = [unfix_param_dict[param_name]["u_bound"] for param_name in unfix_param_dict.keys()]
+        log_list = [param_name in log_param_names for param_name in unfix_param_dict.keys()]
+        self.sampler = create_sampler(sampler_name, l_bound_list, u_bound_list, log_list, seeded, **kwargs)
+
+    def get_sampler(self) -> __Sampler__:
+        """
+        Gets the sampler of the initial population; defines the normal sampler
+        if no sampler has been defined
+        """
+        if self.sampler == None:
+            self.define_sampler("normal")
+        return self.sampler
+
+    def define_refiner(self, num_starts:int=4, method:str="nelder-mead", max_evals:int=200) -> None:
+        """
+        Defines the local refinement of the optimal solutions after the optimisation
+
+        Parameters:
+        * `num_starts`: The number of optimal solutions to start the local optimisers from
+        * `method`:     The local optimiser (i.e., nelder-mead, powell, least-squares)
+        * `max_evals`:  The number of evaluations each local optimiser can use
+        """
+        self.refiner = Refiner(self, num_starts, method, max_evals)
+
+    def get_refiner(self) -> Refiner:
+        """
+        Gets the local refinement of the optimal solutions; returns none if undefined
+        """
+        return self.refiner
+
+    def compile_objectives(self) -> None:
+        """
+        Maps each error of each curve to the index of its objective and its weight, so
+        that the errors can be reduced into the objectives with NumPy; the objectives are
+        ordered by their first appearance, so the order is the same on every process;
+        the curves with the same simulation inputs are also grouped, so that they can
+        share a single simulation
         """
         objective_info_list = []
+        curve_dict = {}
         for curve in self.curve_list:
-            error_list = curve.get_error_list()
-            for error in error_list:
+            index_list, weight_list = [], []
+            for error in curve.get_error_list():
                 error_group_key = error.get_group_key(self.group_name, self.group_type, self.group_labels)
-                objective_info_list.append(error_group_key)
-        objective_info_list = list(set(objective_info_list))
-        return objective_info_list
+                if not error_group_key in objective_info_list:
+                    objective_info_list.append(error_group_key)
+                index_list.append(objective_info_list.index(error_group_key))
+                weight_list.append(error.get_weight())
+            curve_dict[curve] = (np.array(index_list, dtype=int), weight_list)
+        index_array = np.concatenate([np.zeros(0, dtype=int)] + [index_array for index_array, _ in curve_dict.values()])
+        
+        # Group the curves by their simulation inputs
+        group_dict = {}
+        for curve in self.curve_list:
+            group_dict.setdefault(self.get_simulation_key(curve), []).append(curve)
+        self.objective_plan = {
+            "info_list":   objective_info_list,
+            "curve_dict":  curve_dict,
+            "count_array": np.bincount(index_array, minlength=len(objective_info_list)),
+            "group_dict":  {curve: tuple(group) for group in group_dict.values() for curve in group},
+        }
+        self.objective_plan["racing_curves"] = self.get_racing_curves()
+
+    def get_simulation_key(self, curve:Curve) -> str:
+        """
+        Gets a key identifying the inputs of the calibration and simulation of a curve, such
+        that curves with the same key have the same predictions; the key consists of the
+        values of the experimental data (except the labels), the custom driver, and the
+        end of the experimental data if the simulations stop at a horizon
+
+        Parameters:
+        * `curve`: The curve
+
+        Returns the key
+        """
+        exp_data = curve.get_exp_data()
+        value_list = sorted([(field, value) for field, value in exp_data.items()
+                             if not field in LABEL_FIELDS and not isinstance(value, (list, np.ndarray))])
+        custom_driver, custom_driver_kwargs = curve.get_custom_driver()
+        if custom_driver != None and not isinstance(custom_driver, str):
+            custom_driver = f"{custom_driver.__module__}.{custom_driver.__name__}"
+        custom_kwargs = None if custom_driver_kwargs == None else sorted(custom_driver_kwargs.items())
+        horizon_list = []
+        if self.horizon_factor != None:
+            horizon_list = [(field, exp_data[field][-1]) for field in ["time", "strain"] if field in exp_data.keys()]
+        return str([value_list, custom_driver, custom_kwargs, horizon_list])
+
+    def get_curve_groups(self, curve_list:list) -> list:
+        """
+        Groups a list of curves by their simulation inputs
+
+        Parameters:
+        * `curve_list`: The list of curves
+
+        Returns a list of the groups of curves, ordered by the first curve of each group
+        """
+        group_dict = self.get_objective_plan()["group_dict"]
+        curve_group_list = []
+        for curve in curve_list:
+            curve_group = [group_curve for group_curve in group_dict[curve] if group_curve in curve_list]
+            if curve_group[0] == curve:
+                curve_group_list.append(curve_group)
+        return curve_group_list
+
+    def get_racing_curves(self) -> list:
+        """
+        Selects the subset of the curves that the parameters are first evaluated on when
+        the evaluations are raced; the subset is representative in that it contains a
+        group of curves for each objective, and is topped up with groups spread evenly
+        across the remaining groups until it reaches the racing fraction
+
+        Returns the list of curves in the subset; returns an empty list if the
+        evaluations are not raced
+        """
+        if self.racing_fraction == None:
+            return []
+        curve_dict = self.objective_plan["curve_dict"]
+        curve_group_list = self.get_curve_groups([curve for curve in self.curve_list if len(curve.get_error_list()) > 0])
+        
+        # Cover each objective with the first group that contributes to it
+        subset_list = []
+        for objective_index in range(len(self.objective_plan["info_list"])):
+            for i, curve_group in enumerate(curve_group_list):
+                if any([objective_index in curve_dict[curve][0] for curve in curve_group]):
+                    if not i in subset_list:
+                        subset_list.append(i)
+                    break
+
+        # Add evenly spread groups until the subset reaches the fraction of the groups
+        num_subset = max(int(np.ceil(self.racing_fraction * len(curve_group_list))), len(subset_list))
+        remaining_list = [i for i in range(len(curve_group_list)) if not i in subset_list]
+        num_added = num_subset - len(subset_list)
+        if num_added > 0:
+            subset_list += [remaining_list[int(j * len(remaining_list) / num_added)] for j in range(num_added)]
+        return [curve for i in sorted(subset_list) for curve in curve_group_list[i]]
+
+    def get_objective_plan(self) -> dict:
+        """
+        Gets the mapping from the errors to the objectives, compiling it if the curves,
+        errors, or grouping have changed since it was last compiled
+        """
+        if self.objective_plan == None:
+            self.compile_objectives()
+        return self.objective_plan
+
+    def get_objective_info_list(self) -> list:
+        """
+        Returns information about the errors
+        """
+        return list(self.get_objective_plan()["info_list"])
+
+    def get_violation_info_list(self) -> list:
+        """
+        Returns information about the constraint violations; the first violation is
+        for the simulations, followed by one violation for each constraint, one violation
+        for the racing (if the evaluations are raced), one violation for the offspring
+        screened out by the surrogate (if defined), and one violation for the constraints
+        on the parameters (if the model has any)
+        """
+        violation_info_list = ["violation_simulation"]
+        for constraint in self.constraint_list:
+            violation_info_list.append(f"violation_{constraint.get_name()}")
+        if self.racing_fraction != None:
+            violation_info_list.append("violation_racing")
+        if self.surrogate != None:
+            violation_info_list.append("violation_screened")
+        if self.model.get_param_constraint_list() != []:
+            violation_info_list.append("violation_params")
+        return violation_info_list
+
+    def get_failed_dict(self, violation_dict:dict) -> dict:
+        """
+        Gets the dictionary of objectives of failed parameters
+
+        Parameters:
+        * `violation_dict`: The dictionary of (positive) violations of the failed parameters
+
+        Returns the dictionary of objectives and violations
+        """
+        failed_dict = {objective_info: BIG_VALUE for objective_info in self.get_objective_info_list()}
+        failed_dict.update(violation_dict)
+        return failed_dict
+
+    def get_param_violations(self, params_list:list) -> list:
+        """
+        Grades how far sets of unfixed parameter values violate the constraints of the
+        model on the parameters, together for all the sets
+
+        Parameters:
+        * `params_list`: The list of sets of unfixed parameter values
+
+        Returns the list of violations, which are zero for the sets that satisfy the constraints
+        """
+        if self.model.get_param_constraint_list() == [] or len(params_list) == 0:
+            return [0.0] * len(params_list)
+        param_matrix = [self.incorporate_fix_param_dict(*params) for params in params_list]
+        return [float(violation) for violation in self.model.get_param_violations(param_matrix)]
+
+    def get_objective_values(self, objective_dict:dict) -> list:
+        """
+        Gets the objective values from a dictionary of objectives (and violations)
 
-    def get_prd_data(self, curve:Curve, *params) -> dict:
+        Parameters:
+        * `objective_dict`: The dictionary of objectives
+
+        Returns the list of objective values, in the order of the objective information
+        """
+        return [objective_dict[objective_info] for objective_info in self.get_objective_info_list()]
+
+    def get_violation_values(self, objective_dict:dict) -> list:
         """
-        Gets the predicted curve; returns none if the data is invalid
+        Gets the constraint violations from a dictionary of objectives (and violations);
+        the violations that are not in the dictionary are taken to be zero (i.e., satisfied)
 
         Parameters:
-        * `curve`:  The curve to predict
-        * `params`: The parameters for the prediction
+        * `objective_dict`: The dictionary of objectives
+
+        Returns the list of violations, in the order of the violation information
+        """
+        return [objective_dict.get(violation_info, 0) for violation_info in self.get_violation_info_list()]
+
+    def get_prd_data(self, curve:Curve, *params, monitor=None) -> dict:
+        """
+        Gets the predicted curve and adds it to the curve; returns none if the data is invalid
+
+        Parameters:
+        * `curve`:   The curve to predict
+        * `params`:  The parameters for the prediction
+        * `monitor`: A function that is periodically given the partial predicted data
+                     and returns true if the simulation should be abandoned
 
         Returns the predicted data
         """
+        prd_data, _ = self.predict(curve, *params, monitor=monitor)
+        if prd_data != None:
+            curve.set_prd_data(prd_data)
+        return prd_data
+
+    def predict(self, curve:Curve, *params, monitor=None) -> tuple:
+        """
+        Calibrates the model for a curve and predicts the curve, without changing the state
+        of the model or the curve, so that curves can be predicted concurrently
+
+        Parameters:
+        * `curve`:   The curve to predict
+        * `params`:  The parameters for the prediction
+        * `monitor`: A function that is periodically given the partial predicted data
+                     and returns true if the simulation should be abandoned
+
+        Returns a tuple containing the predicted data and the calibrated model; the
+        predicted data is none if the data is invalid
+        """
         
         # Fix parameters and calibrate the model
         params = self.incorporate_fix_param_dict(*params)
-        self.model.set_exp_data(curve.get_exp_data())
-        calibrated_model = self.model.get_calibrated_model(*params)
+        calibrated_model = self.model.calibrate(curve.get_exp_data(), *params)
         if calibrated_model == None:
-            return None
+            return None, None
         
-        # Get the driver and prediction
-        model_driver = Driver(curve, calibrated_model)
-        prd_data = model_driver.run()
+        # Get the driver and prediction, reusing stored simulations if possible
+        model_driver = Driver(curve, calibrated_model, self.horizon_factor, self.fidelity)
+        if self.store != None:
+            key = self.store.get_key(self.model.get_name(), params, curve.get_exp_data(), model_driver.get_settings())
+            is_stored, prd_data = self.store.get(key)
+            self.increment_counter("store hits" if is_stored else "store misses")
+            if not is_stored:
+                is_finished, prd_data, is_abandoned = self.run_driver(curve, model_driver, monitor)
+                if is_finished and not is_abandoned:
+                    self.store.add(key, prd_data)
+        else:
+            _, prd_data, _ = self.run_driver(curve, model_driver, monitor)
 
         # Check data has some data points
         if prd_data == None:
-            return
+            return None, calibrated_model
         for field in prd_data.keys():
             if len(prd_data[field]) < MIN_DATA:
-                return
-        
-        # Add the latest prediction to the curve and return the data
-        curve.set_prd_data(prd_data)
-        return prd_data
+                return None, calibrated_model
+        return prd_data, calibrated_model
     
-    def reduce_errors(self, error_list_dict:dict) -> dict:
+    def run_driver(self, curve:Curve, model_driver:Driver, monitor=None) -> tuple:
         """
-        Defines how the errors are reduced
+        Runs the driver of a curve; if a time budget has been defined, the driver is run on
+        a separate process that is killed if the simulation does not finish in time
 
         Parameters:
-        * `error_list_dict`: A dictionary of error values
+        * `curve`:        The curve being simulated
+        * `model_driver`: The driver of the curve
+        * `monitor`:      A function that checks whether the simulation should be abandoned
+
+        Returns a tuple containing whether the simulation finished in time, the predicted
+        data, and whether the simulation was abandoned
+        """
+        if self.timeout == None:
+            prd_data = model_driver.run(monitor)
+            is_finished, is_abandoned = True, model_driver.is_abandoned()
+        else:
+            is_finished, result = run_isolated(lambda: (model_driver.run(monitor), model_driver.is_abandoned()), self.timeout)
+            prd_data, is_abandoned = (None, False) if result == None else result
+            if not is_finished:
+                self.increment_counter(f"timeout {curve.get_exp_data()['file_name']}")
+        if is_abandoned:
+            self.increment_counter("abandoned")
+        return is_finished, prd_data, is_abandoned
+
+    def get_error_values(self, curve:Curve, prd_data:dict, calibrated_model) -> list:
+        """
+        Calculates the weighted errors of a curve
+
+        Parameters:
+        * `curve`:            The curve with the errors
+        * `prd_data`:         The predicted data of the curve
+        * `calibrated_model`: The calibrated model that predicted the curve
+
+        Returns a list of the weighted error values, in the order of the errors of the curve
+        """
+        _, weight_list = self.get_objective_plan()["curve_dict"][curve]
+        error_value_list = []
+        for error, weight in zip(curve.get_error_list(), weight_list):
+            error_value = error.evaluate(prd_data, calibrated_model)
+            error_value_list.append(error_value * weight if error_value != None else BIG_VALUE)
+        return error_value_list
+
+    def get_monitor(self, curve:Curve, simulated_list:list):
+        """
+        Gets a function that checks whether the simulation of a curve should be abandoned,
+        given its partial predicted data; returns none if simulations are not abandoned
+
+        Parameters:
+        * `curve`:          The curve being simulated
+        * `simulated_list`: The list of tuples containing the curves that have already been
+                            simulated and their error values
+        """
+        if self.abandon_margin == None or self.threshold == None:
+            return None
+        threshold = self.threshold * self.abandon_margin
+        simulated_list = list(simulated_list)
+        return lambda prd_data: self.get_lower_bound(curve, prd_data, simulated_list) > threshold
+
+    def get_lower_bound(self, curve:Curve, prd_data:dict, simulated_list:list) -> float:
+        """
+        Calculates a lower bound on the reduced objective while a curve is being simulated;
+        the errors of the curves that have not been simulated yet are taken to be zero
+
+        Parameters:
+        * `curve`:          The curve being simulated
+        * `prd_data`:       The partial predicted data of the curve
+        * `simulated_list`: The list of tuples containing the curves that have already been
+                            simulated and their error values
+
+        Returns the lower bound
+        """
+
+        # Add the known errors and the lower bounds of the errors of the curves sharing the simulation
+        plan = self.get_objective_plan()
+        simulated_curves = [simulated_curve for simulated_curve, _ in simulated_list]
+        for group_curve in plan["group_dict"][curve]:
+            if not group_curve in simulated_curves:
+                simulated_list = simulated_list + [(group_curve, [error.get_lower_bound(prd_data) * weight for error, weight
+                                                                  in zip(group_curve.get_error_list(), plan["curve_dict"][group_curve][1])])]
+        index_array, value_array = self.get_error_arrays(simulated_list)
+
+        # Reduce the errors (counting the errors of the remaining curves as zeros) and objectives
+        objective_dict = self.reduce_errors(index_array, value_array, plan["count_array"])
+        return self.reduce_objectives(self.get_objective_values(objective_dict))
+
+    def get_error_arrays(self, simulated_list:list) -> tuple:
+        """
+        Gathers the error values of simulated curves together with the indexes of their objectives
+
+        Parameters:
+        * `simulated_list`: The list of tuples containing the simulated curves and their error values
+
+        Returns a tuple containing the array of objective indexes and the array of error values
+        """
+        curve_dict = self.get_objective_plan()["curve_dict"]
+        index_array = np.concatenate([np.zeros(0, dtype=int)] + [curve_dict[curve][0] for curve, _ in simulated_list])
+        value_array = np.array([error_value for _, error_value_list in simulated_list for error_value in error_value_list], dtype=float)
+        return index_array, value_array
+
+    def simulate_curves(self, curve_list:list, *params, simulated_list:list=None) -> list:
+        """
+        Simulates a list of curves and calculates their errors; the curves with the same
+        simulation inputs are simulated once and share the predicted data, and the
+        curves are simulated concurrently if more than one curve worker has been defined
+
+        Parameters:
+        * `curve_list`:     The list of curves to simulate
+        * `params`:         The parameters for the prediction
+        * `simulated_list`: The list of tuples containing the curves that have already been
+                            simulated for the parameters and their error values, which are
+                            used to abandon the simulations
+
+        Returns a list of tuples containing the predicted data and error values of each
+        curve; the predicted data is none if the simulation failed or was not run
+        """
+
+        # Group the curves that share their simulations
+        curve_group_list = self.get_curve_groups(curve_list)
+        simulation_dict = {}
+
+        # Simulate the groups on the worker processes
+        if self.curve_workers > 1 and len(curve_group_list) > 1:
+            if self.curve_pool == None:
+                self.curve_pool = create_pool(self, self.curve_workers)
+            simulated_index_list = [(self.curve_list.index(curve), error_value_list)
+                                    for curve, error_value_list in ([] if simulated_list == None else simulated_list)]
+            curve_args_list = [([self.curve_list.index(curve) for curve in curve_group], params, self.threshold, self.fidelity, simulated_index_list)
+                               for curve_group in curve_group_list]
+            result_list = self.curve_pool.map(evaluate_curve, curve_args_list, chunksize=1)
+            for curve_group, (prd_data, error_value_lists, counter_dict) in zip(curve_group_list, result_list):
+                self.add_counter_dict(counter_dict)
+                for curve, error_value_list in zip(curve_group, error_value_lists):
+                    simulation_dict[curve] = (prd_data, error_value_list)
+
+        # Otherwise, simulate the groups one after another (in the order of the
+        # scheduler, if defined) and stop at the first failure
+        else:
+            simulated_list = [] if simulated_list == None else list(simulated_list)
+            if self.scheduler != None:
+                curve_index_list = [self.curve_list.index(curve_group[0]) for curve_group in curve_group_list]
+                curve_group_list = [curve_group_list[i] for i in self.scheduler.order(curve_index_list)]
+            for curve_group in curve_group_list:
+                monitor = self.get_monitor(curve_group[0], simulated_list)
+                start_time = time.perf_counter()
+                prd_data, calibrated_model = self.predict(curve_group[0], *params, monitor=monitor)
+                if self.scheduler != None:
+                    self.scheduler.record(self.curve_list.index(curve_group[0]), curve_group[0].get_exp_data()["file_name"],
+                                          time.perf_counter() - start_time, prd_data == None)
+                if prd_data == None:
+                    break
+                for curve in curve_group:
+                    error_value_list = self.get_error_values(curve, prd_data, calibrated_model)
+                    simulation_dict[curve] = (prd_data, error_value_list)
+                    simulated_list.append((curve, error_value_list))
+        
+        # Count the simulations that were shared
+        num_shared = sum([len(curve_group) - 1 for curve_group in curve_group_list
+                          if simulation_dict.get(curve_group[0], (None,))[0] != None])
+        if num_shared > 0:
+            self.increment_counter("shared simulations", num_shared)
+        return [simulation_dict.get(curve, (None, [])) for curve in curve_list]
+
+    def reduce_errors(self, index_array:np.ndarray, value_array:np.ndarray, count_array:np.ndarray=None) -> dict:
+        """
+        Defines how the errors are reduced; the errors are reduced in the same way as
+        `reduce_list`, but for all the objectives together
+
+        Parameters:
+        * `index_array`: The objective index of each error value
+        * `value_array`: The error values
+        * `count_array`: The number of errors of each objective, for averaging; uses
+                         the number of error values of each objective if undefined
 
         Returns the reduced error values
         """
-        objective_info_list = self.get_objective_info_list()
-        error_value_dict = {}
-        for error_info in objective_info_list:
-            try:
-                error_value_dict[error_info] = reduce_list(error_list_dict[error_info], self.error_reduction_method)
-            except OverflowError:
-                error_value_dict[error_info] = BIG_VALUE
-        return error_value_dict
+        objective_info_list = self.get_objective_plan()["info_list"]
+        num_objectives = len(objective_info_list)
+        if self.error_reduction_method in ["square_sum", "square_average"]:
+            value_array = np.square(value_array)
+        reduced_array = np.bincount(index_array, weights=value_array, minlength=num_objectives).astype(float)
+        if self.error_reduction_method == "average":
+            count_array = np.bincount(index_array, minlength=num_objectives) if count_array is None else count_array
+            reduced_array = np.divide(reduced_array, count_array, out=np.zeros(num_objectives), where=count_array>0)
+        reduced_array[np.isinf(reduced_array)] = BIG_VALUE
+        return {objective_info: float(value) for objective_info, value in zip(objective_info_list, reduced_array)}
     
     def reduce_objectives(self, objective_list:list) -> float:
         """
@@ -355,46 +1223,186 @@ class Controller():
 
         Returns a dictionary of the objectives
         """
+
+        # Reject the parameters if they violate the constraints on the parameters
+        param_violation = self.get_param_violations([params])[0]
+        if param_violation > 0:
+            return self.get_failed_dict({"violation_params": param_violation})
         
-        # Create a dictionary of errors
-        objective_info_list = self.get_objective_info_list()
-        empty_list_list = [[] for _ in range(len(objective_info_list))]
-        error_list_dict = {key: value for key, value in zip(objective_info_list, empty_list_list)}
+        # Reuse the previous evaluation if the parameters have already been evaluated
+        curve_list = [curve for curve in self.curve_list if len(curve.get_error_list()) > 0 or include_validation]
+        if self.cache != None:
+            entry = self.cache.get(params, include_validation)
+            if entry != None:
+                if entry["prd_data_list"] != None:
+                    for curve, prd_data in zip(curve_list, entry["prd_data_list"]):
+                        curve.set_prd_data(prd_data)
+                return dict(entry["objectives"])
+        
+        # Evaluate the parameters and cache the evaluation
+        objective_dict, prd_data_list = self.evaluate_fidelities(curve_list, *params)
+        if self.cache != None:
+            self.cache.add(params, objective_dict, prd_data_list, include_validation)
+        return objective_dict
+
+    def evaluate_fidelities(self, curve_list:list, *params) -> tuple:
+        """
+        Evaluates a set of parameters at each fidelity level, from the lowest to the full
+        fidelity; the parameters are only promoted to the next fidelity level if their
+        reduced objective could reach the threshold (e.g., the worst optimal solution)
+
+        Parameters:
+        * `curve_list`: The list of curves to simulate
+        * `params`:     The parameters for the prediction
+
+        Returns a dictionary of the objectives and a list of the predicted data for each
+        curve, from the highest fidelity level that the parameters were evaluated at; the
+        objectives of the evaluations that stop at a lower fidelity level include the
+        'fidelity' level, so that they are not cached
+        """
+
+        # Evaluate the parameters at the lower fidelity levels
+        for i in range(len(self.fidelity_list)):
+            self.set_fidelity({key: value for key, value in self.fidelity_list[i].items() if key != "margin"})
+            objective_dict, prd_data_list = self.evaluate_objectives(curve_list, *params)
+            self.set_fidelity(None)
+            self.increment_counter(f"fidelity {i+1}")
+            reduced_value = self.reduce_objectives(self.get_objective_values(objective_dict))
+            margin = self.fidelity_list[i]["margin"]
+            if prd_data_list == None or (self.threshold != None and reduced_value > self.threshold * margin):
+                objective_dict["fidelity"] = i + 1
+                return objective_dict, prd_data_list
+        
+        # Evaluate the parameters at full fidelity
+        objective_dict, prd_data_list = self.evaluate_objectives(curve_list, *params)
+        if self.fidelity_list != []:
+            self.increment_counter("fidelity full")
+        return objective_dict, prd_data_list
+
+    def get_racing_stages(self, curve_list:list) -> list:
+        """
+        Splits a list of curves into the stages of the evaluation; the curves are only
+        split into the racing subset and the remaining curves if the evaluations are
+        raced and there is a threshold to race against
+
+        Parameters:
+        * `curve_list`: The list of curves to simulate
+
+        Returns the list of lists of curves for each stage
+        """
+        if self.racing_fraction == None or self.threshold == None:
+            return [curve_list]
+        racing_curves = self.get_objective_plan()["racing_curves"]
+        subset_list = [curve for curve in curve_list if curve in racing_curves]
+        remaining_list = [curve for curve in curve_list if not curve in racing_curves]
+        if subset_list == [] or remaining_list == []:
+            return [curve_list]
+        return [subset_list, remaining_list]
+
+    def estimate_objectives(self, simulated_list:list) -> dict:
+        """
+        Estimates the objectives from the errors of a subset of the curves, by taking the
+        errors of the remaining curves of each objective to be the same as the average
+        error of the subset; the objectives without any errors in the subset are taken
+        to be failed
+
+        Parameters:
+        * `simulated_list`: The list of tuples containing the simulated curves and their error values
+
+        Returns the dictionary of estimated objectives
+        """
+        plan = self.get_objective_plan()
+        index_array, value_array = self.get_error_arrays(simulated_list)
+        count_array = np.bincount(index_array, minlength=len(plan["info_list"]))
+        objective_dict = self.reduce_errors(index_array, value_array)
+        for objective_info, count, full_count in zip(plan["info_list"], count_array, plan["count_array"]):
+            if count == 0:
+                objective_dict[objective_info] = BIG_VALUE
+            elif self.error_reduction_method != "average":
+                objective_dict[objective_info] = min(objective_dict[objective_info] * full_count / count, BIG_VALUE)
+        return objective_dict
+
+    def get_constraint_violations(self, prd_data_dict:dict) -> dict:
+        """
+        Grades the constraints whose curves have all been simulated
+
+        Parameters:
+        * `prd_data_dict`: The dictionary of the simulated curves and their predicted data
+
+        Returns the dictionary of violations of the graded constraints
+        """
+        violation_dict = {}
+        for violation_info, constraint in zip(self.get_violation_info_list()[1:], self.constraint_list):
+            constraint_curve_list = [curve for curve in constraint.get_curve_list() if len(curve.get_error_list()) > 0]
+            if all([curve in prd_data_dict.keys() for curve in constraint_curve_list]):
+                violation_dict[violation_info] = constraint.get_violation([prd_data_dict[curve] for curve in constraint_curve_list])
+        return violation_dict
+
+    def evaluate_objectives(self, curve_list:list, *params) -> tuple:
+        """
+        Simulates the curves and calculates the error values for a set of parameters; if
+        the evaluations are raced, the parameters are first evaluated on the racing subset
+        of the curves, and are discarded if the estimated reduced objective is above the
+        threshold multiplied by the racing margin; the discarded parameters are treated
+        as failed parameters, with a violation graded by how far the estimated reduced
+        objective is above the threshold
+
+        Parameters:
+        * `curve_list`: The list of curves to simulate
+        * `params`:     The parameters for the prediction
+
+        Returns a dictionary of the objectives and a list of the predicted data for each
+        curve; the list of predicted data is none if the parameters failed or were discarded,
+        in which case the dictionary also contains the (positive) violations of the failed
+        parameters
+        """
         
         # Initialise
-        prd_data_list = []
-        failed_dict = {key: value for key, value in zip(objective_info_list, [BIG_VALUE] * len(objective_info_list))}
+        prd_data_dict = {}
+        simulated_list = []
+        violation_info_list = self.get_violation_info_list()
+        stage_list = self.get_racing_stages(curve_list)
+        num_groups_list = [len(self.get_curve_groups(stage_curve_list)) for stage_curve_list in stage_list]
         
-        # Iterate through experimental data
-        for curve in self.curve_list:
+        # Get predictions and add all the errors to the dictionary, one stage at a time
+        for i, stage_curve_list in enumerate(stage_list):
+            simulation_list = self.simulate_curves(stage_curve_list, *params, simulated_list=simulated_list)
+            for curve, (prd_data, error_value_list) in zip(stage_curve_list, simulation_list):
+                if prd_data != None:
+                    curve.set_prd_data(prd_data)
+                    prd_data_dict[curve] = prd_data
+                    simulated_list.append((curve, error_value_list))
+            if len(stage_list) > 1:
+                self.increment_counter("racing simulations run", num_groups_list[i])
+
+            # Fail the parameters if any simulations failed; failed simulations are
+            # graded by the fraction of the curves that could not be simulated
+            if len(prd_data_dict) < sum([len(stage_curve_list) for stage_curve_list in stage_list[:i+1]]):
+                return self.get_failed_dict({violation_info_list[0]: 1 - len(prd_data_dict) / len(curve_list)}), None
             
-            # Ignore validation data
-            error_list = curve.get_error_list()
-            if len(error_list) == 0 and not include_validation:
-                continue
-
-            # Get prediction for training data
-            prd_data = self.get_prd_data(curve, *params)
-            if prd_data == None:
-                return failed_dict
-
-            # Gets all the errors and add to dictionary
-            for error in error_list:
-                error_value = error.get_value(prd_data)
-                error_value = error_value * error.get_weight() if error_value != None else BIG_VALUE
-                error_group_key = error.get_group_key(self.group_name, self.group_type, self.group_labels)
-                error_list_dict[error_group_key].append(error_value)
+            # Discard the parameters if their estimated objectives cannot reach the threshold
+            if i < len(stage_list) - 1:
+                objective_dict = self.estimate_objectives(simulated_list)
+                racing_threshold = self.threshold * self.racing_margin
+                estimated_value = self.reduce_objectives(self.get_objective_values(objective_dict))
+                if estimated_value > racing_threshold:
+                    violation_dict = self.get_constraint_violations(prd_data_dict)
+                    if not any([violation > 0 for violation in violation_dict.values()]):
+                        violation_dict = {"violation_racing": (estimated_value - racing_threshold) / max(abs(racing_threshold), 1e-12)}
+                    self.increment_counter("racing discarded")
+                    self.increment_counter("racing simulations saved", sum(num_groups_list[i+1:]))
+                    return self.get_failed_dict(violation_dict), None
+                self.increment_counter("racing promoted")
 
-        # Checks all the constraints
-        for constraint in self.constraint_list:
-            curve_list = constraint.get_curve_list()
-            prd_data_list = [curve.get_prd_data() for curve in curve_list if len(curve.get_error_list()) > 0]
-            if not constraint.check(prd_data_list):
-                return failed_dict
+        # Grade all the constraints, and fail the parameters if any are violated
+        violation_dict = self.get_constraint_violations(prd_data_dict)
+        if any([violation > 0 for violation in violation_dict.values()]):
+            return self.get_failed_dict(violation_dict), None
         
-        # Reduce and return errors
-        objective_dict = self.reduce_errors(error_list_dict)
-        return objective_dict
+        # Reduce and return errors, in the order of the curves
+        simulated_list = sorted(simulated_list, key=lambda simulated: curve_list.index(simulated[0]))
+        objective_dict = self.reduce_errors(*self.get_error_arrays(simulated_list))
+        return objective_dict, [prd_data_dict[curve] for curve in curve_list]
 
     def plot_exp_curves(self, type:str, file_path:str="", x_log:bool=False, y_log:bool=False) -> None:
         """
@@ -0,0 +1,209 @@
+"""
+ Title:         Islands
+ Description:   For running several populations in parallel with migration
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import multiprocessing, traceback, warnings
+import numpy as np
+from pymoo.core.population import Population
+from moga_neml.optimise.moga import MOGA
+from moga_neml.optimise.problem import Problem
+from moga_neml.optimise.recorder import Recorder
+
+# The Island Recorder class
+class IslandRecorder:
+
+    def __init__(self, recorder:Recorder, population:int):
+        """
+        Class for collecting the evaluations of an island, so that they can be
+        sent to the recorder of the main process; the optimal solutions of the
+        island are still tracked to get the threshold for abandoning simulations
+
+        Parameters:
+        * `recorder`:   The (copied) recorder of the main process
+        * `population`: The size of the population of the island; the copied recorder
+                        holds as many optimal solutions as the populations of all the
+                        islands, so it is resized to give the threshold of the island
+        """
+        self.recorder    = recorder
+        self.record_list = []
+
+        # Track as many optimal solutions as the population of the island
+        self.recorder.population = population
+        self.recorder.optimal_solution_list = self.recorder.optimal_solution_list[:population]
+
+    def update_iteration(self, param_dict:dict, objective_dict:dict) -> None:
+        """
+        Collects an evaluation
+
+        Parameters:
+        * `param_dict`:     The dictionary of parameters
+        * `objective_dict`: The dictionary of objective functions
+        """
+        self.recorder.update_optimal_solution(param_dict, objective_dict)
+        self.record_list.append((param_dict, objective_dict))
+
+    def get_threshold(self) -> float:
+        """
+        Gets the reduced objective of the worst optimal solution of the island
+        """
+        return self.recorder.get_threshold()
+
+    def pop_record_list(self) -> list:
+        """
+        Gets and clears the collected evaluations
+        """
+        record_list = self.record_list
+        self.record_list = []
+        return record_list
+
+# The Islands class
+class Islands:
+
+    def __init__(self, problem:Problem, num_gens:int, init_pop:int, offspring:int, crossover:float,
+                 mutation:float, num_islands:int, interval:int=10, num_migrants:int=5):
+        """
+        Class for running several independent populations (i.e., islands), each on its
+        own process and with its own seed, which swap their best non-dominated solutions
+        in a ring after every few generations
+
+        Parameters:
+        * `problem`:      The problem to optimise
+        * `num_gens`:     The number of generations to run each island
+        * `init_pop`:     The size of the initial population of each island
+        * `offspring`:    The size of the offspring of each island
+        * `crossover`:    The crossover probability
+        * `mutation`:     The mutation probability
+        * `num_islands`:  The number of islands
+        * `interval`:     The number of generations between each migration
+        * `num_migrants`: The number of solutions sent to the next island in each migration
+        """
+        self.problem      = problem
+        self.controller   = problem.get_controller()
+        self.recorder     = problem.get_recorder()
+        self.moga_args    = (num_gens, init_pop, offspring, crossover, mutation)
+        self.num_gens     = num_gens
+        self.num_islands  = num_islands
+        self.interval     = interval
+        self.num_migrants = num_migrants
+
+    def run_island(self, connection, seed:int) -> None:
+        """
+        Runs an island on the current (child) process; the island repeatedly receives
+        the number of generations to run and the immigrants, and sends back its
+        evaluations, counters, and emigrants
+
+        Parameters:
+        * `connection`: The connection to the main process
+        * `seed`:       The seed of the island
+        """
+        try:
+
+            # Initialise the island with its own seed
+            np.random.seed(seed)
+            recorder = IslandRecorder(self.recorder, self.moga_args[1])
+            problem = Problem(self.controller, recorder, self.problem.get_evaluator())
+            moga = MOGA(problem, *self.moga_args)
+            algo = moga.algo
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                algo.setup(problem, termination=("n_gen", self.num_gens), verbose=False, seed=seed)
+
+                # Run the generations and migrate the solutions
+                while True:
+                    message = connection.recv()
+                    if message == None:
+                        return
+                    num_gens, immigrants = message
+                    if immigrants != None:
+                        population = Population.merge(algo.pop, Population.new(X=immigrants[0], F=immigrants[1], G=immigrants[2]))
+                        algo.pop = algo.survival.do(problem, population, n_survive=moga.init_pop,
+                                                    algorithm=algo, random_state=algo.random_state)
+                    for _ in range(num_gens):
+                        if algo.has_next():
+                            algo.next()
+                    connection.send((recorder.pop_record_list(), self.controller.pop_counter_dict(),
+                                     self.get_emigrants(algo.pop), algo.has_next()))
+
+        # Send back any errors
+        except Exception:
+            connection.send(RuntimeError(f"An island failed:\n{traceback.format_exc()}"))
+        finally:
+            connection.close()
+
+    def get_emigrants(self, population:Population) -> tuple:
+        """
+        Gets the best non-dominated solutions of a population, ordered by their
+        reduced objectives
+
+        Parameters:
+        * `population`: The population of the island
+
+        Returns a tuple containing the parameter, objective, and violation values of the solutions
+        """
+        rank_array = population.get("rank")
+        index_list = [i for i in range(len(population)) if rank_array[i] == 0]
+        reduced_list = [self.controller.reduce_objectives(list(population[i].F)) for i in index_list]
+        index_list = [index_list[j] for j in np.argsort(reduced_list)[:self.num_migrants]]
+        return population.get("X")[index_list], population.get("F")[index_list], population.get("G")[index_list]
+
+    def optimise(self, state:dict=None) -> None:
+        """
+        Runs the islands and records their evaluations on the main process; the
+        termination criteria of the controller (if defined) are checked after
+        each migration
+
+        Parameters:
+        * `state`: Not supported; the islands cannot be resumed
+        """
+        if state != None:
+            raise ValueError("The islands cannot be resumed!")
+
+        # Start the islands on forked processes, with different seeds
+        context = multiprocessing.get_context("fork")
+        seed_list = np.random.randint(0, 2**31 - 1, self.num_islands)
+        connection_list, process_list = [], []
+        for seed in seed_list:
+            parent_connection, child_connection = context.Pipe()
+            process = context.Process(target=self.run_island, args=(child_connection, int(seed)))
+            process.start()
+            child_connection.close()
+            connection_list.append(parent_connection)
+            process_list.append(process)
+
+        # Run the islands until they have all finished
+        if self.controller.get_terminator() != None:
+            self.controller.get_terminator().start()
+        immigrants_list = [None] * self.num_islands
+        try:
+            has_next = True
+            while has_next:
+                for connection, immigrants in zip(connection_list, immigrants_list):
+                    connection.send((self.interval, immigrants))
+                result_list = [connection.recv() for connection in connection_list]
+                for result in result_list:
+                    if isinstance(result, Exception):
+                        raise result
+
+                # Record the evaluations and pass the emigrants to the next island
+                has_next = False
+                for i, (record_list, counter_dict, emigrants, island_has_next) in enumerate(result_list):
+                    for param_dict, objective_dict in record_list:
+                        self.recorder.update_iteration(param_dict, objective_dict)
+                    self.controller.add_counter_dict(counter_dict)
+                    immigrants_list[(i + 1) % self.num_islands] = emigrants
+                    has_next = has_next or island_has_next
+                has_next = has_next and not self.recorder.is_terminated()
+
+        # Stop the islands
+        finally:
+            for connection in connection_list:
+                try:
+                    connection.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in process_list:
+                process.join()
@@ -7,12 +7,16 @@
 
 # Libraries
 import numpy as np
-import warnings
+import os, pickle, warnings
 from pymoo.algorithms.moo.nsga2 import NSGA2
+from pymoo.core.population import Population
 from pymoo.operators.crossover.sbx import SBX
 from pymoo.operators.mutation.pm import PolynomialMutation
-from pymoo.optimize import minimize
 from moga_neml.optimise.problem import Problem
+from moga_neml.optimise.repairer import Repairer
+
+# Constants
+POP_FIELDS = ["X", "F", "G", "H", "rank", "crowding"]
 
 # The Multi-Curve Genetic Algorithm (MOGA) class
 class MOGA:
@@ -40,73 +44,133 @@ class MOGA:
         self.offspring  = offspring
         self.crossover  = crossover
         self.mutation   = mutation
+        self.checkpoint_path     = None
+        self.checkpoint_interval = 0
 
         # Gets initialised parameters
         init_param_dict = self.controller.get_init_param_dict()
-        population = self.get_population(init_param_dict)
+        population = self.controller.get_encoder().encode(self.get_population(init_param_dict))
 
-        # Define algorithm
+        # Define algorithm, repairing the solutions that violate the constraints on the parameters
+        repairer = None if self.controller.get_model().get_param_constraint_list() == [] else Repairer(self.controller)
         self.algo = NSGA2(
             pop_size     = init_pop,
             n_offsprings = offspring,
             sampling     = population,
             crossover    = SBX(prob=crossover, prob_var=1.0), # simulated binary crossover 
             mutation     = PolynomialMutation(prob=mutation), # polynomial mutation
+            repair       = repairer,
             eliminate_duplicates = True
         )
 
-    def get_population(self, init_param_dict:dict) -> tuple:
+    def get_population(self, init_param_dict:dict) -> np.ndarray:
         """
-        Given a set of parameters, returns a population with some deviation
+        Given a set of parameters, returns a population sampled by the sampler
+        of the controller (which samples around the initial values by default)
 
         Parameters:
         * `init_param_dict`: The dictionary of initial parameter values
 
         Returns a population with the initial parameter values applied
         """
+        init_list = [init_param_dict.get(param_name) for param_name in self.param_dict.keys()]
+        return self.controller.get_sampler().sample(self.init_pop, init_list)
 
-        # Initialise
-        mean_list  = []
-        stdev_list = []
-        
-        # Determine mean and std values
-        for param_name in self.param_dict.keys():
-            
-            # If the user defined a starting value
-            if param_name in init_param_dict.keys():
-                mean_list.append(init_param_dict[param_name])
-                stdev_list.append(0.1 * init_param_dict[param_name])
-                # stdev_list.append(0)
-            
-            # Otherwise, define normal sampling
-            else:
-                mid_point = (self.param_dict[param_name]["u_bound"] + self.param_dict[param_name]["l_bound"]) / 2
-                bound_range = self.param_dict[param_name]["u_bound"] - self.param_dict[param_name]["l_bound"]
-                mean_list.append(mid_point)
-                stdev_list.append(bound_range/4) # std ~= range / 4
-
-        # Create the population
-        param_population = np.random.normal(
-            loc   = np.array(mean_list),
-            scale = np.array(stdev_list),
-            size  = (self.init_pop, len(self.param_dict.keys())),
-        )
+    def set_checkpoint(self, checkpoint_path:str, checkpoint_interval:int) -> None:
+        """
+        Periodically saves the state of the optimisation so that it can be resumed
+
+        Parameters:
+        * `checkpoint_path`:     The path to save the state to
+        * `checkpoint_interval`: The number of generations between each save
+        """
+        self.checkpoint_path     = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+
+    def get_state(self) -> dict:
+        """
+        Gets the state of the optimisation, including the population, random number
+        generators, generation counters, and the state of the recorder
+
+        Returns the state as a dictionary
+        """
+        population = self.algo.pop
+        return {
+            "signature":       self.controller.get_signature(),
+            "hyperparameters": {"num_gens": self.num_gens, "population": self.init_pop, "offspring": self.offspring,
+                                "crossover": self.crossover, "mutation": self.mutation},
+            "population":      {field: population.get(field) for field in POP_FIELDS},
+            "evaluated":       sorted(set().union(*[individual.evaluated for individual in population])),
+            "n_iter":          self.algo.n_iter,
+            "n_eval":          self.algo.evaluator.n_eval,
+            "random_state":    self.algo.random_state.bit_generator.state,
+            "np_random_state": np.random.get_state(),
+            "recorder":        self.problem.get_recorder().get_state(),
+            "counters":        dict(self.controller.get_counter_dict()),
+            "surrogate":       None if self.controller.get_surrogate() == None else self.controller.get_surrogate().get_state(),
+            "terminator":      None if self.controller.get_terminator() == None else self.controller.get_terminator().get_state(),
+        }
+
+    def set_state(self, state:dict) -> None:
+        """
+        Restores the state of the optimisation; the algorithm must already be set up
+
+        Parameters:
+        * `state`: The state of the optimisation (from `get_state`)
+        """
+
+        # Initialise the algorithm with the evaluated population (without evaluating it again)
+        population = Population.new(**state["population"])
+        population.apply(lambda individual: individual.evaluated.update(state["evaluated"]))
+        self.algo.initialization.sampling = population
+        self.algo.next()
         
-        # Clamp the population by the bounds
-        for i in range(len(param_population)):
-            for j in range(len(self.param_dict.keys())):
-                param_name = list(self.param_dict.keys())[j]
-                l_bound = self.param_dict[param_name]["l_bound"]
-                u_bound = self.param_dict[param_name]["u_bound"]
-                param_population[i][j] = max(min(param_population[i][j], u_bound), l_bound)
-                
-        # Return the population
-        return param_population
-
-    def optimise(self) -> None:
+        # Restore the population order, counters, and random number generators
+        self.algo.pop = population
+        self.algo.n_iter = state["n_iter"]
+        self.algo.evaluator.n_eval = state["n_eval"]
+        self.algo.termination.update(self.algo)
+        self.algo.random_state.bit_generator.state = state["random_state"]
+        np.random.set_state(state["np_random_state"])
+        self.problem.get_recorder().set_state(state["recorder"])
+        self.controller.add_counter_dict(state["counters"])
+        if self.controller.get_surrogate() != None and state["surrogate"] != None:
+            self.controller.get_surrogate().set_state(state["surrogate"])
+        if self.controller.get_terminator() != None and state.get("terminator") != None:
+            self.controller.get_terminator().set_state(state["terminator"])
+
+    def save_state(self) -> None:
+        """
+        Saves the state of the optimisation to the checkpoint path; the state is
+        written to a temporary file first so that an interrupted save does not
+        corrupt the previous checkpoint
+        """
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "wb") as file:
+            pickle.dump(self.get_state(), file)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def optimise(self, state:dict=None) -> None:
         """
-        Runs the genetic optimisation
+        Runs the genetic optimisation, until the number of generations have been completed
+        or the termination criteria of the controller (if defined) have been met
+
+        Parameters:
+        * `state`: The state of a previous optimisation to resume from (from `get_state`)
         """
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            minimize(self.problem, self.algo, ("n_gen", self.num_gens), verbose=False, seed=None)
+            if self.controller.get_terminator() != None:
+                self.controller.get_terminator().start()
+            self.algo.setup(self.problem, termination=("n_gen", self.num_gens), verbose=False, seed=None)
+            if state != None:
+                self.set_state(state)
+            while self.algo.has_next():
+                self.algo.next()
+                num_gens_completed = self.algo.n_iter - 1
+                is_terminated = self.problem.get_recorder().is_terminated()
+                if self.checkpoint_path != None and self.checkpoint_interval > 0 and \
+                    (num_gens_completed % self.checkpoint_interval == 0 or not self.algo.has_next() or is_terminated):
+                    self.save_state()
+                if is_terminated:
+                    break
@@ -8,38 +8,44 @@
 # Libraries
 import warnings
 import numpy as np
-from pymoo.core.problem import ElementwiseProblem
-from moga_neml.optimise.controller import Controller
+from pymoo.core.problem import Problem as PymooProblem
+from moga_neml.evaluators.__evaluator__ import __Evaluator__, create_evaluator
+from moga_neml.optimise.controller import Controller, BIG_VALUE
 from moga_neml.optimise.recorder import Recorder
 
 # The Problem class
-class Problem(ElementwiseProblem):
+class Problem(PymooProblem):
 
-    def __init__(self, controller:Controller, recorder:Recorder):
+    def __init__(self, controller:Controller, recorder:Recorder, evaluator:__Evaluator__=None):
         """
-        Class for defining the problem
+        Class for defining the problem; the parameter sets of each population
+        are evaluated together as a batch
 
         Parameters:
         * `controller`: The controller used to control the optimisation
         * `recorder`:   The recorder used to record the results during the optimisation
+        * `evaluator`:  The evaluator used to evaluate each population; evaluates
+                        the parameter sets serially if undefined
         """
 
         # Initialise
         self.controller = controller
         self.recorder   = recorder
+        self.evaluator  = create_evaluator("serial", controller) if evaluator == None else evaluator
         
         # Get parameter information
         unfix_param_dict = self.controller.get_unfix_param_dict()
-        l_bound_list = [unfix_param_dict[param_name]["l_bound"] for param_name in unfix_param_dict.keys()]
-        u_bound_list = [unfix_param_dict[param_name]["u_bound"] for param_name in unfix_param_dict.keys()]
         self.unfixed_param_names = list(unfix_param_dict.keys())
+        self.encoder = self.controller.get_encoder()
         
-        # Define the element wise problem
+        # Define the batched problem, which is searched in the encoded space and has
+        # an inequality constraint for the simulations and for each constraint
         super().__init__(
-            n_var = len(unfix_param_dict.keys()),
-            n_obj = len(self.controller.get_objective_info_list()),
-            xl    = np.array(l_bound_list),
-            xu    = np.array(u_bound_list),
+            n_var        = len(unfix_param_dict.keys()),
+            n_obj        = len(self.controller.get_objective_info_list()),
+            n_ieq_constr = len(self.controller.get_violation_info_list()),
+            xl    = np.zeros(len(unfix_param_dict.keys())),
+            xu    = np.ones(len(unfix_param_dict.keys())),
         )
     
     def get_controller(self) -> Controller:
@@ -53,7 +59,35 @@ class Problem(ElementwiseProblem):
         Gets the recorder
         """
         return self.recorder
+
+    def get_evaluator(self) -> __Evaluator__:
+        """
+        Gets the evaluator
+        """
+        return self.evaluator
     
+    def encode(self, params:tuple) -> tuple:
+        """
+        Encodes the values of the unfixed parameters into the space searched by the optimiser
+
+        Parameters:
+        * `params`: The parameter values
+
+        Returns the encoded parameter values
+        """
+        return tuple(float(value) for value in self.encoder.encode(params))
+
+    def decode(self, unit_params:tuple) -> tuple:
+        """
+        Decodes the values of the unfixed parameters from the space searched by the optimiser
+
+        Parameters:
+        * `unit_params`: The encoded parameter values
+
+        Returns the parameter values
+        """
+        return tuple(float(value) for value in self.encoder.decode(unit_params))
+
     def get_param_value_dict(self, params:tuple) -> dict:
         """
         Creates the parameter dictionary
@@ -70,24 +104,77 @@ class Problem(ElementwiseProblem):
             param_value_dict[param_name] = params[i]
         return param_value_dict
     
-    def _evaluate(self, params:tuple, out:dict, *args, **kwargs) -> None:
+    def evaluate_screened(self, params_list:list) -> list:
+        """
+        Evaluates the parameter sets selected by the surrogate (or all of them if the
+        surrogate has not been defined); the parameter sets that are not selected are
+        given the objectives of a failed simulation and a violation for being screened
+        out, so that they do not survive, and the parameter sets that violate the
+        constraints on the parameters are graded without being evaluated
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns a list of objective dictionaries in the same order as the parameter sets
+        """
+
+        # Grade the constraints on the parameters for all the parameter sets together
+        violation_list = self.controller.get_param_violations(params_list)
+        feasible_list = [i for i in range(len(params_list)) if violation_list[i] == 0]
+
+        # Evaluate the selected parameter sets
+        surrogate = self.controller.get_surrogate()
+        index_list = feasible_list
+        if surrogate != None:
+            index_list = [feasible_list[i] for i in surrogate.select([params_list[i] for i in feasible_list])]
+        evaluated_list = self.evaluator.evaluate([params_list[i] for i in index_list])
+        
+        # Combine the evaluated, infeasible, and screened out parameter sets
+        error_value_dict_list = [self.controller.get_failed_dict({"violation_screened": 1}) if violation_list[i] == 0
+                                 else self.controller.get_failed_dict({"violation_params": violation_list[i]})
+                                 for i in range(len(params_list))]
+        for i, error_value_dict in zip(index_list, evaluated_list):
+            error_value_dict_list[i] = error_value_dict
+            if surrogate != None:
+                objective_list = self.controller.get_objective_values(error_value_dict)
+                surrogate.add(params_list[i], objective_list, max(objective_list) >= BIG_VALUE)
+        return error_value_dict_list
+
+    def _evaluate(self, params_matrix:np.ndarray, out:dict, *args, **kwargs) -> None:
         """
         Minimises expression "F" such that the expression "G <= 0" is satisfied
 
         Parameters:
-        * `params`: A list of the parameter values
-        * `out`:    The dictionary to attach the error values
+        * `params_matrix`: A matrix of encoded parameter values, with one row for each solution
+        * `out`:           The dictionary to attach the error values
         """
 
         # Ignore warnings
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             
-            # Get error values
-            error_value_dict = self.controller.calculate_objectives(*params)
-            out["F"] = list(error_value_dict.values())
+            # Get error values for the whole population, abandoning hopeless simulations
+            self.controller.set_threshold(self.recorder.get_threshold())
+            params_list = [tuple(float(value) for value in params) for params in self.encoder.decode(params_matrix)]
+            error_value_dict_list = self.evaluate_screened(params_list)
+            out["F"] = np.array([self.controller.get_objective_values(error_value_dict) for error_value_dict in error_value_dict_list])
+            out["G"] = np.array([self.controller.get_violation_values(error_value_dict) for error_value_dict in error_value_dict_list])
             
-            # Get parameter values and update recorder
-            param_value_dict = {key: value for key, value in zip(self.unfixed_param_names, params)}
-            self.recorder.update_iteration(param_value_dict, error_value_dict)
-            
\ No newline at end of file
+            # Get parameter values and update recorder in order, without recording the
+            # offspring screened out by the surrogate since they were not evaluated
+            for params, error_value_dict in zip(params_list, error_value_dict_list):
+                if error_value_dict.get("violation_screened", 0) > 0:
+                    self.recorder.update_screened()
+                else:
+                    self.record(params, error_value_dict)
+
+    def record(self, params:tuple, error_value_dict:dict) -> None:
+        """
+        Records an evaluated parameter set
+
+        Parameters:
+        * `params`:           The values of the unfixed parameters
+        * `error_value_dict`: The dictionary of objectives
+        """
+        param_value_dict = {key: value for key, value in zip(self.unfixed_param_names, params)}
+        self.recorder.update_iteration(param_value_dict, error_value_dict)
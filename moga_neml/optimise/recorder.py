@@ -14,6 +14,7 @@ from moga_neml.helper.data import  get_thinned_list
 from moga_neml.helper.experiment import get_labels_list
 from moga_neml.optimise.controller import Controller
 from moga_neml.helper.general import get_file_path_writable, get_file_path_exists
+from moga_neml.helper.transform import get_transform_name
 
 # The Recorder class
 class Recorder:
@@ -43,6 +44,7 @@ class Recorder:
         # Initialise internal variables
         self.curve_list          = controller.get_curve_list()
         self.num_evals_completed = 0
+        self.num_screened        = 0
         self.num_gens_completed  = 0
         self.start_time          = time.time()
         self.update_time         = self.start_time
@@ -68,7 +70,9 @@ class Recorder:
         for param_name in param_dict.keys():
             l_bound = float(param_dict[param_name]["l_bound"])
             u_bound = float(param_dict[param_name]["u_bound"])
-            self.param_bound_info_list.append("[{:0.4}, {:0.4}]".format(l_bound, u_bound))
+            transform = param_dict[param_name].get("transform", "linear")
+            transform_info = "" if transform == "linear" else f" ({get_transform_name(transform)})"
+            self.param_bound_info_list.append("[{:0.4}, {:0.4}]".format(l_bound, u_bound) + transform_info)
         
         # Summarise data information
         self.data_info_list = []
@@ -90,7 +94,7 @@ class Recorder:
         self.loss_history = {"generations": [], "loss": []}
     
     def define_hyperparameters(self, num_gens:int, population:int, offspring:int,
-                               crossover:float, mutation:float) -> None:
+                               crossover:float, mutation:float, islands:int=1) -> None:
         """
         Define MOGA hyperparameters
 
@@ -100,12 +104,17 @@ class Recorder:
         * `offspring`:  The size of the offspring
         * `crossover`:  The crossover probability
         * `mutation`:   The mutation probability
+        * `islands`:    The number of islands; the evaluations of all the islands
+                        are merged, so a generation covers every island
         """
         self.num_gens   = num_gens
-        self.population = population
-        self.offspring  = offspring
+        self.population = population * islands
+        self.offspring  = offspring * islands
         hp_names        = ["num_gens", "population", "offspring", "crossover", "mutation"]
         hp_values       = [num_gens, population, offspring, crossover, mutation]
+        if islands > 1:
+            hp_names.append("islands")
+            hp_values.append(islands)
         self.moga_summary = [f"{hp_names[i]} ({hp_values[i]})" for i in range(len(hp_names))]
     
     def update_optimal_solution(self, param_dict:dict, objective_dict:dict) -> None:
@@ -119,7 +128,7 @@ class Recorder:
 
         # Get the solution
         reduction_method = self.controller.get_objective_reduction_method()
-        objective_values = list(objective_dict.values())
+        objective_values = self.controller.get_objective_values(objective_dict)
         reduced_value    = self.controller.reduce_objectives(objective_values)
         solution         = {"params": param_dict, "objectives": objective_dict, reduction_method: reduced_value}
         
@@ -151,13 +160,82 @@ class Recorder:
 
         # Update optimisation progress
         self.num_evals_completed += 1
-        self.num_gens_completed = (self.num_evals_completed - self.population) / self.offspring + 1
         self.update_optimal_solution(param_dict, objective_dict)
-        
-        # Record results after X generations
+        self.update_progress()
+
+    def update_screened(self) -> None:
+        """
+        Updates the progress after an offspring is screened out by the surrogate; the
+        offspring is not evaluated, so it is not counted as an evaluation or recorded
+        """
+        self.num_screened += 1
+        self.update_progress()
+
+    def update_progress(self) -> None:
+        """
+        Updates the number of generations completed from the evaluated and screened
+        out solutions, and records the results after X generations
+        """
+        num_solutions = self.num_evals_completed + self.num_screened
+        self.num_gens_completed = (num_solutions - self.population) / self.offspring + 1
         if self.num_gens_completed > 0 and self.num_gens_completed % self.interval == 0:
             self.record_results()
 
+    def get_optimal_solution_list(self) -> list:
+        """
+        Gets the optimal solutions, ordered from the lowest to the highest reduced objective
+        """
+        return self.optimal_solution_list
+
+    def get_threshold(self) -> float:
+        """
+        Gets the reduced objective of the worst optimal solution, once there are as many
+        optimal solutions as the population; returns none otherwise
+        """
+        if len(self.optimal_solution_list) < self.population:
+            return None
+        reduction_method = self.controller.get_objective_reduction_method()
+        return self.optimal_solution_list[-1][reduction_method]
+
+    def is_terminated(self) -> bool:
+        """
+        Checks the termination criteria of the controller (if defined) against the
+        progress and optimal solutions recorded so far
+        """
+        terminator = self.controller.get_terminator()
+        if terminator == None or self.optimal_solution_list == []:
+            return False
+        objective_list = [self.controller.get_objective_values(solution["objectives"]) for solution in self.optimal_solution_list]
+        return terminator.check(self.num_gens_completed, self.num_evals_completed, self.get_opt_error(), objective_list)
+
+    def get_state(self) -> dict:
+        """
+        Gets the state of the recorder so that it can be restored when
+        resuming an optimisation; returns the state as a dictionary
+        """
+        return {
+            "num_evals_completed":   self.num_evals_completed,
+            "num_screened":          self.num_screened,
+            "num_gens_completed":    self.num_gens_completed,
+            "start_time_str":        self.start_time_str,
+            "optimal_solution_list": deepcopy(self.optimal_solution_list),
+            "loss_history":          deepcopy(self.loss_history),
+        }
+
+    def set_state(self, state:dict) -> None:
+        """
+        Restores the state of the recorder
+
+        Parameters:
+        * `state`: The state of the recorder (from `get_state`)
+        """
+        self.num_evals_completed   = state["num_evals_completed"]
+        self.num_screened          = state.get("num_screened", 0)
+        self.num_gens_completed    = state["num_gens_completed"]
+        self.start_time_str        = state["start_time_str"]
+        self.optimal_solution_list = deepcopy(state["optimal_solution_list"])
+        self.loss_history          = deepcopy(state["loss_history"])
+
     def record_results(self) -> None:
         """
         Updates the results after X MOGA iterations
@@ -182,7 +260,7 @@ class Recorder:
         Gets the optimisation summary;
         returns the dictionary
         """
-        return {
+        summary_dict = {
             "Progress":     [f"{round(self.num_gens_completed)}/{self.num_gens}"],
             "Start / End":  [self.start_time_str, time.strftime("%A, %D, %H:%M:%S", time.localtime())],
             "Model":        [self.controller.get_model().get_name()],
@@ -193,6 +271,31 @@ class Recorder:
             "MOGA Summary": self.moga_summary,
             "Reduction":    self.reduction_method_list,
         }
+        cache = self.controller.get_cache()
+        if cache != None:
+            summary_dict["Evaluation Cache"] = cache.get_summary()
+        store = self.controller.get_store()
+        if store != None:
+            summary_dict["Simulation Store"] = store.get_summary(self.controller.get_counter_dict())
+        surrogate = self.controller.get_surrogate()
+        if surrogate != None:
+            summary_dict["Surrogate"] = surrogate.get_summary()
+        terminator = self.controller.get_terminator()
+        if terminator != None:
+            summary_dict["Termination"] = terminator.get_summary()
+        refiner = self.controller.get_refiner()
+        if refiner != None:
+            summary_dict["Refinement"] = refiner.get_summary()
+        racing_summary = self.controller.get_racing_summary()
+        if racing_summary != None:
+            summary_dict["Racing"] = racing_summary
+        scheduler = self.controller.get_scheduler()
+        if scheduler != None:
+            summary_dict["Scheduling"] = scheduler.get_summary()
+        counter_dict = self.controller.get_counter_dict()
+        if counter_dict != {}:
+            summary_dict["Counters"] = [f"{name} ({counter_dict[name]})" for name in sorted(counter_dict.keys())]
+        return summary_dict
     
     def get_result_dict(self) -> dict:
         """
@@ -430,14 +533,11 @@ class Recorder:
         curve_list = self.controller.get_curve_list()
         for i in range(len(curve_list)):
 
-            # Sets the experimental data to the curve
+            # Get calibrated model for the experimental data of the curve
             exp_data = curve_list[i].get_exp_data()
-            self.controller.model.set_exp_data(exp_data)
-
-            # Get calibrated model
             params = self.get_opt_params().values() if custom_params == None else custom_params
             params = self.controller.incorporate_fix_param_dict(*params)
-            calibrated_model = self.controller.model.get_calibrated_model(*params)
+            calibrated_model = self.controller.model.calibrate(exp_data, *params)
             
             # Saves the model
             model_path = get_file_path_writable(f"{self.results_dir}/opt_model_{i+1}", "xml")
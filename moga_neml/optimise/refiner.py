@@ -0,0 +1,180 @@
+"""
+ Title:         Refiner
+ Description:   For refining the optimal solutions with local optimisers
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import math, warnings
+import numpy as np
+from scipy.optimize import minimize, least_squares
+from moga_neml.helper.parallel import create_pool, refine_params
+
+# Constants
+METHOD_LIST = ["nelder-mead", "powell", "least-squares"]
+DIFF_STEP   = 1e-3
+
+# Raised when a local optimiser has used up its evaluations
+class BudgetExhausted(Exception):
+    pass
+
+# The Refiner class
+class Refiner:
+
+    def __init__(self, controller, num_starts:int=4, method:str="nelder-mead", max_evals:int=200):
+        """
+        Class for refining the best solutions of the optimisation with local optimisers;
+        the local optimisers search the same encoded space as the genetic optimiser
+
+        Parameters:
+        * `controller`: The controller used to calculate the objectives
+        * `num_starts`: The number of optimal solutions to start the local optimisers from
+        * `method`:     The local optimiser (i.e., nelder-mead, powell, least-squares)
+        * `max_evals`:  The number of evaluations each local optimiser can use
+        """
+        if not method in METHOD_LIST:
+            raise ValueError(f"The refinement method '{method}' is not one of {METHOD_LIST}!")
+        self.controller = controller
+        self.num_starts = num_starts
+        self.method     = method
+        self.max_evals  = max_evals
+
+        # Get the names and encoder of the unfixed parameters
+        self.param_names = controller.get_unfix_param_names()
+        self.encoder     = controller.get_encoder()
+
+        # Initialise the results of the refinement
+        self.result_list = []
+
+    def decode(self, unit_params:np.ndarray) -> tuple:
+        """
+        Converts the encoded parameters into parameter values
+
+        Parameters:
+        * `unit_params`: The encoded parameters
+
+        Returns the parameter values
+        """
+        return tuple(float(value) for value in self.encoder.decode(unit_params))
+
+    def refine(self, params:tuple) -> tuple:
+        """
+        Runs the local optimiser from a set of parameters on the current process;
+        the best evaluated parameters are kept, since the local optimisers do not
+        always end at their best evaluation, and the local optimisers are stopped
+        once they have used up their evaluations (including those used to
+        approximate the Jacobian)
+
+        Parameters:
+        * `params`: The parameter values to start from
+
+        Returns a tuple containing the best parameter values, their objective
+        dictionary, and the number of evaluations
+        """
+
+        # Define the function to evaluate the encoded parameters
+        best = {"params": tuple(params), "objectives": None, "reduced": math.inf}
+        num_evals = [0]
+        def evaluate(unit_params:np.ndarray) -> dict:
+            if num_evals[0] >= self.max_evals:
+                raise BudgetExhausted()
+            params = self.decode(unit_params)
+            objective_dict = self.controller.calculate_objectives(*params)
+            reduced_value = self.controller.reduce_objectives(self.controller.get_objective_values(objective_dict))
+            num_evals[0] += 1
+            if reduced_value < best["reduced"]:
+                best.update({"params": params, "objectives": objective_dict, "reduced": reduced_value})
+            return objective_dict
+
+        # Run the local optimiser
+        x0 = self.encoder.encode(params)
+        bounds = [(0, 1)] * len(x0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                if self.method == "least-squares":
+                    num_objectives = len(self.controller.get_objective_info_list())
+                    residual_function = lambda x: np.sqrt(np.maximum(self.controller.get_objective_values(evaluate(x)), 0) / num_objectives)
+                    least_squares(residual_function, x0, bounds=(0, 1), method="trf", diff_step=DIFF_STEP, max_nfev=self.max_evals)
+                else:
+                    reduce_function = lambda x: self.controller.reduce_objectives(self.controller.get_objective_values(evaluate(x)))
+                    minimize(reduce_function, x0, method=self.method, bounds=bounds, options={"maxfev": self.max_evals})
+            except BudgetExhausted:
+                pass
+        return best["params"], best["objectives"], num_evals[0]
+
+    def get_start_list(self, optimal_solution_list:list) -> list:
+        """
+        Gets the parameter values of the best distinct optimal solutions to start from
+
+        Parameters:
+        * `optimal_solution_list`: The list of optimal solutions, ordered from best to worst
+
+        Returns the list of parameter values and the list of their reduced objectives
+        """
+        reduction_method = self.controller.get_objective_reduction_method()
+        start_list, start_reduced_list = [], []
+        for solution in optimal_solution_list:
+            params = tuple(solution["params"][name] for name in self.param_names)
+            if not params in start_list:
+                start_list.append(params)
+                start_reduced_list.append(solution[reduction_method])
+            if len(start_list) == self.num_starts:
+                break
+        return start_list, start_reduced_list
+
+    def add_result(self, start_reduced:float, params:tuple, objective_dict:dict, num_evals:int) -> None:
+        """
+        Adds the result of a local optimiser to the summary
+
+        Parameters:
+        * `start_reduced`:  The reduced objective of the starting solution
+        * `params`:         The best parameter values
+        * `objective_dict`: The objective dictionary of the best parameter values
+        * `num_evals`:      The number of evaluations
+        """
+        reduced_value = start_reduced if objective_dict == None else self.controller.reduce_objectives(self.controller.get_objective_values(objective_dict))
+        self.result_list.append({"start": start_reduced, "end": min(start_reduced, reduced_value), "num_evals": num_evals})
+
+    def get_summary(self) -> list:
+        """
+        Gets the summary of the refinement
+        """
+        summary_list = [f"method ({self.method})", f"starts ({len(self.result_list)})",
+                        f"evaluations ({sum([result['num_evals'] for result in self.result_list])})"]
+        for result in self.result_list:
+            improvement = (result["start"] - result["end"]) / max(abs(result["start"]), 1e-12)
+            summary_list.append(f"{'{:0.5}'.format(float(result['start']))} to {'{:0.5}'.format(float(result['end']))} ({round(100 * improvement, 2)}%)")
+        return summary_list
+
+    def run(self, recorder, workers:int=1) -> None:
+        """
+        Runs the local optimisers from the best optimal solutions of the recorder, and
+        adds the refined solutions to the recorder; the solutions are evaluated at full
+        fidelity and without abandoning the simulations
+
+        Parameters:
+        * `recorder`: The recorder with the optimal solutions
+        * `workers`:  The number of worker processes used to run the local optimisers;
+                      runs the local optimisers one after another if set to 1
+        """
+
+        # Get the starting solutions
+        start_list, start_reduced_list = self.get_start_list(recorder.get_optimal_solution_list())
+        self.controller.set_threshold(None)
+        self.controller.set_fidelity_list([])
+
+        # Run the local optimisers
+        if workers > 1 and len(start_list) > 1:
+            with create_pool(self.controller, min(workers, len(start_list))) as pool:
+                result_list = pool.map(refine_params, start_list, chunksize=1)
+        else:
+            result_list = [(*self.refine(params), {}) for params in start_list]
+
+        # Add the refined solutions to the recorder
+        for start_reduced, (params, objective_dict, num_evals, counter_dict) in zip(start_reduced_list, result_list):
+            self.controller.add_counter_dict(counter_dict)
+            self.add_result(start_reduced, params, objective_dict, num_evals)
+            if objective_dict != None and self.controller.reduce_objectives(self.controller.get_objective_values(objective_dict)) < start_reduced:
+                recorder.update_optimal_solution(dict(zip(self.param_names, params)), objective_dict)
@@ -0,0 +1,94 @@
+"""
+ Title:         Repairer
+ Description:   For repairing solutions that violate the constraints on the parameters
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import numpy as np
+from pymoo.core.population import Population
+from pymoo.core.repair import Repair
+
+# Constants
+NUM_BISECTIONS = 16
+NUM_RESAMPLES  = 20
+
+# The Repairer class
+class Repairer(Repair):
+
+    def __init__(self, controller):
+        """
+        Class for repairing the offspring (and initial population) that violate the
+        constraints of the model on the parameters, before they are evaluated
+
+        Parameters:
+        * `controller`: The controller with the model
+        """
+        super().__init__()
+        self.controller = controller
+        self.encoder    = controller.get_encoder()
+
+    def get_violations(self, unit_matrix:np.ndarray) -> np.ndarray:
+        """
+        Grades the constraints on the parameters for encoded solutions
+
+        Parameters:
+        * `unit_matrix`: The encoded parameter values, with one row for each solution
+
+        Returns the violation of each solution
+        """
+        params_list = [tuple(params) for params in self.encoder.decode(unit_matrix)]
+        return np.array(self.controller.get_param_violations(params_list))
+
+    def _do(self, problem, X:np.ndarray, random_state=None, algorithm=None, **kwargs) -> np.ndarray:
+        """
+        Moves each infeasible solution towards a random feasible solution (from the same
+        batch or the current population) until it is on the boundary of the constraints;
+        the infeasible solutions are resampled if there are no feasible solutions
+
+        Parameters:
+        * `problem`:      The problem
+        * `X`:            The encoded solutions, with one row for each solution
+        * `random_state`: The random number generator of the algorithm
+        * `algorithm`:    The algorithm, with the current population
+
+        Returns the repaired solutions
+        """
+        random_state = np.random.default_rng() if random_state == None else random_state
+        X = np.array(X, dtype=float)
+        infeasible_array = self.get_violations(X) > 0
+        if not np.any(infeasible_array):
+            return X
+
+        # Get the feasible solutions to move towards
+        anchor_matrix = X[~infeasible_array]
+        population = None if algorithm == None else algorithm.pop
+        if isinstance(population, Population) and len(population) > 0:
+            pop_matrix = population.get("X")
+            anchor_matrix = np.concatenate([anchor_matrix, pop_matrix[self.get_violations(pop_matrix) == 0]])
+
+        # Resample the infeasible solutions if there are no feasible solutions
+        if len(anchor_matrix) == 0:
+            for _ in range(NUM_RESAMPLES):
+                index_array = np.where(infeasible_array)[0]
+                X[index_array] = random_state.uniform(0, 1, (len(index_array), X.shape[1]))
+                infeasible_array[index_array] = self.get_violations(X[index_array]) > 0
+                if not np.any(infeasible_array):
+                    break
+            return X
+
+        # Bisect the segment between each infeasible solution and its feasible solution
+        index_array = np.where(infeasible_array)[0]
+        start_matrix = anchor_matrix[random_state.integers(0, len(anchor_matrix), len(index_array))]
+        end_matrix = X[index_array]
+        lower_array = np.zeros(len(index_array))
+        upper_array = np.ones(len(index_array))
+        for _ in range(NUM_BISECTIONS):
+            middle_array = (lower_array + upper_array) / 2
+            middle_matrix = start_matrix + middle_array[:,None] * (end_matrix - start_matrix)
+            is_feasible = self.get_violations(middle_matrix) == 0
+            lower_array = np.where(is_feasible, middle_array, lower_array)
+            upper_array = np.where(is_feasible, upper_array, middle_array)
+        X[index_array] = start_matrix + lower_array[:,None] * (end_matrix - start_matrix)
+        return X
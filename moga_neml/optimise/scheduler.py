@@ -0,0 +1,96 @@
+"""
+ Title:         Scheduler
+ Description:   For ordering the simulations so that failing solutions are rejected early
+ Author:        Janzen Choi
+
+"""
+
+# Constants
+MIN_TIME = 1e-6 # lowest runtime in seconds, so that the ranks stay finite
+
+# The Scheduler class
+class Scheduler:
+
+    def __init__(self, memory:int=100):
+        """
+        Class for recording the runtime and failure rate of the simulation of each curve,
+        and ordering the simulations so that the curves that are cheap and likely to fail
+        are simulated first; since the remaining simulations are skipped once a simulation
+        fails, this minimises the expected cost of rejecting a failing solution
+
+        Parameters:
+        * `memory`: The number of recent simulations of each curve that the runtime and
+                    failure rate are averaged over (with exponentially decaying weights),
+                    so that the order adapts as the solutions improve
+        """
+        if memory < 1:
+            raise ValueError("The memory of the scheduler must be at least 1!")
+        self.memory    = memory
+        self.decay     = 1 - 1 / memory
+        self.stat_dict = {}
+
+    def record(self, curve_index:int, curve_name:str, runtime:float, is_failed:bool) -> None:
+        """
+        Records a simulation
+
+        Parameters:
+        * `curve_index`: The index of the simulated curve
+        * `curve_name`:  The name of the simulated curve, for the summary
+        * `runtime`:     The number of seconds the simulation took
+        * `is_failed`:   Whether the simulation failed (or was abandoned)
+        """
+        stats = self.stat_dict.setdefault(curve_index, {"name": curve_name, "weight": 0.0, "time": 0.0, "failures": 0.0})
+        stats["weight"]   = self.decay * stats["weight"] + 1
+        stats["time"]     = self.decay * stats["time"] + runtime
+        stats["failures"] = self.decay * stats["failures"] + int(is_failed)
+
+    def get_failure_rate(self, curve_index:int) -> float:
+        """
+        Estimates the probability that the simulation of a curve fails; the estimate
+        starts at 50% and approaches the recorded failure rate
+
+        Parameters:
+        * `curve_index`: The index of the curve
+        """
+        stats = self.stat_dict[curve_index]
+        return (stats["failures"] + 1) / (stats["weight"] + 2)
+
+    def get_rank(self, curve_index:int) -> float:
+        """
+        Gets the expected runtime of the simulation of a curve divided by its probability
+        of failing; curves that have not been simulated yet have a rank of zero, so that
+        they are simulated first and their runtimes are recorded
+
+        Parameters:
+        * `curve_index`: The index of the curve
+        """
+        if not curve_index in self.stat_dict.keys():
+            return 0.0
+        stats = self.stat_dict[curve_index]
+        return max(stats["time"] / stats["weight"], MIN_TIME) / self.get_failure_rate(curve_index)
+
+    def order(self, curve_index_list:list) -> list:
+        """
+        Orders the simulations of a list of curves by increasing rank; curves with the
+        same rank keep their order
+
+        Parameters:
+        * `curve_index_list`: The list of curve indexes
+
+        Returns the positions of the curves in the list, in the order they should be simulated
+        """
+        rank_list = [self.get_rank(curve_index) for curve_index in curve_index_list]
+        return sorted(range(len(curve_index_list)), key=lambda i: rank_list[i])
+
+    def get_summary(self) -> list:
+        """
+        Returns a summary of the recorded simulations, in the current order
+        """
+        summary_list = [f"memory ({self.memory})"]
+        curve_index_list = list(self.stat_dict.keys())
+        for position in self.order(curve_index_list):
+            stats = self.stat_dict[curve_index_list[position]]
+            runtime = stats["time"] / stats["weight"]
+            failure_rate = stats["failures"] / stats["weight"]
+            summary_list.append(f"{stats['name']} ({'{:0.3}'.format(runtime)}s, {round(100 * failure_rate, 2)}% failed)")
+        return summary_list
@@ -0,0 +1,186 @@
+"""
+ Title:         Surrogate
+ Description:   For pre-screening the offspring with a regression of the evaluated solutions
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import math
+import numpy as np
+from moga_neml.helper.transform import Encoder
+from scipy.interpolate import RBFInterpolator
+from scipy.stats import spearmanr
+
+# Constants
+NUM_NEIGHBOURS = 50
+MAX_PAIRS      = 1000
+
+# The Surrogate class
+class Surrogate:
+
+    def __init__(self, encoder:Encoder, budget:int, explore:float=0.2, min_size:int=10,
+                 reduce_function=None):
+        """
+        Class for predicting the objectives of the offspring from the solutions that have
+        already been evaluated, so that only the most promising or most uncertain offspring
+        are evaluated
+
+        Parameters:
+        * `encoder`:         The encoder of the unfixed parameters, which maps them into the
+                             unit hypercube searched by the optimiser
+        * `budget`:          The number of offspring to evaluate in each generation
+        * `explore`:         The fraction of the budget used to evaluate the most uncertain
+                             offspring (i.e., those furthest from the evaluated solutions)
+        * `min_size`:        The number of evaluated solutions required before pre-screening
+        * `reduce_function`: The function used to reduce the predicted objectives
+        """
+        self.encoder         = encoder
+        self.budget          = budget
+        self.explore         = explore
+        self.min_size        = max(min_size, len(encoder.l_bound_array) + 2)
+        self.reduce_function = np.average if reduce_function == None else reduce_function
+
+        # Initialise the archive and accuracy information
+        self.param_list      = []
+        self.objective_list  = []
+        self.prediction_dict = {}
+        self.pair_list       = []
+        self.num_evaluated   = 0
+        self.num_screened    = 0
+
+    def normalise(self, params_list:list) -> np.ndarray:
+        """
+        Encodes the parameter values into the unit hypercube, so that the distances between
+        the parameter sets are measured in the same space as the optimiser searches
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns the encoded parameter values as an array
+        """
+        return self.encoder.encode(np.array(params_list, dtype=float).reshape(-1, len(self.encoder.l_bound_array)))
+
+    def is_ready(self) -> bool:
+        """
+        Checks whether enough solutions have been evaluated to pre-screen the offspring
+        """
+        return len(self.param_list) >= self.min_size
+
+    def predict(self, params_list:list) -> np.ndarray:
+        """
+        Predicts the objectives of a list of parameter sets
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns an array of the predicted objectives, with one row for each parameter set
+        """
+        x_array = self.normalise(self.param_list)
+        y_array = np.array(self.objective_list)
+        neighbours = min(NUM_NEIGHBOURS, len(x_array))
+        interpolator = RBFInterpolator(x_array, y_array, neighbors=neighbours, kernel="thin_plate_spline", smoothing=1e-6)
+        return interpolator(self.normalise(params_list))
+
+    def get_uncertainty(self, params_list:list) -> np.ndarray:
+        """
+        Estimates the uncertainty of the predictions by the distances to the closest
+        evaluated solutions
+
+        Parameters:
+        * `params_list`: The list of parameter sets
+
+        Returns an array of the distances
+        """
+        x_array = self.normalise(self.param_list)
+        distance_list = [np.min(np.linalg.norm(x_array - x, axis=1)) for x in self.normalise(params_list)]
+        return np.array(distance_list)
+
+    def select(self, params_list:list) -> list:
+        """
+        Selects the offspring to evaluate, by choosing the offspring with the lowest predicted
+        reduced objective and the offspring with the most uncertain predictions
+
+        Parameters:
+        * `params_list`: The list of parameter sets of the offspring
+
+        Returns the list of indexes of the selected parameter sets
+        """
+
+        # Evaluate everything if there are not enough evaluated solutions or offspring
+        if not self.is_ready() or len(params_list) <= self.budget:
+            return list(range(len(params_list)))
+
+        # Predict the reduced objective of the offspring
+        predicted_list = [float(self.reduce_function(list(objectives))) for objectives in self.predict(params_list)]
+        num_explore = min(round(self.budget * self.explore), self.budget)
+
+        # Select the most promising offspring, then the most uncertain offspring
+        index_list = list(np.argsort(predicted_list)[:self.budget - num_explore])
+        remaining_list = [i for i in range(len(params_list)) if not i in index_list]
+        uncertainty_list = self.get_uncertainty([params_list[i] for i in remaining_list])
+        index_list += [remaining_list[i] for i in np.argsort(-uncertainty_list)[:num_explore]]
+        index_list = sorted([int(i) for i in index_list])
+
+        # Remember the predictions to track the accuracy
+        for i in index_list:
+            self.prediction_dict[tuple(params_list[i])] = predicted_list[i]
+        self.num_screened += len(params_list) - len(index_list)
+        return index_list
+
+    def add(self, params:tuple, objective_list:list, failed:bool=False) -> None:
+        """
+        Adds an evaluated solution to the archive, and compares its reduced objective
+        with the predicted reduced objective (if it was predicted)
+
+        Parameters:
+        * `params`:         The parameter values
+        * `objective_list`: The list of evaluated objectives
+        * `failed`:         Whether the evaluation failed; failed evaluations are not archived
+        """
+        self.num_evaluated += 1
+        predicted = self.prediction_dict.pop(tuple(params), None)
+        if failed:
+            return
+        self.param_list.append(list(params))
+        self.objective_list.append(list(objective_list))
+        if predicted != None:
+            self.pair_list.append((predicted, float(self.reduce_function(objective_list))))
+            self.pair_list = self.pair_list[-MAX_PAIRS:]
+
+    def get_summary(self) -> list:
+        """
+        Gets the summary of the pre-screening, including the accuracy of the predicted
+        reduced objectives of the evaluated offspring
+        """
+        summary_list = [f"evaluated ({self.num_evaluated})", f"screened out ({self.num_screened})",
+                        f"archived ({len(self.param_list)})"]
+        if len(self.pair_list) > 1:
+            predicted_array = np.array([pair[0] for pair in self.pair_list])
+            actual_array    = np.array([pair[1] for pair in self.pair_list])
+            relative_error  = np.average(np.abs(predicted_array - actual_array) / np.maximum(np.abs(actual_array), 1e-12))
+            correlation     = spearmanr(predicted_array, actual_array)[0]
+            summary_list.append(f"relative error ({round(100 * relative_error, 2)}%)")
+            summary_list.append(f"rank correlation ({'N/A' if math.isnan(correlation) else round(correlation, 4)})")
+        return summary_list
+
+    def get_state(self) -> dict:
+        """
+        Gets the archive and accuracy information so that it can be restored when
+        resuming an optimisation
+        """
+        return {"param_list": self.param_list, "objective_list": self.objective_list, "pair_list": self.pair_list,
+                "num_evaluated": self.num_evaluated, "num_screened": self.num_screened}
+
+    def set_state(self, state:dict) -> None:
+        """
+        Restores the archive and accuracy information
+
+        Parameters:
+        * `state`: The state of the surrogate (from `get_state`)
+        """
+        self.param_list     = list(state["param_list"])
+        self.objective_list = list(state["objective_list"])
+        self.pair_list      = list(state["pair_list"])
+        self.num_evaluated  = state["num_evaluated"]
+        self.num_screened   = state["num_screened"]
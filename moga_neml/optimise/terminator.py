@@ -0,0 +1,165 @@
+"""
+ Title:         Terminator
+ Description:   For stopping the optimisation once it has converged or run out of budget
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import time
+import numpy as np
+from pymoo.indicators.hv import HV
+
+# Constants
+REF_POINT_FACTOR = 1.1
+MIN_VALUE        = 1e-12
+
+# The Terminator class
+class Terminator:
+
+    def __init__(self, tolerance:float=None, hypervolume:float=None, patience:int=50,
+                 time_limit:float=None, max_evals:int=None, big_value:float=None):
+        """
+        Class for stopping the optimisation when any of the termination criteria are met
+
+        Parameters:
+        * `tolerance`:   The relative improvement of the lowest reduced objective over the
+                         patience window below which the optimisation has stagnated
+        * `hypervolume`: The relative improvement of the hypervolume of the optimal solutions
+                         over the patience window below which the optimisation has converged
+        * `patience`:    The number of generations in the patience window
+        * `time_limit`:  The number of seconds the optimisation can run for
+        * `max_evals`:   The number of evaluations the optimisation can run for
+        * `big_value`:   The objective value of failed evaluations, which are excluded
+                         from the hypervolume
+        """
+        self.tolerance   = tolerance
+        self.hypervolume = hypervolume
+        self.patience    = patience
+        self.time_limit  = time_limit
+        self.max_evals   = max_evals
+        self.big_value   = big_value
+
+        # Initialise the history of the optimisation
+        self.start_time  = None
+        self.elapsed     = 0
+        self.history     = []
+        self.ref_point   = None
+        self.stop_reason = None
+
+    def start(self) -> None:
+        """
+        Starts the wall-clock timer; the time spent before a checkpoint is kept
+        """
+        self.start_time = time.time()
+
+    def get_elapsed(self) -> float:
+        """
+        Gets the number of seconds the optimisation has run for
+        """
+        return self.elapsed if self.start_time == None else self.elapsed + time.time() - self.start_time
+
+    def get_hypervolume(self, objective_list:list) -> float:
+        """
+        Calculates the hypervolume of the objectives of the optimal solutions; the reference
+        point is fixed from the first solutions, so that the hypervolumes can be compared
+
+        Parameters:
+        * `objective_list`: The list of objective values of the optimal solutions
+
+        Returns the hypervolume
+        """
+        objective_array = np.array([objectives for objectives in objective_list
+                                    if self.big_value == None or max(objectives) < self.big_value], dtype=float)
+        if len(objective_array) == 0:
+            return 0
+        if self.ref_point == None:
+            self.ref_point = list(np.max(objective_array, axis=0) * REF_POINT_FACTOR + MIN_VALUE)
+        return float(HV(ref_point=np.array(self.ref_point))(objective_array))
+
+    def check(self, num_gens:float, num_evals:int, reduced_value:float, objective_list:list) -> bool:
+        """
+        Checks whether the optimisation should stop, and remembers the reason
+
+        Parameters:
+        * `num_gens`:       The number of generations completed
+        * `num_evals`:      The number of evaluations completed
+        * `reduced_value`:  The lowest reduced objective
+        * `objective_list`: The list of objective values of the optimal solutions
+
+        Returns whether the optimisation should stop
+        """
+
+        # Check the budgets
+        if self.time_limit != None and self.get_elapsed() >= self.time_limit:
+            self.stop_reason = f"time limit of {self.time_limit}s reached"
+        elif self.max_evals != None and num_evals >= self.max_evals:
+            self.stop_reason = f"evaluation budget of {self.max_evals} reached"
+        if self.stop_reason != None:
+            return True
+
+        # Add to the history and get the entry at the start of the patience window
+        if self.tolerance == None and self.hypervolume == None:
+            return False
+        hypervolume = None if self.hypervolume == None else self.get_hypervolume(objective_list)
+        self.history.append((num_gens, reduced_value, hypervolume))
+        previous_list = [entry for entry in self.history if entry[0] <= num_gens - self.patience]
+        if previous_list == []:
+            return False
+        previous = previous_list[-1]
+        self.history = self.history[self.history.index(previous):]
+
+        # Check the relative improvements over the patience window
+        if self.tolerance != None:
+            improvement = (previous[1] - reduced_value) / max(abs(previous[1]), MIN_VALUE)
+            if improvement < self.tolerance:
+                self.stop_reason = f"reduced objective improved by less than {self.tolerance} over {self.patience} gens"
+        if self.hypervolume != None and self.stop_reason == None:
+            improvement = (hypervolume - previous[2]) / max(abs(previous[2]), MIN_VALUE)
+            if improvement < self.hypervolume:
+                self.stop_reason = f"hypervolume improved by less than {self.hypervolume} over {self.patience} gens"
+        return self.stop_reason != None
+
+    def get_stop_reason(self) -> str:
+        """
+        Gets the reason for stopping the optimisation; returns none if the optimisation
+        has not been stopped by the termination criteria
+        """
+        return self.stop_reason
+
+    def get_summary(self) -> list:
+        """
+        Gets the summary of the termination criteria and the reason for stopping
+        """
+        summary_list = [f"stop reason ({'not stopped early' if self.stop_reason == None else self.stop_reason})"]
+        if self.tolerance != None:
+            summary_list.append(f"tolerance ({self.tolerance})")
+        if self.hypervolume != None:
+            summary_list.append(f"hypervolume ({self.hypervolume})")
+        if self.tolerance != None or self.hypervolume != None:
+            summary_list.append(f"patience ({self.patience})")
+        if self.time_limit != None:
+            summary_list.append(f"time limit ({self.time_limit}s, {round(self.get_elapsed())}s used)")
+        if self.max_evals != None:
+            summary_list.append(f"evaluation budget ({self.max_evals})")
+        return summary_list
+
+    def get_state(self) -> dict:
+        """
+        Gets the history of the optimisation so that it can be restored when
+        resuming an optimisation
+        """
+        return {"elapsed": self.get_elapsed(), "history": list(self.history), "ref_point": self.ref_point}
+
+    def set_state(self, state:dict) -> None:
+        """
+        Restores the history of the optimisation
+
+        Parameters:
+        * `state`: The state of the terminator (from `get_state`)
+        """
+        self.elapsed   = state["elapsed"]
+        self.history   = list(state["history"])
+        self.ref_point = state["ref_point"]
+        if self.start_time != None:
+            self.start_time = time.time()
@@ -0,0 +1,158 @@
+"""
+ Title:         Sampler Template
+ Description:   Contains the basic structure for a sampler class
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import importlib, os, pathlib, sys
+import numpy as np
+from moga_neml.helper.transform import LOG_FLOOR
+
+# Constants
+INIT_DEVIATE = 0.1 # standard deviation of the seeded values relative to the initial values
+
+# The Sampler Template Class
+class __Sampler__:
+
+    def __init__(self, name:str, l_bound_list:list, u_bound_list:list, log_list:list=None,
+                 seeded:float=0.5):
+        """
+        Class for defining how the initial population is sampled
+
+        Parameters:
+        * `name`:         The name of the sampler
+        * `l_bound_list`: The lower bounds of the parameters
+        * `u_bound_list`: The upper bounds of the parameters
+        * `log_list`:     Whether each parameter is sampled in log-space; samples all
+                          parameters in linear space if undefined
+        * `seeded`:       The fraction of the samples in which the parameters with initial
+                          values are sampled around the initial values
+        """
+        self.name          = name
+        self.l_bound_array = np.array(l_bound_list, dtype=float)
+        self.u_bound_array = np.array(u_bound_list, dtype=float)
+        self.log_array     = np.zeros(len(l_bound_list), dtype=bool) if log_list == None else np.array(log_list, dtype=bool)
+        self.seeded        = seeded
+        if np.any(self.log_array & (self.u_bound_array <= 0)):
+            raise ValueError("Parameters sampled in log-space must have positive upper bounds!")
+
+    def get_name(self) -> str:
+        """
+        Returns the name of the sampler
+        """
+        return self.name
+
+    def initialise(self) -> None:
+        """
+        Runs at the start, once (optional placeholder)
+        """
+        pass
+
+    def get_seed(self) -> int:
+        """
+        Gets a seed from the global random number generator, so that the samples
+        can be reproduced by seeding NumPy
+        """
+        return int(np.random.randint(0, 2**31 - 1))
+
+    def get_space_bounds(self) -> tuple:
+        """
+        Gets the lower and upper bounds of the sampling space, which are the base 10
+        logarithms of the bounds for the parameters sampled in log-space
+
+        Returns a tuple of the lower and upper bound arrays
+        """
+        l_log_array = np.log10(np.maximum(self.l_bound_array, self.u_bound_array * LOG_FLOOR), where=self.log_array,
+                               out=np.zeros(len(self.log_array)))
+        u_log_array = np.log10(self.u_bound_array, where=self.log_array, out=np.zeros(len(self.log_array)))
+        l_space_array = np.where(self.log_array, l_log_array, self.l_bound_array)
+        u_space_array = np.where(self.log_array, u_log_array, self.u_bound_array)
+        return l_space_array, u_space_array
+
+    def scale(self, unit_samples:np.ndarray) -> np.ndarray:
+        """
+        Scales the samples from the unit hypercube to the bounds of the parameters
+
+        Parameters:
+        * `unit_samples`: The samples in the unit hypercube
+
+        Returns the scaled samples
+        """
+        l_space_array, u_space_array = self.get_space_bounds()
+        samples = l_space_array + unit_samples * (u_space_array - l_space_array)
+        samples[:, self.log_array] = np.power(10.0, samples[:, self.log_array])
+        return samples
+
+    def sample(self, num_samples:int, init_list:list) -> np.ndarray:
+        """
+        Samples the initial population; the parameters with initial values are sampled
+        around the initial values for the seeded fraction of the samples, and the rest
+        are sampled from the unit hypercube design of the sampler
+
+        Parameters:
+        * `num_samples`: The number of samples
+        * `init_list`:   The initial value of each parameter (or none if undefined)
+
+        Returns the samples as an array, with one row for each sample
+        """
+        samples = self.scale(self.get_unit_samples(num_samples, len(init_list)))
+        init_index_list = [i for i in range(len(init_list)) if init_list[i] != None]
+        num_seeded = round(num_samples * self.seeded) if init_index_list != [] else 0
+        if num_seeded > 0:
+            init_array = np.array([init_list[i] for i in init_index_list], dtype=float)
+            deviations = np.random.normal(size=(num_seeded, len(init_index_list)))
+            samples[:num_seeded, init_index_list] = init_array + deviations * INIT_DEVIATE * np.abs(init_array)
+        return np.clip(samples, self.l_bound_array, self.u_bound_array)
+
+    def get_unit_samples(self, num_samples:int, num_params:int) -> np.ndarray:
+        """
+        Samples the unit hypercube (must be overridden)
+
+        Parameters:
+        * `num_samples`: The number of samples
+        * `num_params`:  The number of parameters
+
+        Returns the samples as an array, with one row for each sample
+        """
+        raise NotImplementedError
+
+# Creates and return a sampler
+def create_sampler(sampler_name:str, l_bound_list:list, u_bound_list:list, log_list:list=None,
+                   seeded:float=0.5, **kwargs) -> __Sampler__:
+    """
+    Gets a sampler
+
+    Parameters:
+    * `sampler_name`: The name of the sampler
+    * `l_bound_list`: The lower bounds of the parameters
+    * `u_bound_list`: The upper bounds of the parameters
+    * `log_list`:     Whether each parameter is sampled in log-space
+    * `seeded`:       The fraction of the samples seeded around the initial values
+
+    Returns the sampler object
+    """
+
+    # Get available samplers in current folder
+    samplers_dir = pathlib.Path(__file__).parent.resolve()
+    files = os.listdir(samplers_dir)
+    files = [file.replace(".py", "") for file in files]
+    files = [file for file in files if not file in ["__sampler__", "__pycache__"]]
+    
+    # Raise error if sampler name not in available samplers
+    if not sampler_name in files:
+        raise NotImplementedError(f"The sampler '{sampler_name}' has not been implemented")
+
+    # Prepare dynamic import
+    module_path = f"{samplers_dir}/{sampler_name}.py"
+    spec = importlib.util.spec_from_file_location("sampler_file", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    
+    # Import, initialise, and return sampler
+    from sampler_file import Sampler
+    sampler = Sampler(sampler_name, l_bound_list, u_bound_list, log_list, seeded)
+    sampler.initialise(**kwargs)
+    return sampler
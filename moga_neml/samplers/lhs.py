@@ -0,0 +1,38 @@
+"""
+ Title:         Latin hypercube sampler
+ Description:   Samples the parameters with a Latin hypercube design
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import numpy as np
+from scipy.stats import qmc
+from moga_neml.samplers.__sampler__ import __Sampler__
+
+# The Sampler class
+class Sampler(__Sampler__):
+
+    def initialise(self, optimise:bool=False):
+        """
+        Runs at the start, once
+
+        Parameters:
+        * `optimise`: Whether to improve the space-filling of the design by
+                      minimising its centred discrepancy (slower)
+        """
+        self.optimise = optimise
+
+    def get_unit_samples(self, num_samples:int, num_params:int) -> np.ndarray:
+        """
+        Samples the unit hypercube such that each parameter has exactly one
+        sample in each of the equally sized intervals
+
+        Parameters:
+        * `num_samples`: The number of samples
+        * `num_params`:  The number of parameters
+
+        Returns the samples as an array, with one row for each sample
+        """
+        optimization = "random-cd" if self.optimise else None
+        return qmc.LatinHypercube(num_params, optimization=optimization, seed=self.get_seed()).random(num_samples)
@@ -0,0 +1,48 @@
+"""
+ Title:         Normal sampler
+ Description:   Samples the parameters from normal distributions
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import numpy as np
+from moga_neml.samplers.__sampler__ import __Sampler__, INIT_DEVIATE
+
+# The Sampler class
+class Sampler(__Sampler__):
+
+    def initialise(self, deviation:float=0.25):
+        """
+        Runs at the start, once
+
+        Parameters:
+        * `deviation`: The standard deviation of the parameters without initial values,
+                       relative to the range of their bounds
+        """
+        self.deviation = deviation
+
+    def sample(self, num_samples:int, init_list:list) -> np.ndarray:
+        """
+        Samples the parameters with initial values around the initial values, and the
+        other parameters around the middle of their bounds; all the samples are seeded
+
+        Parameters:
+        * `num_samples`: The number of samples
+        * `init_list`:   The initial value of each parameter (or none if undefined)
+
+        Returns the samples as an array, with one row for each sample
+        """
+
+        # Get the means and standard deviations in the sampling space
+        l_space_array, u_space_array = self.get_space_bounds()
+        is_init_array = np.array([init != None for init in init_list])
+        init_array = np.array([0 if init == None else init for init in init_list], dtype=float)
+        mean_array = np.where(is_init_array, init_array, (l_space_array + u_space_array) / 2)
+        stdev_array = np.where(is_init_array, INIT_DEVIATE * np.abs(init_array), (u_space_array - l_space_array) * self.deviation)
+
+        # Sample and clamp the parameters
+        samples = np.random.normal(loc=mean_array, scale=stdev_array, size=(num_samples, len(init_list)))
+        is_log_array = self.log_array & ~is_init_array
+        samples[:, is_log_array] = np.power(10.0, samples[:, is_log_array])
+        return np.clip(samples, self.l_bound_array, self.u_bound_array)
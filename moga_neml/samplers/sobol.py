@@ -0,0 +1,30 @@
+"""
+ Title:         Sobol sampler
+ Description:   Samples the parameters with a scrambled Sobol sequence
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import warnings
+import numpy as np
+from scipy.stats import qmc
+from moga_neml.samplers.__sampler__ import __Sampler__
+
+# The Sampler class
+class Sampler(__Sampler__):
+
+    def get_unit_samples(self, num_samples:int, num_params:int) -> np.ndarray:
+        """
+        Samples the unit hypercube with a scrambled Sobol sequence; the sequence
+        is most uniform when the number of samples is a power of 2
+
+        Parameters:
+        * `num_samples`: The number of samples
+        * `num_params`:  The number of parameters
+
+        Returns the samples as an array, with one row for each sample
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return qmc.Sobol(num_params, seed=self.get_seed()).random(num_samples)
@@ -0,0 +1,25 @@
+"""
+ Title:         Uniform sampler
+ Description:   Samples the parameters uniformly at random
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import numpy as np
+from moga_neml.samplers.__sampler__ import __Sampler__
+
+# The Sampler class
+class Sampler(__Sampler__):
+
+    def get_unit_samples(self, num_samples:int, num_params:int) -> np.ndarray:
+        """
+        Samples the unit hypercube uniformly at random
+
+        Parameters:
+        * `num_samples`: The number of samples
+        * `num_params`:  The number of parameters
+
+        Returns the samples as an array, with one row for each sample
+        """
+        return np.random.uniform(size=(num_samples, num_params))
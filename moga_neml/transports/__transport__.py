@@ -0,0 +1,120 @@
+"""
+ Title:         Transport Template
+ Description:   Contains the basic structure for a transport class, which carries the
+                tasks and results between a broker and its workers
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import importlib, os, pathlib, sys
+
+# The Transport Template Class
+class __Transport__:
+
+    def __init__(self, name:str):
+        """
+        Class for defining a transport
+
+        Parameters:
+        * `name`: The name of the transport
+        """
+        self.name = name
+
+    def get_name(self) -> str:
+        """
+        Returns the name of the transport
+        """
+        return self.name
+
+    def initialise(self) -> None:
+        """
+        Runs at the start, once (optional placeholder)
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Tells the workers that no more tasks will be sent (optional placeholder)
+        """
+        pass
+
+    def is_closed(self) -> bool:
+        """
+        Returns whether the broker has closed the transport (optional placeholder)
+        """
+        return False
+
+    def put_task(self, task:dict) -> None:
+        """
+        Sends a task to the workers (must be overridden)
+
+        Parameters:
+        * `task`: The task
+        """
+        raise NotImplementedError
+
+    def get_task(self, timeout:float) -> dict:
+        """
+        Receives a task from the broker (must be overridden)
+
+        Parameters:
+        * `timeout`: The maximum number of seconds to wait for a task
+
+        Returns the task, or none if there were no tasks
+        """
+        raise NotImplementedError
+
+    def put_result(self, result:dict) -> None:
+        """
+        Sends a result to the broker (must be overridden)
+
+        Parameters:
+        * `result`: The result
+        """
+        raise NotImplementedError
+
+    def get_result(self, timeout:float) -> dict:
+        """
+        Receives a result from the workers (must be overridden)
+
+        Parameters:
+        * `timeout`: The maximum number of seconds to wait for a result
+
+        Returns the result, or none if there were no results
+        """
+        raise NotImplementedError
+
+# Creates and return a transport
+def create_transport(transport_name:str, **kwargs) -> __Transport__:
+    """
+    Gets a transport
+
+    Parameters:
+    * `transport_name`: The name of the transport
+
+    Returns the transport object
+    """
+
+    # Get available transports in current folder
+    transports_dir = pathlib.Path(__file__).parent.resolve()
+    files = os.listdir(transports_dir)
+    files = [file.replace(".py", "") for file in files]
+    files = [file for file in files if not file in ["__transport__", "__pycache__"]]
+    
+    # Raise error if transport name not in available transports
+    if not transport_name in files:
+        raise NotImplementedError(f"The transport '{transport_name}' has not been implemented")
+
+    # Prepare dynamic import
+    module_path = f"{transports_dir}/{transport_name}.py"
+    spec = importlib.util.spec_from_file_location("transport_file", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    
+    # Import, initialise, and return transport
+    from transport_file import Transport
+    transport = Transport(transport_name)
+    transport.initialise(**kwargs)
+    return transport
@@ -0,0 +1,80 @@
+"""
+ Title:         The local transport
+ Description:   Carries the tasks and results between threads of the current process;
+                mainly a stand-in for testing the broker without a network
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import queue, threading
+from moga_neml.transports.__transport__ import __Transport__
+
+# The Local Transport class
+class Transport(__Transport__):
+
+    def initialise(self):
+        """
+        Runs at the start, once
+        """
+        self.task_queue   = queue.Queue()
+        self.result_queue = queue.Queue()
+        self.closed_event = threading.Event()
+
+    def close(self) -> None:
+        """
+        Tells the workers that no more tasks will be sent
+        """
+        self.closed_event.set()
+
+    def is_closed(self) -> bool:
+        """
+        Returns whether the broker has closed the transport
+        """
+        return self.closed_event.is_set()
+
+    def put_task(self, task:dict) -> None:
+        """
+        Sends a task to the workers
+
+        Parameters:
+        * `task`: The task
+        """
+        self.task_queue.put(task)
+
+    def get_task(self, timeout:float) -> dict:
+        """
+        Receives a task from the broker
+
+        Parameters:
+        * `timeout`: The maximum number of seconds to wait for a task
+
+        Returns the task, or none if there were no tasks
+        """
+        try:
+            return self.task_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def put_result(self, result:dict) -> None:
+        """
+        Sends a result to the broker
+
+        Parameters:
+        * `result`: The result
+        """
+        self.result_queue.put(result)
+
+    def get_result(self, timeout:float) -> dict:
+        """
+        Receives a result from the workers
+
+        Parameters:
+        * `timeout`: The maximum number of seconds to wait for a result
+
+        Returns the result, or none if there were no results
+        """
+        try:
+            return self.result_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
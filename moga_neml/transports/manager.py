@@ -0,0 +1,118 @@
+"""
+ Title:         The manager transport
+ Description:   Carries the tasks and results over TCP using a multiprocessing manager;
+                the broker serves the queues and the workers connect to them from any node
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import multiprocessing, queue, threading
+from multiprocessing.managers import BaseManager
+from moga_neml.transports.__transport__ import __Transport__
+
+# The Queue Manager class
+class QueueManager(BaseManager):
+    """
+    Manager for sharing the task and result queues
+    """
+    pass
+
+# The Manager Transport class
+class Transport(__Transport__):
+
+    def initialise(self, host:str="localhost", port:int=50000, authkey:str="moga_neml", serve:bool=False):
+        """
+        Runs at the start, once
+
+        Parameters:
+        * `host`:    The address of the node serving the queues
+        * `port`:    The port of the node serving the queues
+        * `authkey`: The key used to authenticate the connections
+        * `serve`:   Whether to serve the queues (broker) or connect to them (worker)
+        """
+        
+        # Serve the queues from a forked server process
+        if serve:
+            task_queue   = queue.Queue()
+            result_queue = queue.Queue()
+            closed_event = threading.Event()
+            QueueManager.register("get_task_queue", callable=lambda: task_queue)
+            QueueManager.register("get_result_queue", callable=lambda: result_queue)
+            QueueManager.register("get_closed_event", callable=lambda: closed_event)
+            self.manager = QueueManager((host, port), authkey.encode(), ctx=multiprocessing.get_context("fork"))
+            self.manager.start()
+        
+        # Otherwise, connect to the served queues
+        else:
+            QueueManager.register("get_task_queue")
+            QueueManager.register("get_result_queue")
+            QueueManager.register("get_closed_event")
+            self.manager = QueueManager((host, port), authkey.encode())
+            self.manager.connect()
+
+        # Get the shared queues
+        self.serve        = serve
+        self.task_queue   = self.manager.get_task_queue()
+        self.result_queue = self.manager.get_result_queue()
+        self.closed_event = self.manager.get_closed_event()
+
+    def close(self) -> None:
+        """
+        Tells the workers that no more tasks will be sent and stops serving the queues
+        """
+        if self.serve:
+            self.closed_event.set()
+            self.manager.shutdown()
+
+    def is_closed(self) -> bool:
+        """
+        Returns whether the broker has closed the transport
+        """
+        return self.closed_event.is_set()
+
+    def put_task(self, task:dict) -> None:
+        """
+        Sends a task to the workers
+
+        Parameters:
+        * `task`: The task
+        """
+        self.task_queue.put(task)
+
+    def get_task(self, timeout:float) -> dict:
+        """
+        Receives a task from the broker
+
+        Parameters:
+        * `timeout`: The maximum number of seconds to wait for a task
+
+        Returns the task, or none if there were no tasks
+        """
+        try:
+            return self.task_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def put_result(self, result:dict) -> None:
+        """
+        Sends a result to the broker
+
+        Parameters:
+        * `result`: The result
+        """
+        self.result_queue.put(result)
+
+    def get_result(self, timeout:float) -> dict:
+        """
+        Receives a result from the workers
+
+        Parameters:
+        * `timeout`: The maximum number of seconds to wait for a result
+
+        Returns the result, or none if there were no results
+        """
+        try:
+            return self.result_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
@@ -0,0 +1,72 @@
+"""
+ Title:         Abandonment tests
+ Description:   Checks that hopeless simulations are abandoned, and that the approximate lower
+                bounds used to abandon them do not exceed the errors
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+import numpy as np
+from moga_neml.interface import Interface
+from moga_neml.drivers.driver import Driver
+
+# Constants
+DATA_PATH  = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+NUM_PARAMS = 10
+PARAMS     = (16.994, 64.14, 1.5, 4.5, 1700.0)
+
+def test_area_lower_bound_streamed_tensile(tmp_path):
+    itf = Interface("abandonment", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    curve = controller.get_last_curve()
+    error = curve.get_error_list()[0]
+
+    # Stream the tensile simulations and compare the lower bounds with the final errors
+    param_dict = controller.get_unfix_param_dict()
+    l_bound_array = np.array([param_dict[name]["l_bound"] for name in param_dict.keys()])
+    u_bound_array = np.array([param_dict[name]["u_bound"] for name in param_dict.keys()])
+    num_checked = 0
+    for row in np.random.default_rng(0).random((NUM_PARAMS, len(param_dict))):
+        params = controller.incorporate_fix_param_dict(*(l_bound_array + row * (u_bound_array - l_bound_array)))
+        calibrated_model = controller.get_model().calibrate(curve.get_exp_data(), *params)
+        bound_list = []
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            prd_data = Driver(curve, calibrated_model).run(lambda prd_data: bound_list.append(error.get_lower_bound(prd_data)) or False)
+        if prd_data == None or bound_list == []:
+            continue
+        final_error = error.get_value(prd_data)
+        assert all([bound <= final_error for bound in bound_list])
+        num_checked += 1
+    assert num_checked > 0
+
+def test_abandon_hopeless(tmp_path):
+    itf = Interface("abandonment", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    param_dict = controller.get_unfix_param_dict()
+    hopeless_params = tuple(param_dict[name]["u_bound"] for name in param_dict.keys())
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        threshold = controller.reduce_objectives(controller.get_objective_values(controller.calculate_objectives(*PARAMS)))
+        controller.set_threshold(threshold)
+
+        # Simulations are not abandoned by default
+        assert controller.get_abandon_margin() == None
+        objective_dict = controller.calculate_objectives(*hopeless_params)
+        assert controller.reduce_objectives(controller.get_objective_values(objective_dict)) > 100 * threshold
+        assert not "abandoned" in controller.pop_counter_dict().keys()
+
+        # Once enabled, the hopeless simulation is abandoned and the solution fails
+        itf.set_abandonment()
+        objective_dict = controller.calculate_objectives(*hopeless_params)
+        assert objective_dict["violation_simulation"] > 0
+        assert controller.pop_counter_dict()["abandoned"] == 1
@@ -0,0 +1,42 @@
+"""
+ Title:         Asynchronous tests
+ Description:   Checks that the asynchronous optimisation evaluates as many solutions as the
+                generational optimisation
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings, pytest
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH  = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+NUM_GENS   = 4
+POPULATION = 6
+OFFSPRING  = 4
+
+def get_interface(tmp_path) -> Interface:
+    """
+    Gets an interface with a tensile curve
+
+    Parameters:
+    * `tmp_path`: The path to write the results to
+    """
+    itf = Interface("asynchronous", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    return itf
+
+def test_asynchronous_evaluations(tmp_path):
+    itf = get_interface(tmp_path)
+    with pytest.raises(ValueError):
+        itf.optimise(NUM_GENS, POPULATION, OFFSPRING, checkpoint=1, asynchronous=True)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        opt_params = itf.optimise(NUM_GENS, POPULATION, OFFSPRING, workers=2, asynchronous=True)
+    recorder = itf.__recorder__
+    assert recorder.num_evals_completed == POPULATION + (NUM_GENS - 1) * OFFSPRING
+    assert opt_params == recorder.get_opt_params()
+    assert recorder.get_opt_error() < 10000
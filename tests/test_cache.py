@@ -0,0 +1,67 @@
+"""
+ Title:         Cache tests
+ Description:   Checks that the evaluations are reused, but only at full fidelity
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PARAMS    = (16.994, 64.14, 1.5, 4.5, 1700.0)
+
+def get_controller(tmp_path):
+    """
+    Gets a controller with a tensile curve and a cache
+
+    Parameters:
+    * `tmp_path`: The path to write the results to
+    """
+    itf = Interface("cache", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    controller.define_cache()
+    return controller
+
+def calculate_objectives(controller, params:tuple) -> dict:
+    """
+    Calculates the objectives of a set of parameters, ignoring the warnings
+
+    Parameters:
+    * `controller`: The controller
+    * `params`:     The parameter values
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return controller.calculate_objectives(*params)
+
+def test_cache_reuses_evaluations(tmp_path):
+    controller = get_controller(tmp_path)
+    objective_dict = calculate_objectives(controller, PARAMS)
+    assert calculate_objectives(controller, PARAMS) == objective_dict
+    assert calculate_objectives(controller, tuple(param * (1 + 1e-9) for param in PARAMS)) == objective_dict
+    assert controller.get_cache().num_hits == 2
+    assert controller.get_cache().num_misses == 1
+
+def test_cache_skips_lower_fidelity(tmp_path):
+    controller = get_controller(tmp_path)
+    controller.set_fidelity_list([{"num_steps": 100, "margin": 1.0}])
+
+    # Evaluations that are not promoted to full fidelity are not cached
+    controller.set_threshold(0)
+    low_dict = calculate_objectives(controller, PARAMS)
+    assert low_dict["fidelity"] == 1
+    assert controller.get_cache().get(PARAMS) == None
+
+    # So a later evaluation of the same parameters reaches full fidelity
+    controller.set_threshold(None)
+    full_dict = calculate_objectives(controller, PARAMS)
+    assert not "fidelity" in full_dict.keys()
+    assert full_dict != low_dict
+    assert calculate_objectives(controller, PARAMS) == full_dict
@@ -0,0 +1,41 @@
+"""
+ Title:         Calibration tests
+ Description:   Checks that the models are calibrated without changing their state
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings, pytest
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+
+def test_damage_uses_calibrated_model(tmp_path):
+    itf = Interface("calibration", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evpcd")
+    itf.read_data("creep/inl_1/AirBase_800_80_G25.csv")
+    itf.add_error("damage")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    model = controller.get_model()
+    curve = controller.get_last_curve()
+    error = curve.get_error_list()[0]
+    param_dict = controller.get_unfix_param_dict()
+    params = tuple((param_dict[name]["l_bound"] + param_dict[name]["u_bound"]) / 2 for name in param_dict.keys())
+
+    # The prediction does not remember the calibrated model
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        prd_data, calibrated_model = controller.predict(curve, *params)
+        objective_dict = controller.calculate_objectives(*params)
+    assert prd_data != None
+    assert model.calibrated_model == None
+    with pytest.raises(NotImplementedError):
+        error.get_value(prd_data)
+
+    # The damage is calculated with the calibrated model that made the prediction
+    damage = calibrated_model.get_damage(prd_data["history"][-1])
+    assert error.evaluate(prd_data, calibrated_model) == abs(1 - damage)
+    assert controller.get_objective_values(objective_dict) == [abs(1 - damage)]
@@ -0,0 +1,74 @@
+"""
+ Title:         Checkpoint tests
+ Description:   Checks that an optimisation resumed from a checkpoint continues where it stopped
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, pickle, warnings
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH  = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+POPULATION = 6
+OFFSPRING  = 4
+
+def get_interface(output_path:str) -> Interface:
+    """
+    Gets an interface with a tensile curve
+
+    Parameters:
+    * `output_path`: The path to write the results to
+    """
+    itf = Interface("checkpoint", input_path=DATA_PATH, output_path=output_path, verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    return itf
+
+def resume(tmp_path, checkpoint_path:str, name:str, num_gens:int) -> Interface:
+    """
+    Resumes an optimisation from a checkpoint with a new interface, counting the
+    solutions that are evaluated after resuming
+
+    Parameters:
+    * `tmp_path`:        The path to write the results to
+    * `checkpoint_path`: The path to the checkpoint
+    * `name`:            The name of the folder to write the results to
+    * `num_gens`:        The total number of generations
+    """
+    itf = get_interface(str(tmp_path / name))
+    controller = itf.__controller__
+    calculate_objectives = controller.calculate_objectives
+    itf.num_evaluated = 0
+    def count_objectives(*params):
+        itf.num_evaluated += 1
+        return calculate_objectives(*params)
+    controller.calculate_objectives = count_objectives
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        itf.resume(checkpoint_path, num_gens=num_gens)
+    return itf
+
+def test_checkpoint_resume(tmp_path):
+
+    # Run the first two generations and save the state after each
+    itf = get_interface(str(tmp_path / "first"))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        itf.optimise(2, POPULATION, OFFSPRING, 0.8, 0.01, checkpoint=1)
+    checkpoint_path = itf.__get_output__("checkpoint.pkl")
+    with open(checkpoint_path, "rb") as file:
+        state = pickle.load(file)
+    assert state["n_iter"] == 3
+    assert state["recorder"]["num_evals_completed"] == POPULATION + OFFSPRING
+
+    # Resuming continues from the saved generation with the saved random states
+    resumed_list = [resume(tmp_path, checkpoint_path, f"resumed_{i}", 4) for i in range(2)]
+    for resumed in resumed_list:
+        assert resumed.num_evaluated == 2 * OFFSPRING
+        assert resumed.__recorder__.num_evals_completed == POPULATION + 3 * OFFSPRING
+        assert resumed.__recorder__.num_gens_completed == 4
+        assert resumed.__recorder__.get_opt_error() <= itf.__recorder__.get_opt_error()
+    assert resumed_list[0].__recorder__.get_opt_params() == resumed_list[1].__recorder__.get_opt_params()
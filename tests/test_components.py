@@ -0,0 +1,36 @@
+"""
+ Title:         Component tests
+ Description:   Checks that the model components are defined once for each curve and reused
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH   = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PARAMS_LIST = [(16.994, 64.14, 1.5, 4.5, 1700.0), (20.0, 80.0, 2.0, 4.5, 1500.0)]
+
+def test_components_reused(tmp_path):
+    itf = Interface("components", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("creep/inl_1/AirBase_800_80_G25.csv")
+    itf.add_error("area", "time", "strain")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    model = controller.get_model()
+
+    # The components are defined once for each curve, while the objectives are unchanged
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        objectives_list = [controller.calculate_objectives(*params) for params in PARAMS_LIST]
+        component_dict = dict(model.component_dict)
+        assert len(component_dict) == len(controller.get_curve_list())
+        assert [controller.calculate_objectives(*params) for params in PARAMS_LIST] == objectives_list
+    assert len(model.component_dict) == len(component_dict)
+    for exp_key, components in component_dict.items():
+        assert all([model.component_dict[exp_key][name] is components[name] for name in components.keys()])
@@ -0,0 +1,35 @@
+"""
+ Title:         Curve pool tests
+ Description:   Checks that simulating the curves concurrently does not change the objectives
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PARAMS    = (16.994, 64.14, 1.5, 4.5, 1700.0)
+
+def test_curve_pool_objectives(tmp_path):
+    itf = Interface("curve_pool", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("creep/inl_1/AirBase_800_80_G25.csv")
+    itf.add_error("area", "time", "strain")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        serial_dict = controller.calculate_objectives(*PARAMS)
+        controller.set_curve_workers(2)
+        try:
+            pool_dict = controller.calculate_objectives(*PARAMS)
+            assert controller.curve_pool != None
+        finally:
+            controller.close_curve_pool()
+    assert pool_dict == serial_dict
+    assert max(serial_dict.values()) < 1
@@ -0,0 +1,50 @@
+"""
+ Title:         Driver tests
+ Description:   Checks that only the failed simulations are treated as failures by the driver
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, pytest
+from neml.nlsolvers import MaximumIterations
+from moga_neml.interface import Interface
+from moga_neml.drivers.driver import Driver, is_solver_error
+
+# Constants
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+
+def get_driver(tmp_path) -> Driver:
+    """
+    Gets a driver for a tensile curve, calibrated at the middle of the bounds
+
+    Parameters:
+    * `tmp_path`: The path to write the results to
+    """
+    itf = Interface("driver", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    curve = controller.get_last_curve()
+    param_dict = controller.get_unfix_param_dict()
+    params = [(param_dict[name]["l_bound"] + param_dict[name]["u_bound"]) / 2 for name in param_dict.keys()]
+    params = controller.incorporate_fix_param_dict(*params)
+    return Driver(curve, controller.get_model().calibrate(curve.get_exp_data(), *params))
+
+def test_solver_errors():
+    assert is_solver_error(MaximumIterations())
+    assert not is_solver_error(ValueError("invalid argument"))
+    assert not is_solver_error(KeyError("strain"))
+
+def test_configuration_error_propagates(tmp_path):
+    driver = get_driver(tmp_path)
+    driver.type = "unsupported"
+    with pytest.raises(ValueError):
+        driver.run()
+
+def test_monitor_error_propagates(tmp_path):
+    def monitor(prd_data:dict) -> bool:
+        raise KeyError("time")
+    with pytest.raises(KeyError):
+        get_driver(tmp_path).run(monitor)
@@ -0,0 +1,28 @@
+"""
+ Title:         Evaluator tests
+ Description:   Checks that the worker processes are shut down even if the optimisation fails
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, multiprocessing, pytest
+from moga_neml.interface import Interface
+from moga_neml.evaluators.__evaluator__ import create_evaluator
+
+# Constants
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+
+def test_pool_terminates_on_failure(tmp_path):
+    itf = Interface("evaluators", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    evaluator = create_evaluator("pool", controller, num_workers=2)
+    assert len(multiprocessing.active_children()) == 2
+    with pytest.raises(KeyboardInterrupt):
+        with evaluator:
+            raise KeyboardInterrupt
+    assert len(multiprocessing.active_children()) == 0
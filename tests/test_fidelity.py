@@ -0,0 +1,55 @@
+"""
+ Title:         Fidelity tests
+ Description:   Checks that the solutions are only promoted to full fidelity if they could become optimal
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings, pytest
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PARAMS    = (16.994, 64.14, 1.5, 4.5, 1700.0)
+
+def get_controller(tmp_path):
+    """
+    Gets a controller with a tensile curve
+
+    Parameters:
+    * `tmp_path`: The path to write the results to
+    """
+    itf = Interface("fidelity", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    return controller
+
+def test_fidelity_margin(tmp_path):
+    controller = get_controller(tmp_path)
+    with pytest.raises(ValueError):
+        controller.set_fidelity_list([{"num_steps": 100, "margin": 0.9}])
+    controller.set_fidelity_list([{"num_steps": 100}])
+    assert controller.get_fidelity_list() == [{"num_steps": 100, "margin": 1.0}]
+
+def test_fidelity_promotion(tmp_path):
+    controller = get_controller(tmp_path)
+    controller.set_fidelity_list([{"num_steps": 100, "margin": 1.2}])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        full_dict = controller.calculate_objectives(*PARAMS)
+        full_value = controller.reduce_objectives(controller.get_objective_values(full_dict))
+
+        # Solutions within the margin of the threshold are promoted
+        controller.pop_counter_dict()
+        controller.set_threshold(full_value)
+        assert controller.calculate_objectives(*PARAMS) == full_dict
+        assert controller.pop_counter_dict() == {"fidelity 1": 1, "fidelity full": 1}
+
+        # Solutions beyond the margin are not
+        controller.set_threshold(full_value / 10)
+        assert controller.calculate_objectives(*PARAMS)["fidelity"] == 1
+        assert controller.pop_counter_dict() == {"fidelity 1": 1}
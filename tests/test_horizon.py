@@ -0,0 +1,93 @@
+"""
+ Title:         Horizon tests
+ Description:   Checks that limiting the simulations to the horizon does not change the objectives
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+import numpy as np
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH    = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+NUM_PARAMS   = 4
+CREEP_PARAMS = (16.994, 64.14, 1.5, 4.5, 1700.0) # parameters that creep at 80MPa and 800C
+
+def get_interface(tmp_path, error_name:str="area") -> Interface:
+    """
+    Gets an interface with creep and tensile curves
+
+    Parameters:
+    * `tmp_path`:   The path to write the results to
+    * `error_name`: The error to define on the curves (i.e., area, end, or hardening);
+                    the hardening error is only defined on the tensile curve
+    """
+    itf = Interface("horizon", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    if error_name != "hardening":
+        itf.read_data("creep/inl_1/AirBase_800_80_G25.csv")
+        itf.add_error(error_name, "time", "strain")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    if error_name == "hardening":
+        itf.add_error("hardening", strain_0=0.05, strain_1=0.1)
+    else:
+        itf.add_error(error_name, "strain", "stress")
+    return itf
+
+def get_params_list(controller) -> list:
+    """
+    Gets random sets of unfixed parameter values, after a set that creeps
+
+    Parameters:
+    * `controller`: The controller
+    """
+    encoder = controller.get_encoder()
+    random_matrix = np.random.default_rng(0).random((NUM_PARAMS, len(controller.get_unfix_param_dict())))
+    return [CREEP_PARAMS] + [tuple(encoder.decode(row)) for row in random_matrix]
+
+def get_results(controller, params_list:list, horizon_factor:float) -> tuple:
+    """
+    Calculates the objectives of sets of parameters with a horizon factor
+
+    Parameters:
+    * `controller`:     The controller
+    * `params_list`:    The sets of unfixed parameter values
+    * `horizon_factor`: The horizon factor
+
+    Returns the list of objectives, and the predicted data of the curves for the first set
+    """
+    controller.set_horizon_factor(horizon_factor)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        objectives_list = [controller.calculate_objectives(*params) for params in params_list]
+        controller.calculate_objectives(*params_list[0])
+    return objectives_list, [curve.get_prd_data() for curve in controller.get_curve_list()]
+
+def test_horizon_truncates_area(tmp_path):
+    controller = get_interface(tmp_path).__controller__
+    params_list = get_params_list(controller)
+    full_list, full_prd_list = get_results(controller, params_list, None)
+    horizon_list, horizon_prd_list = get_results(controller, params_list, 1.0)
+    assert full_list == horizon_list
+    assert max(full_prd_list[0]["strain"]) > 0
+    for full_prd, horizon_prd, x_label in zip(full_prd_list, horizon_prd_list, ["time", "strain"]):
+        assert len(horizon_prd[x_label]) < len(full_prd[x_label])
+        assert horizon_prd[x_label][-1] < full_prd[x_label][-1]
+
+def test_horizon_keeps_end(tmp_path):
+    controller = get_interface(tmp_path, "end").__controller__
+    params_list = get_params_list(controller)
+    full_list, full_prd_list = get_results(controller, params_list, None)
+    horizon_list, horizon_prd_list = get_results(controller, params_list, 1.0)
+    assert full_list == horizon_list
+    assert [len(prd["strain"]) for prd in full_prd_list] == [len(prd["strain"]) for prd in horizon_prd_list]
+
+def test_horizon_truncates_hardening(tmp_path):
+    controller = get_interface(tmp_path, "hardening").__controller__
+    params_list = get_params_list(controller)
+    full_list, full_prd_list = get_results(controller, params_list, None)
+    horizon_list, horizon_prd_list = get_results(controller, params_list, 1.0)
+    assert full_list == horizon_list
+    assert horizon_prd_list[0]["strain"][-1] < full_prd_list[0]["strain"][-1]
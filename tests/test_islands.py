@@ -0,0 +1,36 @@
+"""
+ Title:         Island tests
+ Description:   Checks that each island tracks the optimal solutions of its own population
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import copy, os
+from moga_neml.interface import Interface
+from moga_neml.optimise.islands import IslandRecorder
+from moga_neml.optimise.recorder import Recorder
+
+# Constants
+DATA_PATH   = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+POPULATION  = 4
+NUM_ISLANDS = 3
+
+def test_island_threshold(tmp_path):
+    itf = Interface("islands", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    recorder = Recorder(controller, 10, str(tmp_path))
+    recorder.define_hyperparameters(10, POPULATION, POPULATION, 0.8, 0.01, NUM_ISLANDS)
+
+    # The threshold of the island is defined once its own population is filled
+    island_recorder = IslandRecorder(copy.deepcopy(recorder), POPULATION)
+    objective_info = controller.get_objective_info_list()[0]
+    for i in range(POPULATION):
+        assert island_recorder.get_threshold() == None
+        island_recorder.update_iteration({}, {objective_info: float(i + 1)})
+    assert island_recorder.get_threshold() == float(POPULATION)
+    assert recorder.get_threshold() == None
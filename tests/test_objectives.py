@@ -0,0 +1,65 @@
+"""
+ Title:         Objective tests
+ Description:   Checks that the errors are mapped to objectives in a fixed order and reduced
+                in the same way as `reduce_list`
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, subprocess, sys
+import numpy as np
+import pytest
+from moga_neml.interface import Interface
+from moga_neml.helper.general import reduce_list
+
+# Constants
+DATA_PATH     = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PACKAGE_PATH  = os.path.join(os.path.dirname(__file__), "..")
+INFO_LIST     = ["area_creep_time_strain", "end_creep_time_strain", "area_tensile_strain_stress"]
+NUM_VALUES    = 20
+ORDER_SCRIPT  = f"""
+from moga_neml.interface import Interface
+itf = Interface("objectives", input_path={DATA_PATH!r}, output_path=".", verbose=False)
+itf.define_model("evp")
+itf.read_data("creep/inl_1/AirBase_800_80_G25.csv")
+itf.add_error("area", "time", "strain")
+itf.add_error("end", "time", "strain")
+itf.read_data("tensile/inl/AirBase_800_D7.csv")
+itf.add_error("area", "strain", "stress")
+itf.read_data("creep/inl_1/AirBase_800_60_G32.csv")
+itf.add_error("end", "time", "strain")
+itf.add_error("area", "time", "strain")
+itf.__controller__.compile_objectives()
+print(",".join(itf.__controller__.get_objective_plan()["info_list"]))
+"""
+
+def test_objective_order(tmp_path):
+    for hash_seed in ["0", "1", "2"]:
+        env = {**os.environ, "PYTHONHASHSEED": hash_seed, "PYTHONPATH": PACKAGE_PATH}
+        output = subprocess.run([sys.executable, "-c", ORDER_SCRIPT], capture_output=True, text=True,
+                                cwd=str(tmp_path), env=env, check=True).stdout
+        assert output.strip().split(",") == INFO_LIST
+
+@pytest.mark.parametrize("method", ["average", "sum", "square_sum", "square_average"])
+def test_reduce_errors(tmp_path, method:str):
+    itf = Interface("objectives", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("creep/inl_1/AirBase_800_80_G25.csv")
+    itf.add_error("area", "time", "strain")
+    itf.add_error("end", "time", "strain")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    itf.reduce_errors(method)
+    controller = itf.__controller__
+    controller.compile_objectives()
+
+    # The reduction of all the objectives together equals reducing each objective separately
+    rng = np.random.default_rng(0)
+    index_array = rng.integers(0, len(INFO_LIST), NUM_VALUES)
+    value_array = rng.random(NUM_VALUES)
+    objective_dict = controller.reduce_errors(index_array, value_array)
+    assert list(objective_dict.keys()) == INFO_LIST
+    for i, objective_info in enumerate(INFO_LIST):
+        expected = reduce_list(list(value_array[index_array == i]), method)
+        assert objective_dict[objective_info] == pytest.approx(expected, rel=1e-12)
@@ -0,0 +1,49 @@
+"""
+ Title:         Racing tests
+ Description:   Checks that the solutions discarded by the racing never beat the fully evaluated solutions
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+import numpy as np
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH  = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PARAMS     = (16.994, 64.14, 1.5, 4.5, 1700.0)
+NUM_PARAMS = 5
+FILE_LIST  = ["creep/inl_1/AirBase_800_80_G25.csv", "creep/inl_1/AirBase_800_70_G24.csv",
+              "creep/inl_1/AirBase_800_60_G32.csv"]
+
+def test_racing_discards(tmp_path):
+    itf = Interface("racing", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    for file_path in FILE_LIST:
+        itf.read_data(file_path)
+        itf.add_error("area", "time", "strain")
+    itf.set_racing(fraction=0.3, margin=1.2)
+    controller = itf.__controller__
+    controller.compile_objectives()
+    get_reduced = lambda objective_dict: controller.reduce_objectives(controller.get_objective_values(objective_dict))
+
+    # Evaluate the solutions fully, and then raced against the best of them
+    encoder = controller.get_encoder()
+    params_list = [PARAMS] + [tuple(encoder.decode(row)) for row in np.random.default_rng(0).random((NUM_PARAMS, len(PARAMS)))]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        full_list = [controller.calculate_objectives(*params) for params in params_list]
+        threshold = min([get_reduced(full_dict) for full_dict in full_list])
+        controller.set_threshold(threshold)
+        raced_list = [controller.calculate_objectives(*params) for params in params_list]
+
+    # The discarded solutions fail and never beat a fully evaluated solution
+    counter_dict = controller.pop_counter_dict()
+    assert counter_dict["racing promoted"] > 0 and counter_dict["racing discarded"] > 0
+    for full_dict, raced_dict in zip(full_list, raced_list):
+        if raced_dict.get("violation_racing", 0) > 0:
+            assert get_reduced(raced_dict) >= max([get_reduced(full_dict) for full_dict in full_list])
+            assert get_reduced(full_dict) > threshold
+        else:
+            assert raced_dict == full_dict
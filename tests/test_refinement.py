@@ -0,0 +1,33 @@
+"""
+ Title:         Refinement tests
+ Description:   Checks that the local optimisers improve on their starting solutions within their budgets
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings, pytest
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PARAMS    = (20.0, 80.0, 2.0, 4.5, 1500.0)
+MAX_EVALS = 12
+
+@pytest.mark.parametrize("method", ["nelder-mead", "least-squares"])
+def test_refine_improves(tmp_path, method:str):
+    itf = Interface("refinement", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    controller.define_refiner(num_starts=1, method=method, max_evals=MAX_EVALS)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        start_dict = controller.calculate_objectives(*PARAMS)
+        params, objective_dict, num_evals = controller.get_refiner().refine(PARAMS)
+        assert controller.calculate_objectives(*params) == objective_dict
+    get_reduced = lambda objective_dict: controller.reduce_objectives(controller.get_objective_values(objective_dict))
+    assert get_reduced(objective_dict) < get_reduced(start_dict)
+    assert num_evals <= MAX_EVALS
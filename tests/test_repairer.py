@@ -0,0 +1,70 @@
+"""
+ Title:         Repairer tests
+ Description:   Checks that the solutions violating the constraints on the parameters are repaired
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os
+import numpy as np
+from moga_neml.interface import Interface
+from moga_neml.optimise.repairer import Repairer
+
+# Constants
+DATA_PATH     = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+NUM_SOLUTIONS = 50
+
+def get_controller(tmp_path):
+    """
+    Gets a controller with a model constraining its parameters (i.e., c_0 <= t_0 and c_1 <= t_1)
+
+    Parameters:
+    * `tmp_path`: The path to write the results to
+    """
+    itf = Interface("repairer", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evpwdb")
+    itf.read_data("creep/inl_1/AirBase_800_80_G25.csv")
+    itf.add_error("area", "time", "strain")
+    return itf.__controller__
+
+def get_c_t_arrays(controller, unit_matrix:np.ndarray) -> tuple:
+    """
+    Gets the decoded values of the c_0 and t_0 parameters
+
+    Parameters:
+    * `controller`:  The controller
+    * `unit_matrix`: The encoded solutions
+    """
+    param_names = controller.get_unfix_param_names()
+    param_matrix = controller.get_encoder().decode(unit_matrix)
+    return param_matrix[:,param_names.index("c_0")], param_matrix[:,param_names.index("t_0")]
+
+def test_repair_offspring(tmp_path):
+    controller = get_controller(tmp_path)
+    repairer = Repairer(controller)
+    unit_matrix = np.random.default_rng(0).random((NUM_SOLUTIONS, len(controller.get_unfix_param_names())))
+    c_0_array, t_0_array = get_c_t_arrays(controller, unit_matrix)
+    assert np.any(c_0_array > t_0_array)
+    feasible_array = repairer.get_violations(unit_matrix) == 0
+    assert np.any(feasible_array)
+
+    # The infeasible offspring are repaired and the feasible offspring are unchanged
+    repaired_matrix = repairer._do(None, unit_matrix, random_state=np.random.default_rng(1))
+    c_0_array, t_0_array = get_c_t_arrays(controller, repaired_matrix)
+    assert np.all(c_0_array <= t_0_array)
+    assert np.all(repairer.get_violations(repaired_matrix) == 0)
+    assert np.array_equal(repaired_matrix[feasible_array], unit_matrix[feasible_array])
+
+def test_repair_without_feasible(tmp_path):
+    controller = get_controller(tmp_path)
+    repairer = Repairer(controller)
+    param_names = controller.get_unfix_param_names()
+    unit_matrix = np.full((NUM_SOLUTIONS, len(param_names)), 0.5)
+    unit_matrix[:,param_names.index("c_0")] = 1.0
+    unit_matrix[:,param_names.index("t_0")] = 0.0
+    assert np.all(repairer.get_violations(unit_matrix) > 0)
+
+    # Resamples the offspring when no feasible solutions are available to move towards
+    repaired_matrix = repairer._do(None, unit_matrix, random_state=np.random.default_rng(1))
+    assert np.all(repairer.get_violations(repaired_matrix) == 0)
@@ -0,0 +1,51 @@
+"""
+ Title:         Sampler tests
+ Description:   Checks that the initial population is sampled in linear space unless requested
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os
+import numpy as np
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH   = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+NUM_SAMPLES = 1000
+
+def get_controller(tmp_path):
+    """
+    Gets a controller with a tensile curve
+
+    Parameters:
+    * `tmp_path`: The path to write the results to
+    """
+    itf = Interface("samplers", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    return itf.__controller__
+
+def test_normal_sampler_default(tmp_path):
+    controller = get_controller(tmp_path)
+    param_dict = controller.get_unfix_param_dict()
+    l_bound_array = np.array([param_dict[name]["l_bound"] for name in param_dict.keys()])
+    u_bound_array = np.array([param_dict[name]["u_bound"] for name in param_dict.keys()])
+    init_list = [None] * len(param_dict)
+
+    # The default samples all the parameters in linear space, even those with log10 transforms
+    assert param_dict["evp_eta"]["transform"] == "log10"
+    np.random.seed(0)
+    samples = controller.get_sampler().sample(NUM_SAMPLES, init_list)
+    np.random.seed(0)
+    mean_array, stdev_array = (l_bound_array + u_bound_array) / 2, (u_bound_array - l_bound_array) * 0.25
+    linear_samples = np.random.normal(loc=mean_array, scale=stdev_array, size=(NUM_SAMPLES, len(init_list)))
+    assert np.array_equal(samples, np.clip(linear_samples, l_bound_array, u_bound_array))
+
+    # Parameters are only sampled in log-space when requested
+    eta_index = list(param_dict.keys()).index("evp_eta")
+    controller.define_sampler("normal", log_param_names=["evp_eta"])
+    samples = controller.get_sampler().sample(NUM_SAMPLES, init_list)
+    assert np.median(samples[:, eta_index]) < mean_array[eta_index] / 10
+    assert np.all(samples >= l_bound_array) and np.all(samples <= u_bound_array)
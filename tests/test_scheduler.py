@@ -0,0 +1,48 @@
+"""
+ Title:         Scheduler tests
+ Description:   Checks that the curves that are cheap and likely to fail are simulated first
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+from moga_neml.interface import Interface
+from moga_neml.optimise.scheduler import Scheduler
+
+# Constants
+DATA_PATH     = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+FAILED_PARAMS = (0.0, 0.0, 0.0, 1.0, 0.0)
+
+def test_scheduler_order():
+    scheduler = Scheduler(memory=10)
+    for _ in range(5):
+        scheduler.record(0, "expensive", 10.0, False)
+        scheduler.record(1, "cheap", 1.0, True)
+        scheduler.record(2, "cheap but passing", 1.0, False)
+
+    # Curves that have not been simulated come first, then by runtime over failure rate
+    assert scheduler.order([0, 1, 2, 3]) == [3, 1, 2, 0]
+    assert scheduler.get_failure_rate(1) > scheduler.get_failure_rate(2)
+
+def test_scheduler_skips_after_failure(tmp_path):
+    itf = Interface("scheduler", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("creep/inl_1/AirBase_800_80_G25.csv")
+    itf.add_error("area", "time", "strain")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    itf.set_scheduling()
+    controller = itf.__controller__
+    controller.compile_objectives()
+    scheduler = controller.get_scheduler()
+
+    # Once the tensile curve is known to be cheap and failing, it is simulated first
+    scheduler.record(0, "creep", 10.0, False)
+    scheduler.record(1, "tensile", 0.1, True)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        objective_dict = controller.calculate_objectives(*FAILED_PARAMS)
+    assert objective_dict["violation_simulation"] > 0
+    assert scheduler.stat_dict[0]["weight"] == 1
+    assert scheduler.stat_dict[1]["weight"] > 1
@@ -0,0 +1,49 @@
+"""
+ Title:         Shared simulation tests
+ Description:   Checks that the curves with identical simulation inputs are simulated once
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+import pytest
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH      = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PARAMS         = (16.994, 64.14, 1.5, 4.5, 1700.0)
+REPEAT_LIST    = ["creep/inl_1/AirBase_800_60_G32.csv", "creep/inl_1/AirBase_800_60_G47.csv"]
+OBJECTIVE_INFO = "area_creep_time_strain"
+
+def get_controller(tmp_path, file_list:list):
+    """
+    Gets a controller with creep curves
+
+    Parameters:
+    * `tmp_path`:  The path to write the results to
+    * `file_list`: The paths to the creep data
+    """
+    itf = Interface("shared", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    for file_path in file_list:
+        itf.read_data(file_path)
+        itf.add_error("area", "time", "strain")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    return controller
+
+def test_repeat_specimens_shared(tmp_path):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        error_list = [get_controller(tmp_path, [file_path]).calculate_objectives(*PARAMS)[OBJECTIVE_INFO]
+                      for file_path in REPEAT_LIST]
+
+        # The repeat specimens share one simulation, but have their own errors
+        controller = get_controller(tmp_path, REPEAT_LIST)
+        objective_dict = controller.calculate_objectives(*PARAMS)
+    assert controller.pop_counter_dict() == {"shared simulations": 1}
+    prd_data_list = [curve.get_prd_data() for curve in controller.get_curve_list()]
+    assert prd_data_list[0] == prd_data_list[1]
+    assert error_list[0] != error_list[1] and max(error_list) < 10000
+    assert objective_dict[OBJECTIVE_INFO] == pytest.approx(sum(error_list) / 2, rel=1e-12)
@@ -0,0 +1,52 @@
+"""
+ Title:         Store tests
+ Description:   Checks that the simulations stored on disk are reused by later runs
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+from moga_neml.interface import Interface
+
+# Constants
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PARAMS    = (16.994, 64.14, 1.5, 4.5, 1700.0)
+
+def get_controller(tmp_path, error_name:str):
+    """
+    Gets a controller with a tensile curve that stores its simulations
+
+    Parameters:
+    * `tmp_path`:   The path to write the results and the store to
+    * `error_name`: The error to define on the curve
+    """
+    itf = Interface("store", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error(error_name, "strain", "stress")
+    itf.set_store(str(tmp_path / "simulations.db"))
+    controller = itf.__controller__
+    controller.compile_objectives()
+    return controller
+
+def test_store_reused_across_runs(tmp_path):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        # The first run simulates the curve and stores it
+        controller = get_controller(tmp_path, "area")
+        area_dict = controller.calculate_objectives(*PARAMS)
+        prd_data = controller.get_last_curve().get_prd_data()
+        assert controller.pop_counter_dict() == {"store misses": 1}
+
+        # A later run with a different error reuses the stored simulation
+        controller = get_controller(tmp_path, "end")
+        controller.calculate_objectives(*PARAMS)
+        assert controller.pop_counter_dict() == {"store hits": 1}
+        assert controller.get_last_curve().get_prd_data() == prd_data
+
+        # And a later run with the same error reproduces the objectives
+        controller = get_controller(tmp_path, "area")
+        assert controller.calculate_objectives(*PARAMS) == area_dict
+        assert controller.pop_counter_dict() == {"store hits": 1}
@@ -0,0 +1,60 @@
+"""
+ Title:         Surrogate tests
+ Description:   Checks that the surrogate measures the parameters in the space searched by the optimiser
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os
+import numpy as np
+from moga_neml.interface import Interface
+from moga_neml.helper.transform import Encoder
+from moga_neml.optimise.problem import Problem
+from moga_neml.optimise.recorder import Recorder
+from moga_neml.optimise.surrogate import Surrogate
+
+# Constants
+DATA_PATH     = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+ARCHIVE_SIZE  = 10
+NUM_OFFSPRING = 6
+BUDGET        = 2
+
+def test_surrogate_uses_encoded_space():
+    encoder = Encoder([1e-2, 0.0], [1e2, 10.0], ["log10", "linear"])
+    surrogate = Surrogate(encoder, budget=1)
+    params_list = [[1.0, 5.0], [1e-1, 2.0], [1e1, 8.0]]
+    assert np.allclose(surrogate.normalise(params_list), encoder.encode(params_list))
+    assert np.allclose(surrogate.normalise([[1.0, 5.0]]), [[0.5, 0.5]])
+
+    # The decades below one are as far apart as the decades above one
+    surrogate.add((1e-1, 5.0), [1.0])
+    surrogate.add((1e1, 5.0), [1.0])
+    assert np.allclose(surrogate.get_uncertainty([[1e-2, 5.0], [1e2, 5.0]]), [0.25, 0.25])
+
+def test_screened_offspring_not_recorded(tmp_path):
+    itf = Interface("surrogate", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    controller.define_surrogate(BUDGET, explore=0.0, min_size=ARCHIVE_SIZE)
+    recorder = Recorder(controller, 10, str(tmp_path))
+    recorder.define_hyperparameters(10, NUM_OFFSPRING, NUM_OFFSPRING, 0.8, 0.01)
+    problem = Problem(controller, recorder)
+
+    # Fill the archive of the surrogate so that the offspring are pre-screened
+    random_matrix = np.random.default_rng(0).random((ARCHIVE_SIZE + NUM_OFFSPRING, problem.n_var))
+    for row in random_matrix[:ARCHIVE_SIZE]:
+        controller.get_surrogate().add(problem.decode(row), [float(np.sum(row))])
+    out = {}
+    problem._evaluate(random_matrix[ARCHIVE_SIZE:], out)
+
+    # Only the selected offspring are evaluated, but all of them count towards the generation
+    screened_index = controller.get_violation_info_list().index("violation_screened")
+    is_screened = out["G"][:,screened_index] > 0
+    assert np.sum(is_screened) == NUM_OFFSPRING - BUDGET
+    assert np.all(out["G"][is_screened,0] == 0)
+    assert recorder.num_evals_completed == BUDGET
+    assert recorder.num_gens_completed == 1
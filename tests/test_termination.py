@@ -0,0 +1,46 @@
+"""
+ Title:         Termination tests
+ Description:   Checks that the optimisation stops once it stagnates or runs out of evaluations
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, warnings
+from moga_neml.interface import Interface
+from moga_neml.optimise.terminator import Terminator
+
+# Constants
+DATA_PATH  = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+POPULATION = 6
+OFFSPRING  = 4
+
+def test_terminator_stagnation():
+    terminator = Terminator(tolerance=0.01, patience=3)
+    for num_gens, value in enumerate([1.0, 0.5, 0.25, 0.2, 0.19, 0.18]):
+        assert not terminator.check(num_gens + 1, 10 * (num_gens + 1), value, [[value]])
+    assert terminator.get_stop_reason() == None
+
+    # Less than a 1% improvement over three generations
+    for num_gens, value in zip([7, 8], [0.1795, 0.1790]):
+        assert not terminator.check(num_gens, 10 * num_gens, value, [[value]])
+    assert terminator.check(9, 90, 0.1789, [[0.1789]])
+    assert "less than 0.01 over 3 gens" in terminator.get_stop_reason()
+
+def test_terminator_max_evals():
+    terminator = Terminator(max_evals=20)
+    assert not terminator.check(1, 19, 1.0, [[1.0]])
+    assert terminator.check(2, 20, 1.0, [[1.0]])
+    assert terminator.get_stop_reason() == "evaluation budget of 20 reached"
+
+def test_optimise_max_evals(tmp_path):
+    itf = Interface("termination", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("tensile/inl/AirBase_800_D7.csv")
+    itf.add_error("area", "strain", "stress")
+    itf.set_termination(max_evals=POPULATION + OFFSPRING)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        itf.optimise(100, POPULATION, OFFSPRING)
+    assert itf.__recorder__.num_evals_completed == POPULATION + OFFSPRING
+    assert itf.__controller__.get_terminator().get_stop_reason() != None
@@ -0,0 +1,44 @@
+"""
+ Title:         Timeout tests
+ Description:   Checks that simulations that run out of time are killed and treated as failed
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import os, time, warnings
+from moga_neml.interface import Interface
+from moga_neml.helper.parallel import run_isolated
+
+# Constants
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "data")
+PARAMS    = (16.994, 64.14, 1.5, 4.5, 1700.0)
+
+def test_run_isolated():
+    assert run_isolated(lambda: 1 + 1, 10) == (True, 2)
+    assert run_isolated(lambda: 1 / 0, 10) == (True, None)
+    start_time = time.time()
+    assert run_isolated(lambda: time.sleep(10), 0.5) == (False, None)
+    assert time.time() - start_time < 5
+
+def test_timeout_fails_solution(tmp_path):
+    itf = Interface("timeout", input_path=DATA_PATH, output_path=str(tmp_path), verbose=False)
+    itf.define_model("evp")
+    itf.read_data("creep/inl_1/AirBase_800_80_G25.csv")
+    itf.add_error("area", "time", "strain")
+    controller = itf.__controller__
+    controller.compile_objectives()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        # The simulation finishes within a generous budget
+        itf.set_timeout(60)
+        objective_dict = controller.calculate_objectives(*PARAMS)
+        assert max(controller.get_violation_values(objective_dict)) == 0
+        assert controller.pop_counter_dict() == {}
+
+        # But is killed and fails the solution when it runs out of time
+        itf.set_timeout(1e-3)
+        objective_dict = controller.calculate_objectives(*PARAMS)
+    assert objective_dict == controller.get_failed_dict({"violation_simulation": 1})
+    assert controller.pop_counter_dict() == {"timeout creep/inl_1/AirBase_800_80_G25.csv": 1}
@@ -0,0 +1,45 @@
+"""
+ Title:         Transform tests
+ Description:   Checks that the parameters are encoded into the unit hypercube and decoded back
+ Author:        Janzen Choi
+
+"""
+
+# Libraries
+import numpy as np
+import pytest
+from moga_neml.helper.transform import Encoder, LOG_FLOOR
+
+# Constants
+L_BOUND_LIST   = [0.0, 0.0, 1.0, 0.0]
+U_BOUND_LIST   = [1000.0, 10000.0, 100.0, 4.0]
+TRANSFORM_LIST = ["linear", "log10", "log10", (np.sqrt, np.square)]
+
+def test_encoder_round_trip():
+    encoder = Encoder(L_BOUND_LIST, U_BOUND_LIST, TRANSFORM_LIST)
+    params_matrix = np.array([[500.0, 1.0, 10.0, 1.0], [0.0, 10000.0, 1.0, 4.0], [250.0, 0.1, 50.0, 2.25]])
+    unit_matrix = encoder.encode(params_matrix)
+    assert unit_matrix.shape == params_matrix.shape
+    assert np.all(unit_matrix >= 0) and np.all(unit_matrix <= 1)
+    assert np.allclose(encoder.decode(unit_matrix), params_matrix)
+    assert np.allclose(encoder.decode(encoder.encode(params_matrix[0])), params_matrix[0])
+
+    # The log10 transforms space the decades evenly
+    assert np.allclose(unit_matrix[0], [0.5, 1 / 3, 0.5, 0.5])
+
+def test_encoder_log_floor():
+    encoder = Encoder(L_BOUND_LIST, U_BOUND_LIST, TRANSFORM_LIST)
+    floor = U_BOUND_LIST[1] * LOG_FLOOR
+
+    # Values below the floor of a zero lower bound are encoded at the floor
+    unit_params = encoder.encode([0.0, 0.0, 1.0, 0.0])
+    assert unit_params[1] == 0
+    assert np.isclose(encoder.decode(unit_params)[1], floor)
+    assert encoder.encode([0.0, floor / 10, 1.0, 0.0])[1] == 0
+    assert np.isclose(encoder.decode([0.0, 0.5, 0.0, 0.0])[1], np.sqrt(floor * U_BOUND_LIST[1]))
+
+def test_encoder_invalid_transform():
+    with pytest.raises(ValueError):
+        Encoder([0.0], [1.0], ["log2"])
+    with pytest.raises(ValueError):
+        Encoder([-2.0], [-1.0], ["log10"])